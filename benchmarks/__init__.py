@@ -0,0 +1 @@
+"""Benchmarks for mapping modelldcat-ap-no objects to rdf."""
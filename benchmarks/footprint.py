@@ -0,0 +1,147 @@
+"""Measures the memory held by the objects of each class.
+
+For every class, count objects are created with an identifier and a
+title, and mapped once incrementally, so that they also hold the triples
+cached between mappings. The memory they hold is measured with tracemalloc, and reported
+per object together with whether the objects have a __dict__:
+
+    % python -m benchmarks.footprint --count 1000000 --classes CodeElement Attribute
+"""
+import argparse
+import gc
+import tracemalloc
+from typing import Any, Dict, List, Optional, Type
+
+from modelldcatnotordf.mapping import map_incrementally, mapping
+from modelldcatnotordf.modelldcatno import (
+    Abstraction,
+    Association,
+    Attribute,
+    Choice,
+    CodeElement,
+    CodeList,
+    Collection,
+    Composition,
+    ConstraintRule,
+    DataType,
+    Module,
+    Note,
+    ObjectType,
+    Or,
+    Realization,
+    Role,
+    RootObjectType,
+    SimpleType,
+    Specialization,
+    Xor,
+)
+from modelldcatnotordf.uri import trusted_input
+
+BASE = "http://example.com"
+
+CLASSES: Dict[str, Type[Any]] = {
+    cls.__name__: cls
+    for cls in (
+        Abstraction,
+        Association,
+        Attribute,
+        Choice,
+        CodeElement,
+        CodeList,
+        Collection,
+        Composition,
+        ConstraintRule,
+        DataType,
+        Module,
+        Note,
+        ObjectType,
+        Or,
+        Realization,
+        Role,
+        RootObjectType,
+        SimpleType,
+        Specialization,
+        Xor,
+    )
+}
+
+COUNT = 10000
+
+
+def measure(name: str, count: int) -> Dict[str, Any]:
+    """Measures the memory held by count objects of a class.
+
+    Args:
+        name: the name of the class
+        count: the number of objects
+
+    Returns:
+        the result
+    """
+    cls = CLASSES[name]
+    title = {"nb": "Tittel"}
+    identifiers = [f"{BASE}/{name.lower()}s/{i}" for i in range(count)]
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        with trusted_input():
+            modelobjects = [cls(identifier) for identifier in identifiers]
+        attribute = "preflabel" if cls is CodeElement else "title"
+        for modelobject in modelobjects:
+            setattr(modelobject, attribute, title)
+        created, _peak = tracemalloc.get_traced_memory()
+
+        for modelobject in modelobjects:
+            _map_incrementally(modelobject)
+        held, _peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "class": name,
+        "count": count,
+        "has_dict": hasattr(modelobjects[0], "__dict__"),
+        "bytes_per_object": created / count,
+        "mapped_bytes_per_object": held / count,
+    }
+
+
+@mapping
+def _map_incrementally(modelobject: Any) -> None:  # noqa: ANN401
+    """Maps the object, keeping the triples it is mapped to."""
+    map_incrementally()
+    modelobject._cached_to_graph(_Sink(), {})
+
+
+class _Sink:
+    """A graph discarding the triples added to it."""
+
+    def add(self, triple: tuple) -> None:
+        """Discards the triple."""
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Runs the benchmark.
+
+    Args:
+        argv: the command line arguments
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--classes", nargs="+", choices=CLASSES, default=list(CLASSES))
+    parser.add_argument("--count", type=int, default=COUNT)
+    args = parser.parse_args(argv)
+
+    for name in args.classes:
+        result = measure(name, args.count)
+        print(
+            "{class:<16}{count:>9}  {bytes_per_object:>7.0f} B/object"
+            "  {mapped_bytes_per_object:>7.0f} B/object mapped"
+            "  {dict}".format(
+                **result, dict="__dict__" if result["has_dict"] else "no __dict__"
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""Generators of synthetic models for the benchmarks.
+
+Every generator takes a size and returns the root object of a model of
+that size. The models are built the same way on every call, and every
+object is given an identifier, so no skolemization takes place.
+"""
+from typing import Callable, Dict, List, Union
+
+from modelldcatnotordf.bulk import codelist_from_columns
+from modelldcatnotordf.modelldcatno import (
+    Attribute,
+    CodeElement,
+    CodeList,
+    Composition,
+    InformationModel,
+    Module,
+    ObjectType,
+    SimpleType,
+)
+
+BASE = "http://example.com"
+
+Root = Union[InformationModel, CodeElement, CodeList]
+
+
+def wide(size: int) -> InformationModel:
+    """Returns a model with size object types, each with one attribute.
+
+    Args:
+        size: the number of object types
+
+    Returns:
+        the information model
+    """
+    informationmodel = InformationModel(f"{BASE}/informationmodels/wide")
+    simpletype = SimpleType(f"{BASE}/simpletypes/1")
+    simpletype.max_length = 10
+    informationmodel.modelelements.append(simpletype)
+
+    for i in range(size):
+        objecttype = ObjectType(f"{BASE}/objecttypes/{i}")
+        objecttype.title = {"nb": f"Objekttype {i}", "en": f"Object type {i}"}
+        attribute = Attribute(f"{BASE}/attributes/{i}")
+        attribute.title = {"nb": f"Egenskap {i}"}
+        attribute.min_occurs = 0
+        attribute.max_occurs = "1"
+        attribute.has_simple_type = simpletype
+        objecttype.has_property.append(attribute)
+        informationmodel.modelelements.append(objecttype)
+
+    return informationmodel
+
+
+def deep(size: int) -> InformationModel:
+    """Returns a model with a chain of size nested object types.
+
+    Each object type contains the next one through a composition, which
+    in turn has the next object type as type.
+
+    Args:
+        size: the number of nested object types
+
+    Returns:
+        the information model
+    """
+    informationmodel = InformationModel(f"{BASE}/informationmodels/deep")
+    objecttype = ObjectType(f"{BASE}/objecttypes/0")
+    informationmodel.modelelements.append(objecttype)
+
+    for i in range(1, size):
+        contained = ObjectType(f"{BASE}/objecttypes/{i}")
+        contained.title = {"nb": f"Objekttype {i}"}
+        composition = Composition(f"{BASE}/compositions/{i}")
+        composition.contains = contained
+        composition.has_type.append(contained)
+        objecttype.has_property.append(composition)
+        objecttype = contained
+
+    return informationmodel
+
+
+def shared(size: int) -> InformationModel:
+    """Returns a model where size object types belong to the same module.
+
+    Args:
+        size: the number of object types
+
+    Returns:
+        the information model
+    """
+    informationmodel = InformationModel(f"{BASE}/informationmodels/shared")
+    module = Module(f"{BASE}/modules/1")
+    module.title = {"nb": "Modul 1"}
+    informationmodel.modelelements.append(module)
+
+    for i in range(size):
+        objecttype = ObjectType(f"{BASE}/objecttypes/{i}")
+        objecttype.belongs_to_module = [module]
+        attribute = Attribute(f"{BASE}/attributes/{i}")
+        attribute.belongs_to_module = [module]
+        objecttype.has_property.append(attribute)
+        informationmodel.modelelements.append(objecttype)
+
+    return informationmodel
+
+
+def codelist(size: int) -> CodeElement:
+    """Returns the first of size code elements chained by next and previous.
+
+    Args:
+        size: the number of code elements
+
+    Returns:
+        the first code element
+    """
+    codelist = CodeList(f"{BASE}/codelists/1")
+    codelist.title = {"nb": "Kodeliste 1"}
+
+    codeelements: List[CodeElement] = []
+    for i in range(size):
+        codeelement = CodeElement(f"{BASE}/codeelements/{i}")
+        codeelement.notation = str(i)
+        codeelement.preflabel = {"nb": f"Kode {i}"}
+        codeelement.in_scheme = [codelist]
+        if codeelements:
+            codeelements[-1].next_element = codeelement
+            codeelement.previous_element = codeelements[-1]
+        codeelements.append(codeelement)
+
+    return codeelements[0]
+
+
+def ordered(size: int) -> CodeList:
+    """Returns a code list of size code elements given in order.
+
+    The code elements are those of the codelist shape, linked by the code
+    list instead of by next and previous.
+
+    Args:
+        size: the number of code elements
+
+    Returns:
+        the code list
+    """
+    codelist = CodeList(f"{BASE}/codelists/1")
+    codelist.title = {"nb": "Kodeliste 1"}
+
+    codeelements = []
+    for i in range(size):
+        codeelement = CodeElement(f"{BASE}/codeelements/{i}")
+        codeelement.notation = str(i)
+        codeelement.preflabel = {"nb": f"Kode {i}"}
+        codeelement.in_scheme = [codelist]
+        codeelements.append(codeelement)
+    codelist.ordered_elements = codeelements
+
+    return codelist
+
+
+def columns(size: int) -> CodeList:
+    """Returns a code list of size code elements built from columns.
+
+    The code elements are those of the codelist shape, kept as columns.
+
+    Args:
+        size: the number of code elements
+
+    Returns:
+        the code list
+    """
+    return codelist_from_columns(
+        f"{BASE}/codelists/1",
+        {
+            "identifier": [f"{BASE}/codeelements/{i}" for i in range(size)],
+            "notation": [str(i) for i in range(size)],
+            "preflabel@nb": [f"Kode {i}" for i in range(size)],
+        },
+    )
+
+
+SHAPES: Dict[str, Callable[[int], Root]] = {
+    "wide": wide,
+    "deep": deep,
+    "shared": shared,
+    "codelist": codelist,
+    "ordered": ordered,
+    "columns": columns,
+}
@@ -0,0 +1,177 @@
+"""Runs the benchmarks and records the results.
+
+Every operation is run on a model freshly generated for each repetition,
+so that no state from an earlier mapping is reused. The build operations
+measure the generation of the model itself, with the URIs set validated
+or, for build:trusted, set as trusted input. The time reported is
+the best of the repetitions, the peak memory is measured with tracemalloc
+in a separate run.
+
+The results are written as json to benchmarks/results/<version>.json, and
+can be compared with results recorded on the same machine, e.g. of an
+earlier release:
+
+    % python -m benchmarks.run --compare <file with the earlier results>
+"""
+import argparse
+from datetime import datetime, timezone
+import json
+import os
+import platform
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+import rdflib
+
+from benchmarks.models import Root, SHAPES
+import modelldcatnotordf
+from modelldcatnotordf.uri import trusted_input
+
+OPERATIONS: Dict[str, Callable[[Root], Any]] = {
+    "_to_graph": lambda root: root._to_graph(),
+    "to_rdf:turtle": lambda root: root.to_rdf(format="turtle"),
+    "serialize:turtle": lambda root: root._to_graph().serialize(format="turtle"),
+    "to_rdf:xml": lambda root: root.to_rdf(format="xml"),
+    "to_rdf:json-ld": lambda root: root.to_rdf(format="json-ld"),
+}
+
+
+def _build_trusted(generate: Callable[[int], Root], size: int) -> Root:
+    with trusted_input():
+        return generate(size)
+
+
+BUILDS: Dict[str, Callable[[Callable[[int], Root], int], Root]] = {
+    "build": lambda generate, size: generate(size),
+    "build:trusted": _build_trusted,
+}
+
+SIZES = [10, 100, 1000]
+REPEAT = 3
+RESULTS = os.path.join(os.path.dirname(__file__), "results")
+
+
+def measure(shape: str, size: int, operation: str, repeat: int) -> Dict[str, Any]:
+    """Measures time and peak memory of an operation on a generated model.
+
+    Args:
+        shape: the name of the model generator
+        size: the size of the model
+        operation: the name of the operation
+        repeat: the number of timed repetitions
+
+    Returns:
+        the result
+    """
+    generate = SHAPES[shape]
+    if operation in BUILDS:
+        build = BUILDS[operation]
+        run: Callable[[Root], Any] = lambda _root: build(generate, size)
+    else:
+        run = OPERATIONS[operation]
+    result: Dict[str, Any] = {"shape": shape, "size": size, "operation": operation}
+
+    seconds = []
+    try:
+        for _ in range(repeat):
+            root = generate(size)
+            start = time.perf_counter()
+            run(root)
+            seconds.append(time.perf_counter() - start)
+
+        root = generate(size)
+        tracemalloc.start()
+        run(root)
+        _current, peak = tracemalloc.get_traced_memory()
+    except RecursionError as e:
+        # Models too deep to be mapped are recorded as such:
+        result["error"] = type(e).__name__
+        return result
+    finally:
+        tracemalloc.stop()
+
+    result["seconds"] = min(seconds)
+    result["peak_bytes"] = peak
+    return result
+
+
+def compare(results: List[Dict[str, Any]], baseline: List[Dict[str, Any]]) -> None:
+    """Prints the ratio of each result to the same result in the baseline.
+
+    Args:
+        results: the results
+        baseline: the results to compare with
+    """
+    earlier = {(r["shape"], r["size"], r["operation"]): r for r in baseline}
+
+    for result in results:
+        key = (result["shape"], result["size"], result["operation"])
+        if key in earlier and "error" not in result and "error" not in earlier[key]:
+            print(
+                "{:<10}{:>7}  {:<16}time {:>6.2f}x  memory {:>6.2f}x".format(
+                    *key,
+                    result["seconds"] / earlier[key]["seconds"],
+                    result["peak_bytes"] / earlier[key]["peak_bytes"],
+                )
+            )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Runs the benchmarks.
+
+    Args:
+        argv: the command line arguments
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--shapes", nargs="+", choices=SHAPES, default=list(SHAPES))
+    parser.add_argument("--sizes", nargs="+", type=int, default=SIZES)
+    operations = list(BUILDS) + list(OPERATIONS)
+    parser.add_argument(
+        "--operations", nargs="+", choices=operations, default=operations
+    )
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--output", help="the file to write the results to")
+    parser.add_argument("--compare", help="a file with results to compare with")
+    args = parser.parse_args(argv)
+
+    results = []
+    for shape in args.shapes:
+        for size in args.sizes:
+            for operation in args.operations:
+                result = measure(shape, size, operation, args.repeat)
+                if "error" in result:
+                    print(
+                        "{shape:<10}{size:>7}  {operation:<16}{error}".format(**result)
+                    )
+                else:
+                    print(
+                        "{shape:<10}{size:>7}  {operation:<16}"
+                        "{seconds:>10.4f} s {peak_bytes:>12} B".format(**result)
+                    )
+                results.append(result)
+
+    output = args.output or os.path.join(
+        RESULTS, f"{modelldcatnotordf.__version__}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(
+            {
+                "version": modelldcatnotordf.__version__,
+                "python": platform.python_version(),
+                "rdflib": rdflib.__version__,
+                "date": datetime.now(timezone.utc).isoformat(),
+                "results": results,
+            },
+            f,
+            indent=2,
+        )
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(results, json.load(f)["results"])
+
+
+if __name__ == "__main__":
+    main()
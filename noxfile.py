@@ -6,7 +6,7 @@ from nox.sessions import Session
 import nox_poetry  # noqa: F401
 
 package = "modelldcatnotordf"
-locations = "src", "tests", "noxfile.py", "docs/conf.py"
+locations = "src", "tests", "benchmarks", "noxfile.py", "docs/conf.py"
 nox.options.stop_on_first_error = True
 nox.options.sessions = "lint", "mypy", "pytype", "tests"
 
@@ -20,6 +20,13 @@ def tests(session: Session) -> None:
     session.run("pytest", "-rA", *args)
 
 
+@nox_poetry.session(python="3.10")
+def benchmark(session: Session) -> None:
+    """Run the benchmarks and record the results."""
+    session.install(".")
+    session.run("python", "-m", "benchmarks.run", *session.posargs)
+
+
 @nox_poetry.session(python="3.10")
 def black(session: Session) -> None:
     """Run black code formatter."""
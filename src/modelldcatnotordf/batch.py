@@ -0,0 +1,171 @@
+"""Module for mapping many information models to rdf at once.
+
+This module contains functions for exporting a batch of InformationModel
+objects, e.g. a whole model catalog, either as one combined document or
+as a stream of per-model documents.
+
+A resource referred to from more than one model, e.g. a shared concept or
+module, is mapped once across the batch: The triples about a resource
+identified by an IRI are emitted with the first model that refers to it,
+and the later models only link to it, without mapping it again. Triples
+mapped again all the same, e.g. of a shared agent, are emitted once as long
+as they are among the last EMITTED_TRIPLES triples emitted.
+
+The models are mapped one at a time, so that only the graph of one model
+is held in memory, together with the IRIs of the resources emitted so far
+and the last triples emitted.
+With release, the cached triples are also removed from each model and
+the objects it refers to as soon as the model is mapped.
+
+Example:
+    >>> from io import BytesIO
+    >>> from modelldcatnotordf.batch import iter_rdf, to_ntriples_stream
+    >>> from modelldcatnotordf.modelldcatno import InformationModel
+    >>>
+    >>> models = [
+    ...     InformationModel(f"http://example.com/informationmodels/{i}")
+    ...     for i in range(3)
+    ... ]
+    >>> for identifier, rdf in iter_rdf(models):
+    ...     print(identifier)
+    http://example.com/informationmodels/0
+    http://example.com/informationmodels/1
+    http://example.com/informationmodels/2
+    >>> stream = BytesIO()
+    >>> to_ntriples_stream(models, stream)
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+from functools import partial
+from typing import IO, Iterable, Iterator, Optional, Set, Tuple
+
+from rdflib import Graph, URIRef
+from rdflib.term import Node
+
+from modelldcatnotordf.mapping import mapping, shallow_references
+from modelldcatnotordf.modelldcatno import InformationModel, serialize
+from modelldcatnotordf.namespaces import bind_prefixes
+from modelldcatnotordf.ntriples import NTriplesWriter, TripleSink
+
+# The number of triples emitted last, remembered to emit each triple once:
+EMITTED_TRIPLES = 100_000
+
+
+def to_rdf(
+    informationmodels: Iterable[InformationModel],
+    format: str = "turtle",
+    encoding: Optional[str] = "utf-8",
+    release: bool = False,
+) -> bytes:
+    """Maps the information models to one combined rdf document.
+
+    Available formats:
+     - turtle (default)
+     - xml
+     - json-ld
+
+    Args:
+        informationmodels: the information models to map
+        format (str): a valid format.
+        encoding (str): the encoding to serialize into
+        release (bool): whether to remove the state of the mapping from the models
+
+    Returns:
+        a rdf serialization as a string according to format encoded as bytes.
+    """
+
+    def to_graph(g: Optional[TripleSink] = None) -> Graph:
+        g = bind_prefixes(Graph()) if g is None else g
+        for _informationmodel, graph in _graphs(informationmodels, release):
+            for triple in graph:
+                g.add(triple)
+        return g  # type: ignore
+
+    return serialize(to_graph, format, encoding)
+
+
+def iter_rdf(
+    informationmodels: Iterable[InformationModel],
+    format: str = "turtle",
+    encoding: Optional[str] = "utf-8",
+    release: bool = False,
+) -> Iterator[Tuple[str, bytes]]:
+    """Maps the information models to one rdf document per model.
+
+    A document contains the resources emitted with its model, so the
+    documents are meant to be loaded together, e.g. into one triple store.
+
+    Args:
+        informationmodels: the information models to map
+        format (str): a valid format.
+        encoding (str): the encoding to serialize into
+        release (bool): whether to remove the state of the mapping from the models
+
+    Yields:
+        the identifier of each model and its rdf serialization as bytes.
+    """
+    for informationmodel, graph in _graphs(informationmodels, release):
+        yield informationmodel.identifier, serialize(
+            partial(_add_all, graph), format, encoding
+        )
+
+
+def to_ntriples_stream(
+    informationmodels: Iterable[InformationModel],
+    fileobj: IO[bytes],
+    release: bool = False,
+) -> None:
+    """Maps the information models to rdf and writes them as N-Triples to fileobj.
+
+    Args:
+        informationmodels: the information models to map
+        fileobj: a binary file object to write to
+        release (bool): whether to remove the state of the mapping from the models
+    """
+    writer = NTriplesWriter(fileobj)
+
+    for _informationmodel, graph in _graphs(informationmodels, release):
+        for triple in graph:
+            writer.add(triple)
+
+
+def _graphs(
+    informationmodels: Iterable[InformationModel], release: bool
+) -> Iterator[Tuple[InformationModel, Graph]]:
+    emitted: Set[str] = set()
+    triples: OrderedDict[Tuple[Node, Node, Node], None] = OrderedDict()
+
+    for informationmodel in informationmodels:
+        graph = _to_graph(informationmodel, emitted)
+        if release:
+            informationmodel.release()
+
+        # Resources mapped by other libraries, e.g. agents, are mapped again:
+        for triple in list(graph):
+            if triple in triples:
+                triples.move_to_end(triple)
+                graph.remove(triple)
+            else:
+                triples[triple] = None
+                if len(triples) > EMITTED_TRIPLES:
+                    triples.popitem(last=False)
+        emitted.update(str(s) for s in graph.subjects() if isinstance(s, URIRef))
+
+        yield informationmodel, graph
+
+
+def _add_all(graph: Graph, g: Optional[TripleSink] = None) -> Graph:
+    """Adds the triples of graph to g, or returns graph if g is not given."""
+    if g is None:
+        return graph
+    for triple in graph:
+        g.add(triple)
+    return graph
+
+
+@mapping
+def _to_graph(informationmodel: InformationModel, emitted: Set[str]) -> Graph:
+    """Maps the information model, only linking to the resources emitted."""
+    shallow_references(emitted)
+    return informationmodel._to_graph()
@@ -0,0 +1,145 @@
+"""Module for building large code lists from columns.
+
+This module contains functions building a CodeList with its code elements
+from columns, e.g. the columns of a CSV file or of a table read by a
+dataframe library, without creating a CodeElement object per row. The code
+elements are kept as a column per attribute on the code list, and mapped
+to triples straight from the columns together with the code list.
+
+The columns are:
+ - notation: the notation of each code element, required
+ - identifier: the identifier of each code element, mapped to a blank node
+   if not given or empty
+ - preflabel@<language>: the preferred label of each code element in the
+   language, e.g. preflabel@nb
+ - parent: the notation of the parent of each code element, empty for the
+   top concepts, the code elements with the same parent being linked as
+   siblings
+ - order: the position of each code element among its siblings, the rows
+   being in the given order if not given
+
+Example:
+    >>> from modelldcatnotordf.bulk import codelist_from_columns
+    >>>
+    >>> codelist = codelist_from_columns(
+    ...     "http://example.com/codelists/1",
+    ...     {
+    ...         "notation": ["NO", "SE"],
+    ...         "preflabel@nb": ["Norge", "Sverige"],
+    ...         "order": [2, 1],
+    ...     },
+    ... )
+    >>> codelist.code_elements.notation
+    ('SE', 'NO')
+    >>> bool(codelist.to_rdf())
+    True
+"""
+from __future__ import annotations
+
+import csv
+from typing import Any, Dict, IO, List, Mapping, Optional, Sequence
+
+from modelldcatnotordf.modelldcatno import CodeElementColumns, CodeList
+
+_PREFLABEL = "preflabel@"
+_COLUMNS = ("notation", "identifier", "parent", "order")
+
+
+def codelist_from_columns(
+    identifier: str, columns: Mapping[str, Sequence[Any]]
+) -> CodeList:
+    """Returns a code list with the code elements of the columns.
+
+    Args:
+        identifier: the identifier of the code list
+        columns: the values of each column, by the name of the column
+
+    Returns:
+        the code list
+
+    Raises:
+        ValueError: if the notation column is missing, a column is unknown
+            or not as long as the notation column, an order is not a number,
+            a notation labelling a blank node or a parent is not unique, or a
+            parent is not the notation of a code element
+    """
+    unknown = [
+        name
+        for name in columns
+        if name not in _COLUMNS and not name.startswith(_PREFLABEL)
+    ]
+    if unknown:
+        raise ValueError(f"Unknown columns: {', '.join(unknown)}")
+    if "notation" not in columns:
+        raise ValueError("The notation column is missing")
+
+    count = len(columns["notation"])
+    for name, values in columns.items():
+        if len(values) != count:
+            raise ValueError(f"The column {name} has {len(values)} values, not {count}")
+
+    rows: Sequence[int] = range(count)
+    if "order" in columns:
+        order = columns["order"]
+        rows = sorted(rows, key=lambda row: _number(order, row))
+
+    def column(name: str) -> Optional[List[Optional[str]]]:
+        if name not in columns:
+            return None
+        values = columns[name]
+        return [_text(values[row]) for row in rows]
+
+    codelist = CodeList(identifier)
+    codelist.code_elements = CodeElementColumns(
+        codelist,
+        [str(columns["notation"][row]) for row in rows],
+        preflabel={
+            name[len(_PREFLABEL) :]: column(name)  # type: ignore
+            for name in columns
+            if name.startswith(_PREFLABEL)
+        },
+        identifier=column("identifier"),
+        parent=column("parent"),
+    )
+    return codelist
+
+
+def codelist_from_csv(
+    identifier: str, fileobj: IO[str], **kwargs: Any  # noqa: ANN401
+) -> CodeList:
+    """Returns a code list with the code elements of the rows of a CSV file.
+
+    The first row of the file holds the names of the columns.
+
+    Args:
+        identifier: the identifier of the code list
+        fileobj: the CSV file, opened with newline=""
+        kwargs: the format of the file, passed on to csv.DictReader
+
+    Returns:
+        the code list
+    """
+    reader = csv.DictReader(fileobj, restval="", **kwargs)
+    names = reader.fieldnames or []
+    columns: Dict[str, List[str]] = {name: [] for name in names}
+
+    for row in reader:
+        for name in names:
+            columns[name].append(row[name])
+
+    return codelist_from_columns(identifier, columns)
+
+
+def _text(value: Any) -> Optional[str]:  # noqa: ANN401
+    """Returns the value as text, or None if empty."""
+    return None if value is None or value == "" else str(value)
+
+
+def _number(order: Sequence[Any], row: int) -> int:
+    """Returns the order of the row as a number."""
+    try:
+        return int(order[row])
+    except (TypeError, ValueError):
+        raise ValueError(
+            f"The column order has {order[row]!r} in row {row + 1}, not a number"
+        ) from None
@@ -7,19 +7,29 @@ according to the modelldcat-ap-no specification.
 """
 from __future__ import annotations
 
-from typing import Optional
+from typing import Optional, Union
 
 from datacatalogtordf import URI
-from rdflib import DCTERMS, Graph, Literal, RDF, SKOS, URIRef
-from skolemizer import Skolemizer
+from rdflib import Graph
+
+from modelldcatnotordf.mapping import (
+    iri,
+    labelled,
+    literal,
+    mapping,
+    MappingState,
+    skolemize,
+)
+from modelldcatnotordf.namespaces import bind_prefixes, DCTERMS, RDF, SKOS
+from modelldcatnotordf.uri import uri
 
 
 class ConceptScheme:
     """A class representing a skos:ConceptScheme."""
 
-    __slots__ = ("_g", "_identifier", "_title")
+    __slots__ = ("_identifier", "_title")
 
-    _g: Graph
+    _g = MappingState("_g")
     _identifier: URI
     _title: dict
 
@@ -31,11 +41,15 @@ class ConceptScheme:
     @property
     def identifier(self) -> str:
         """Get for identifier."""
-        return self._identifier
+        try:
+            return self._identifier
+        except AttributeError:
+            # Labelled in the mapping in progress, unless set:
+            return labelled(self)
 
     @identifier.setter
     def identifier(self, identifier: str) -> None:
-        self._identifier = URI(identifier)
+        self._identifier = uri(identifier)
 
     @property
     def title(self) -> dict:
@@ -47,7 +61,9 @@ class ConceptScheme:
         """Set for title attribute."""
         self._title = title
 
-    def to_rdf(self, format: str = "turtle", encoding: Optional[str] = "utf-8") -> str:
+    def to_rdf(
+        self, format: str = "turtle", encoding: Optional[str] = "utf-8"
+    ) -> Union[bytes, str]:
         """Maps the concept scheme to rdf.
 
         Args:
@@ -55,23 +71,23 @@ class ConceptScheme:
             encoding: the encoding to serialize into
 
         Returns:
-            a rdf serialization as a string according to format.
+            a rdf serialization according to format, encoded as bytes unless
+            encoding is None.
         """
         return self._to_graph().serialize(format=format, encoding=encoding)
 
+    @mapping
     def _to_graph(self) -> Graph:
         """Returns the concept scheme as graph.
 
         Returns:
             the concept scheme graph
         """
-        self._g = Graph()
-        self._g.bind("skos", SKOS)
+        self._g = bind_prefixes(Graph())
 
-        if not getattr(self, "identifier", None):
-            self.identifier = Skolemizer.add_skolemization()
+        skolemize(self)
 
-        _self = URIRef(self.identifier)
+        _self = iri(self.identifier)
 
         self._g.add((_self, RDF.type, SKOS.ConceptScheme))
 
@@ -81,7 +97,7 @@ class ConceptScheme:
                     (
                         _self,
                         DCTERMS.title,
-                        Literal(self.title[key], lang=key),
+                        literal(self.title[key], lang=key),
                     )
                 )
 
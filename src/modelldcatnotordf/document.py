@@ -13,15 +13,24 @@ Example:
 """
 from __future__ import annotations
 
-from typing import Optional
+from typing import Dict, IO, Optional, Union
 
 from datacatalogtordf import Document
 from datacatalogtordf.uri import URI
-from rdflib import DCTERMS, FOAF, Graph, Literal, Namespace, RDF, RDFS, URIRef
-from skolemizer import Skolemizer
-
-
-DCAT = Namespace("http://www.w3.org/ns/dcat#")
+from rdflib import Graph
+from rdflib.term import Node
+
+from modelldcatnotordf.mapping import (
+    iri,
+    labelled,
+    literal,
+    mapping,
+    MappingState,
+    skolemize,
+)
+from modelldcatnotordf.namespaces import bind_prefixes, DCTERMS, FOAF, RDF, RDFS
+from modelldcatnotordf.ntriples import NTriplesWriter, TripleSink
+from modelldcatnotordf.uri import uri
 
 
 class FoafDocument(Document):
@@ -34,8 +43,19 @@ class FoafDocument(Document):
         format (str): A link to a concept designating the type of the document
     """
 
-    slots = ("_identifier", "_title", "_language", "_format")
-
+    # Instances keep the __dict__ of the document of datacatalogtordf, which
+    # declares no slots, but leave it empty:
+    __slots__ = (
+        "_identifier",
+        "_title",
+        "_language",
+        "_type",
+        "_format",
+        "_rdfs_see_also",
+    )
+
+    _g = MappingState("_g")
+    _visited = MappingState("_visited")
     _identifier: URI
     _title: dict
     _language: str
@@ -49,6 +69,20 @@ class FoafDocument(Document):
             self.identifier = identifier
         self._type = FOAF.Document
 
+    @property
+    def identifier(self: FoafDocument) -> str:
+        """Get for identifier."""
+        try:
+            return self._identifier
+        except AttributeError:
+            # Labelled in the mapping in progress, unless set:
+            return labelled(self)
+
+    @identifier.setter
+    def identifier(self: FoafDocument, identifier: str) -> None:
+        """Set for identifier."""
+        self._identifier = uri(identifier)
+
     @property
     def format(self: FoafDocument) -> str:
         """Get for format."""
@@ -57,7 +91,7 @@ class FoafDocument(Document):
     @format.setter
     def format(self: FoafDocument, format: str) -> None:
         """Set for format."""
-        self._format = URI(format)
+        self._format = uri(format)
 
     @property
     def rdfs_see_also(self: FoafDocument) -> str:
@@ -67,11 +101,11 @@ class FoafDocument(Document):
     @rdfs_see_also.setter
     def rdfs_see_also(self: FoafDocument, rdfs_see_also: str) -> None:
         """Set for rdfs_see_also."""
-        self._rdfs_see_also = URI(rdfs_see_also)
+        self._rdfs_see_also = uri(rdfs_see_also)
 
     def to_rdf(
         self: FoafDocument, format: str = "turtle", encoding: Optional[str] = "utf-8"
-    ) -> str:
+    ) -> Union[bytes, str]:
         """Maps the document to rdf.
 
         Args:
@@ -79,21 +113,36 @@ class FoafDocument(Document):
             encoding: the encoding to serialize into
 
         Returns:
-            a rdf serialization as a bytes literal according to format.
+            a rdf serialization according to format, encoded as bytes unless
+            encoding is None.
         """
         return self._to_graph().serialize(format=format, encoding=encoding)
 
-    def _to_graph(self: FoafDocument) -> Graph:
+    def to_ntriples_stream(self: FoafDocument, fileobj: IO[bytes]) -> None:
+        """Maps the document to rdf and writes it as N-Triples to fileobj.
+
+        The triples are written while the document is mapped,
+        without collecting them in a graph first.
+
+        Args:
+            fileobj: a binary file object to write to
+        """
+        self._to_graph(g=NTriplesWriter(fileobj))
+
+    @mapping
+    def _to_graph(
+        self: FoafDocument,
+        g: Optional[TripleSink] = None,
+        visited: Optional[Dict[int, Node]] = None,
+    ) -> Graph:
 
-        self._g = Graph()
-        self._g.bind("dct", DCTERMS)
-        self._g.bind("foaf", FOAF)
-        self._g.bind("rdfs", RDFS)
+        self._g = bind_prefixes(Graph()) if g is None else g
+        self._visited = {} if visited is None else visited
 
-        if not getattr(self, "identifier", None):
-            self.identifier = Skolemizer.add_skolemization()
+        skolemize(self)
 
-        _self = URIRef(self.identifier)
+        _self = iri(self.identifier)
+        self._visited[id(self)] = _self
 
         self._g.add((_self, RDF.type, FOAF.Document))
 
@@ -103,7 +152,7 @@ class FoafDocument(Document):
                     (
                         _self,
                         DCTERMS.title,
-                        Literal(self.title[key], lang=key),
+                        literal(self.title[key], lang=key),
                     )
                 )
         if getattr(self, "language", None):
@@ -111,7 +160,7 @@ class FoafDocument(Document):
                 (
                     _self,
                     DCTERMS.language,
-                    Literal(self.language, datatype=DCTERMS.LinguisticSystem),
+                    literal(self.language, datatype=DCTERMS.LinguisticSystem),
                 )
             )
 
@@ -120,11 +169,11 @@ class FoafDocument(Document):
                 (
                     _self,
                     DCTERMS["format"],  # https://github.com/RDFLib/rdflib/issues/932
-                    Literal(self.format, datatype=DCTERMS.MediaType),
+                    literal(self.format, datatype=DCTERMS.MediaType),
                 )
             )
 
         if getattr(self, "_rdfs_see_also", None):
-            self._g.add((_self, RDFS.seeAlso, URIRef(self.rdfs_see_also)))
+            self._g.add((_self, RDFS.seeAlso, iri(self.rdfs_see_also)))
 
         return self._g
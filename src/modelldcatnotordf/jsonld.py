@@ -0,0 +1,137 @@
+"""Module for writing triples as compact JSON-LD while they are mapped.
+
+This module contains the JSON-LD context of modelldcat-ap-no, and a writer
+that builds a compact JSON-LD node object per subject from the triples
+added to it, instead of keeping them in a store and serializing the store
+with rdflib, which expands the document before compacting it.
+
+The context maps the prefixes of the library to their namespaces. Terms
+are written as compact IRIs, rdf:type as @type, and a predicate with one
+value is written without an array.
+
+Example:
+    >>> import json
+    >>> from modelldcatnotordf.jsonld import JsonLdWriter
+    >>> from modelldcatnotordf.modelldcatno import ObjectType
+    >>>
+    >>> objecttype = ObjectType("http://example.com/objecttypes/1")
+    >>> objecttype.title = {"nb": "Tittel"}
+    >>> writer = JsonLdWriter()
+    >>> _ = objecttype._to_graph(g=writer)
+    >>> node = json.loads(writer.getvalue())["@graph"][0]
+    >>> node["@type"]
+    'modelldcatno:ObjectType'
+    >>> node["dct:title"]
+    {'@value': 'Tittel', '@language': 'nb'}
+"""
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, IO, Iterator, Optional, Tuple, Union
+
+from rdflib import BNode, Literal
+from rdflib.term import Node
+
+from modelldcatnotordf.namespaces import prefixed_name, PREFIXES, RDF
+
+CONTEXT: Dict[str, str] = {
+    prefix: str(namespace) for prefix, namespace in PREFIXES.items()
+}
+
+_encode = json.JSONEncoder(ensure_ascii=False).encode
+
+
+class JsonLdWriter:
+    """A writer writing the triples added to it as compact JSON-LD.
+
+    The triples are kept as a node object per subject, in the order they
+    are added. A triple added more than once is written once.
+    """
+
+    __slots__ = ("_nodes", "_iris")
+
+    def __init__(self) -> None:
+        """Inits the writer without triples."""
+        self._nodes: Dict[Node, Dict[str, Dict[Node, Any]]] = {}
+        self._iris: Dict[Node, str] = {}
+
+    def add(self, triple: Tuple[Node, Node, Node]) -> JsonLdWriter:
+        """Adds the triple to the node object of its subject.
+
+        Args:
+            triple: the triple to add
+
+        Returns:
+            the writer
+        """
+        s, p, o = triple
+        node = self._nodes.setdefault(s, {})
+        if p == RDF.type:
+            node.setdefault("@type", {})[o] = self._iri(o)
+        else:
+            node.setdefault(self._iri(p), {})[o] = self._value(o)
+        return self
+
+    def write(self, fileobj: IO[bytes], encoding: str = "utf-8") -> None:
+        """Writes the triples added as JSON-LD to fileobj, a node at a time.
+
+        Args:
+            fileobj: a binary file object to write to
+            encoding: the encoding to write in
+        """
+        for chunk in self._chunks():
+            fileobj.write(chunk.encode(encoding))
+
+    def getvalue(self, encoding: Optional[str] = "utf-8") -> Union[bytes, str]:
+        """Returns the triples added as JSON-LD.
+
+        Args:
+            encoding: the encoding to serialize into, or None for a string
+
+        Returns:
+            a json-ld serialization, encoded as bytes unless encoding is None.
+        """
+        jsonld = "".join(self._chunks())
+        return jsonld if encoding is None else jsonld.encode(encoding)
+
+    def _chunks(self) -> Iterator[str]:
+        """Yields the document with the context, and a node object per subject."""
+        yield f'{{"@context": {_encode(CONTEXT)},\n"@graph": [\n'
+        separator = ""
+        for s, node in self._nodes.items():
+            properties: Dict[str, Any] = {"@id": self._iri(s)}
+            for key, values in node.items():
+                properties[key] = (
+                    next(iter(values.values()))
+                    if len(values) == 1
+                    else list(values.values())
+                )
+            yield separator + _encode(properties)
+            separator = ",\n"
+        yield "\n]}"
+
+    def _value(self, o: Node) -> Union[Dict[str, str], str]:
+        """Returns the object as a node reference or a value object."""
+        if not isinstance(o, Literal):
+            return {"@id": self._iri(o)}
+        if o.language:
+            return {"@value": str(o), "@language": o.language}
+        if o.datatype:
+            return {"@value": str(o), "@type": self._iri(o.datatype)}
+        return str(o)
+
+    def _iri(self, term: Node) -> str:
+        """Returns the term as a compact IRI when it has a prefix."""
+        try:
+            return self._iris[term]
+        except KeyError:
+            pass
+
+        if isinstance(term, BNode):
+            iri = f"_:{term}"
+        else:
+            name = prefixed_name(str(term))
+            iri = str(term) if name is None else ":".join(name)
+
+        self._iris[term] = iri
+        return iri
@@ -7,23 +7,37 @@ Refer to sub-class for typical usage examples.
 """
 from __future__ import annotations
 
-from typing import List, Optional, Union
+from typing import Dict, IO, List, Optional, Union
 
 from concepttordf import Concept
 from datacatalogtordf import URI
-from rdflib import Graph, Namespace, RDF, URIRef
-from skolemizer import Skolemizer
+from rdflib import Graph
+from rdflib.term import Node
 
+from modelldcatnotordf.mapping import (
+    foreign_triples,
+    iri,
+    labelled,
+    mapping,
+    MappingState,
+    relabel_blank_nodes,
+    skolemize,
+)
+from modelldcatnotordf.namespaces import bind_prefixes, RDF, Vocabulary
+from modelldcatnotordf.ntriples import NTriplesWriter, TripleSink
+from modelldcatnotordf.uri import uri
 
-DCT = Namespace("http://purl.org/dc/terms/")
+
+DCT = Vocabulary("http://purl.org/dc/terms/")
 
 
 class LicenseDocument:
     """A class representing a dct:LicenseDocument."""
 
-    __slots__ = ("_g", "_identifier", "_type")
+    __slots__ = ("_identifier", "_type")
 
-    _g: Graph
+    _g = MappingState("_g")
+    _visited = MappingState("_visited")
     _identifier: URI
     _type: List[Union[Concept, URI]]
 
@@ -41,13 +55,19 @@ class LicenseDocument:
     @property
     def identifier(self) -> str:
         """Get for identifier."""
-        return self._identifier
+        try:
+            return self._identifier
+        except AttributeError:
+            # Labelled in the mapping in progress, unless set:
+            return labelled(self)
 
     @identifier.setter
     def identifier(self, identifier: str) -> None:
-        self._identifier = URI(identifier)
+        self._identifier = uri(identifier)
 
-    def to_rdf(self, format: str = "turtle", encoding: Optional[str] = "utf-8") -> str:
+    def to_rdf(
+        self, format: str = "turtle", encoding: Optional[str] = "utf-8"
+    ) -> Union[bytes, str]:
         """Maps the license document to rdf.
 
         Args:
@@ -55,23 +75,42 @@ class LicenseDocument:
             encoding: the encoding to serialize into
 
         Returns:
-            a rdf serialization as a string according to format.
+            a rdf serialization according to format, encoded as bytes unless
+            encoding is None.
         """
         return self._to_graph().serialize(format=format, encoding=encoding)
 
-    def _to_graph(self) -> Graph:
+    def to_ntriples_stream(self: LicenseDocument, fileobj: IO[bytes]) -> None:
+        """Maps the license document to rdf and writes it as N-Triples to fileobj.
+
+        The triples are written while the license document is mapped,
+        without collecting them in a graph first.
+
+        Args:
+            fileobj: a binary file object to write to
+        """
+        self._to_graph(g=NTriplesWriter(fileobj))
+
+    @mapping
+    def _to_graph(
+        self, g: Optional[TripleSink] = None, visited: Optional[Dict[int, Node]] = None
+    ) -> Graph:
         """Returns the license document as graph.
 
+        Args:
+            g: a graph to add the triples to. Default: None
+            visited: nodes of objects already added to the graph. Default: None
+
         Returns:
             the license document graph
         """
-        self._g = Graph()
-        self._g.bind("dct", DCT)
+        self._g = bind_prefixes(Graph()) if g is None else g
+        self._visited = {} if visited is None else visited
 
-        if not getattr(self, "identifier", None):
-            self.identifier = Skolemizer.add_skolemization()
+        skolemize(self)
 
-        _self = URIRef(self.identifier)
+        _self = iri(self.identifier)
+        self._visited[id(self)] = _self
 
         self._g.add((_self, RDF.type, DCT.LicenseDocument))
 
@@ -80,13 +119,15 @@ class LicenseDocument:
             for type in self._type:
 
                 if isinstance(type, Concept):
-                    _type = URIRef(type.identifier)
+                    _type = iri(type.identifier)
 
-                    for _s, p, o in type._to_graph().triples((None, None, None)):
+                    for _s, p, o in relabel_blank_nodes(
+                        foreign_triples(type), str(_type)
+                    ):
                         self._g.add((_type, p, o))
 
                 elif isinstance(type, str):
-                    _type = URIRef(type)
+                    _type = iri(type)
 
                 self._g.add(
                     (
@@ -0,0 +1,555 @@
+"""Module for the state of mappings in progress.
+
+This module makes mapping to rdf re-entrant and thread-safe, so that objects
+shared between models, e.g. a module or an object type, can be mapped by
+several threads at the same time:
+
+- The graph an object is mapped into, the nodes visited and the triples
+  added by the object are kept per thread, not on the object itself, and
+  are removed when the outermost mapping in the thread returns.
+- Random skolemized identifiers are given to objects under a lock, so an
+  object is given the same identifier by every thread. Identifiers derived
+  from the content and position of an object in the model are kept per
+  thread instead, leaving the object as it is.
+- Objects of other libraries, e.g. concepts and agents, keep their graph
+  on the object, and are mapped under a lock.
+
+Blank nodes are labelled by the path to them from the object referring to
+them, instead of by random labels, so that mapping the same model twice
+gives byte-identical serializations.
+
+The IRIs and literals of a mapping are interned: an IRI or literal created
+more than once in the same mapping, e.g. the identifier of an object or a
+title shared by many objects, is created once and shared by the triples.
+
+A mapping can be made incremental: objects that have not changed since
+they were last mapped incrementally are mapped from the triples kept on
+them, instead of anew.
+
+References to objects mapped on their own in the same mapping, e.g. the
+model elements of an information model, can be made shallow: the object
+referring to them is only linked to them, without mapping them in turn.
+
+A mapping can be bounded by the depth of the objects mapped, the number of
+triples mapped and a deadline. Exceeding a limit raises a MappingLimitError
+naming the path to the object being mapped, instead of exhausting the
+stack or memory of the process.
+
+Example:
+    >>> from concurrent.futures import ThreadPoolExecutor
+    >>> from modelldcatnotordf.modelldcatno import InformationModel, Module
+    >>>
+    >>> module = Module("http://example.com/modules/1")
+    >>> models = []
+    >>> for i in range(4):
+    ...     model = InformationModel(f"http://example.com/informationmodels/{i}")
+    ...     model.modelelements.append(module)
+    ...     models.append(model)
+    >>> with ThreadPoolExecutor(max_workers=4) as executor:
+    ...     rdf = list(executor.map(lambda model: model.to_rdf(), models))
+"""
+from __future__ import annotations
+
+from collections import deque
+from functools import wraps
+import hashlib
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+)
+import uuid
+
+from rdflib import BNode, Graph, Literal, URIRef
+from rdflib.term import Node
+from skolemizer import Skolemizer
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# The name of the state holding the identifier an object is labelled by:
+_LABEL = "identifier"
+
+# Held when mapping objects of other libraries:
+FOREIGN_LOCK = threading.RLock()
+
+_local = threading.local()
+_skolemization_lock = threading.Lock()
+
+
+class Limits(NamedTuple):
+    """The limits of a mapping, each unbounded if None.
+
+    Attributes:
+        depth: the number of references followed from the object mapped
+        triples: the number of triples mapped from the objects
+        deadline: the time, as of time.monotonic(), the mapping must end by
+    """
+
+    depth: Optional[int] = None
+    triples: Optional[int] = None
+    deadline: Optional[float] = None
+
+
+class MappingLimitError(Exception):
+    """Raised when a mapping exceeds one of its limits.
+
+    Attributes:
+        limit: the name of the limit exceeded: depth, triples or deadline
+        value: the value of the limit
+        path: the identifiers of the objects from the object mapped to the
+            object being mapped when the limit was exceeded
+    """
+
+    def __init__(self, limit: str, value: float, path: Sequence[str]) -> None:
+        """Inits the error with the limit exceeded and where."""
+        super().__init__(limit, value, tuple(path))
+        self.limit = limit
+        self.value = value
+        self.path = tuple(path)
+
+    def __str__(self) -> str:
+        """Returns the limit exceeded and the path to the object."""
+        return (
+            f"The {self.limit} limit of {self.value} was exceeded at "
+            f"{' > '.join(self.path)}"
+        )
+
+
+class MappingState:
+    """An attribute kept per thread while the object is being mapped.
+
+    Reading the attribute outside of a mapping in the thread raises an
+    AttributeError, as for an attribute that is not set.
+    """
+
+    __slots__ = ("_name",)
+
+    def __init__(self, name: str) -> None:
+        """Inits the attribute with its name."""
+        self._name = name
+
+    def __get__(
+        self, modelobject: Optional[object], owner: type
+    ) -> Any:  # noqa: ANN401
+        """Returns the value of the attribute in this thread."""
+        if modelobject is None:
+            return self
+        try:
+            return _states()[id(modelobject)][self._name]
+        except KeyError:
+            raise AttributeError(self._name) from None
+
+    def __set__(self, modelobject: object, value: Any) -> None:  # noqa: ANN401
+        """Sets the value of the attribute in this thread."""
+        _states().setdefault(id(modelobject), {})[self._name] = value
+
+
+def mapping(method: F) -> F:
+    """Decorates a method mapping an object to rdf.
+
+    The objects followed are mapped, and the state kept per thread is
+    removed, when the outermost decorated method returns.
+
+    Args:
+        method: the method to decorate
+
+    Returns:
+        the decorated method
+    """
+
+    @wraps(method)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        _local.depth = getattr(_local, "depth", 0) + 1
+        try:
+            result = method(*args, **kwargs)
+            if _local.depth == 1:
+                map_followed()
+            return result
+        finally:
+            _local.depth -= 1
+            if _local.depth == 0:
+                _queue().clear()
+                _states().clear()
+                _terms().clear()
+                _shallow().clear()
+                _local.guard = None
+                _local.incremental = False
+
+    return wrapper  # type: ignore
+
+
+def skolemize(modelobject: Any) -> None:  # noqa: ANN401
+    """Gives the object a random skolemized identifier, unless it has an identifier.
+
+    Args:
+        modelobject: the object to identify
+    """
+    if not getattr(modelobject, "identifier", None):
+        with _skolemization_lock:
+            if not getattr(modelobject, "identifier", None):
+                modelobject.identifier = Skolemizer.add_skolemization()
+
+
+def label(modelobject: Any, identifier: str) -> None:  # noqa: ANN401
+    """Identifies the object by the identifier in the mapping in progress.
+
+    The identifier is kept in this thread for the rest of the mapping, and
+    the object is left as it is, so that other threads mapping the object
+    are not affected.
+
+    Args:
+        modelobject: the object to identify
+        identifier: the identifier, e.g. a skolemization derived from content
+    """
+    _states().setdefault(id(modelobject), {})[_LABEL] = identifier
+
+
+def labelled(modelobject: Any) -> str:  # noqa: ANN401
+    """Returns the identifier the object is labelled by in this thread.
+
+    Args:
+        modelobject: the object labelled
+
+    Returns:
+        the identifier given the object by label
+
+    Raises:
+        AttributeError: if the object is not labelled
+    """
+    try:
+        return _states()[id(modelobject)][_LABEL]
+    except KeyError:
+        raise AttributeError("identifier") from None
+
+
+def foreign_triples(foreign: Any) -> List[Tuple[Node, Node, Node]]:  # noqa: ANN401
+    """Returns the triples of an object of another library, mapped under a lock.
+
+    Args:
+        foreign: the object to map, e.g. a concept
+
+    Returns:
+        the triples of the object
+    """
+    with FOREIGN_LOCK:
+        # A concept adds its triples to the same graph every time it is mapped:
+        if isinstance(getattr(foreign, "_g", None), Graph):
+            foreign._g = Graph()
+        return list(foreign._to_graph())
+
+
+def iri(value: str) -> URIRef:
+    """Returns the value as an IRI, created once in the mapping in progress.
+
+    Args:
+        value: the IRI
+
+    Returns:
+        the IRI
+    """
+    if not getattr(_local, "depth", 0):
+        return URIRef(value)
+
+    terms = _terms()
+    key = (URIRef, value)
+    try:
+        return terms[key]
+    except KeyError:
+        term = terms[key] = URIRef(value)
+        return term
+
+
+def literal(
+    value: Any,  # noqa: ANN401
+    lang: Optional[str] = None,
+    datatype: Optional[str] = None,
+) -> Literal:
+    """Returns the value as a literal, created once in the mapping in progress.
+
+    Args:
+        value: the value of the literal
+        lang: the language of the literal
+        datatype: the datatype of the literal
+
+    Returns:
+        the literal
+    """
+    if not getattr(_local, "depth", 0):
+        return Literal(value, lang=lang, datatype=datatype)
+
+    terms = _terms()
+    # The type is part of the key, as e.g. 1 and True are equal:
+    key = (type(value), value, lang, datatype)
+    try:
+        return terms[key]
+    except KeyError:
+        term = terms[key] = Literal(value, lang=lang, datatype=datatype)
+        return term
+
+
+def map_incrementally() -> None:
+    """Makes the rest of the mapping in progress incremental.
+
+    Objects are mapped from the triples they were last mapped to, kept on
+    them, unless changed since, and keep the triples they are mapped to for
+    the next incremental mapping. Mappings that are not incremental neither
+    use nor keep these triples.
+    """
+    _local.incremental = True
+
+
+def is_incremental() -> bool:
+    """Returns whether the mapping in progress is incremental.
+
+    Returns:
+        whether objects are mapped from and keep the triples of mappings
+    """
+    return getattr(_local, "incremental", False)
+
+
+def shallow_references(identifiers: Iterable[str]) -> None:
+    """Makes references to the objects of the identifiers shallow.
+
+    For the rest of the mapping in progress, an object referring to an
+    object of one of the identifiers is only linked to it, the object being
+    expected to be mapped on its own.
+
+    Args:
+        identifiers: the identifiers of the objects
+    """
+    _shallow().update(identifiers)
+
+
+def is_shallow(modelobject: Any) -> bool:  # noqa: ANN401
+    """Returns whether references to the object are shallow in this mapping.
+
+    Args:
+        modelobject: the object referred to
+
+    Returns:
+        whether the object is only to be linked to
+    """
+    shallow = _shallow()
+    return bool(shallow) and getattr(modelobject, "identifier", None) in shallow
+
+
+def limit(limits: Limits, *path: Any) -> None:  # noqa: ANN401
+    """Bounds the rest of the mapping in progress by the limits.
+
+    Args:
+        limits: the limits of the mapping
+        path: the objects, or identifiers, the mapping is within, e.g. the
+            object mapped
+    """
+    _local.guard = _Guard(limits, list(path))
+
+
+def follow(modelobject: Any, map_object: Callable[[], object]) -> None:  # noqa: ANN401
+    """Maps an object referred to after the object referring to it.
+
+    The objects referred to are queued in the order they are met, and
+    mapped when the outermost mapping in the thread returns, or when the
+    mapping maps the followed objects itself, instead of from within the
+    object referring to them. Objects nested however deep are mapped
+    without exhausting the stack.
+
+    Args:
+        modelobject: the object referred to
+        map_object: the function mapping the object
+    """
+    previous = getattr(_local, "step", None)
+    step = _Step(modelobject, previous, 1 if previous is None else previous.depth + 1)
+    _queue().append((step, map_object))
+
+
+def map_followed() -> None:
+    """Maps the objects followed, and the objects they refer to in turn.
+
+    Raises:
+        MappingLimitError: if an object is too deep
+    """
+    queue = _queue()
+    try:
+        while queue:
+            step, map_object = queue.popleft()
+            _local.step = step
+            guard = getattr(_local, "guard", None)
+            if guard is not None:
+                limits = guard.limits
+                # The object mapped is at depth 0:
+                if (
+                    limits.depth is not None
+                    and len(guard.path) - 1 + step.depth > limits.depth
+                ):
+                    raise MappingLimitError("depth", limits.depth, _path(guard))
+            map_object()
+    finally:
+        _local.step = None
+
+
+def count_triples(count: int) -> None:
+    """Counts triples mapped, checking the number of triples and the deadline.
+
+    Args:
+        count: the number of triples mapped
+
+    Raises:
+        MappingLimitError: if too many triples are mapped, or the deadline passed
+    """
+    guard = getattr(_local, "guard", None)
+    if guard is None:
+        return
+
+    guard.triples += count
+    limits = guard.limits
+    if limits.triples is not None and guard.triples > limits.triples:
+        raise MappingLimitError("triples", limits.triples, _path(guard))
+    if limits.deadline is not None and time.monotonic() > limits.deadline:
+        raise MappingLimitError("deadline", limits.deadline, _path(guard))
+
+
+def blank_node(*path: str) -> BNode:
+    """Returns a blank node labelled by the path to it.
+
+    Args:
+        path: e.g. the node referring to the blank node, the predicate
+            and the position of the blank node among the objects
+
+    Returns:
+        the same blank node for the same path
+    """
+    digest = hashlib.blake2b("\n".join(path).encode(), digest_size=16)
+    return BNode(f"N{digest.hexdigest()}")
+
+
+def relabel_blank_nodes(
+    triples: Iterable[Tuple[Node, Node, Node]], *path: str
+) -> List[Tuple[Node, Node, Node]]:
+    """Returns the triples with their blank nodes labelled by the path to them.
+
+    The blank nodes minted by another library are numbered in the order they
+    are met, after the path to the triples. The triples are sorted first,
+    without the labels of their blank nodes, as the order they come in may
+    differ from one mapping to the next.
+
+    Args:
+        triples: the triples to relabel, e.g. mapped by another library
+        path: the path to the triples, e.g. the node referring to them
+
+    Returns:
+        the relabelled triples
+    """
+    labels: Dict[BNode, BNode] = {}
+
+    def relabel(node: Node) -> Node:
+        if not isinstance(node, BNode):
+            return node
+        if node not in labels:
+            labels[node] = blank_node(*path, str(len(labels)))
+        return labels[node]
+
+    def key(node: Node) -> Tuple[str, str]:
+        return (type(node).__name__, "" if isinstance(node, BNode) else str(node))
+
+    return [
+        (relabel(s), p, relabel(o))
+        for s, p, o in sorted(triples, key=lambda t: (key(t[0]), key(t[1]), key(t[2])))
+    ]
+
+
+def skolemization(*path: str) -> str:
+    """Returns a skolemized identifier derived from the path.
+
+    Args:
+        path: e.g. the identifier of the object referring to an object, and
+            the content of the object
+
+    Returns:
+        the skolemized identifier
+    """
+    digest = hashlib.blake2b("\n".join(path).encode(), digest_size=16).digest()
+    skolemization = (
+        f"{Skolemizer.get_baseurl()}.well-known/skolem/{uuid.UUID(bytes=digest)}"
+    )
+    Skolemizer.skolemizations.add(skolemization)
+
+    return skolemization
+
+
+class _Guard:
+    """The limits of a mapping in progress, and how far it has come."""
+
+    __slots__ = ("limits", "path", "triples")
+
+    def __init__(self, limits: Limits, path: List[Any]) -> None:
+        """Inits the guard at the start of the mapping."""
+        self.limits = limits
+        self.path = path
+        self.triples = 0
+
+
+class _Step(NamedTuple):
+    """An object followed, and the step to the object referring to it."""
+
+    modelobject: Any
+    previous: Optional[_Step]
+    depth: int
+
+
+def _path(guard: _Guard) -> List[str]:
+    """Returns the identifiers of the objects down to the object being mapped."""
+    steps = []
+    step = getattr(_local, "step", None)
+    while step is not None:
+        steps.append(step.modelobject)
+        step = step.previous
+
+    return [
+        modelobject
+        if isinstance(modelobject, str)
+        else getattr(modelobject, "identifier", None) or type(modelobject).__name__
+        for modelobject in guard.path + steps[::-1]
+    ]
+
+
+def _states() -> Dict[int, Dict[str, Any]]:
+    try:
+        return _local.states
+    except AttributeError:
+        _local.states = {}
+        return _local.states
+
+
+def _terms() -> Dict[Tuple[Any, ...], Any]:
+    try:
+        return _local.terms
+    except AttributeError:
+        _local.terms = {}
+        return _local.terms
+
+
+def _queue() -> Deque[Tuple[_Step, Callable[[], object]]]:
+    try:
+        return _local.queue
+    except AttributeError:
+        _local.queue = deque()
+        return _local.queue
+
+
+def _shallow() -> Set[str]:
+    try:
+        return _local.shallow
+    except AttributeError:
+        _local.shallow = set()
+        return _local.shallow
@@ -8,42 +8,87 @@ Refer to sub-class for typical usage examples.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Union
+from concurrent.futures import ProcessPoolExecutor
+from copy import copy
+from functools import partial
+import hashlib
+from time import monotonic
+from typing import Any, Callable, Dict, IO, List, Optional, Sequence, Tuple, Union
 
 from concepttordf import Concept, Contact
 from datacatalogtordf import Agent, Location, Resource, URI
 from datacatalogtordf.periodoftime import Date, PeriodOfTime
-from rdflib import (
-    BNode,
+from rdflib import BNode, Graph, URIRef
+from rdflib.term import Node
+
+from modelldcatnotordf.document import FoafDocument
+from modelldcatnotordf.jsonld import JsonLdWriter
+from modelldcatnotordf.licensedocument import LicenseDocument
+from modelldcatnotordf.mapping import (
+    blank_node,
+    count_triples,
+    follow,
+    FOREIGN_LOCK,
+    foreign_triples,
+    iri,
+    is_incremental,
+    is_shallow,
+    label,
+    labelled,
+    limit,
+    Limits,
+    literal,
+    map_followed,
+    map_incrementally,
+    mapping,
+    MappingLimitError,
+    MappingState,
+    relabel_blank_nodes,
+    shallow_references,
+    skolemization,
+    skolemize,
+)
+from modelldcatnotordf.namespaces import (
+    ADMS,
+    bind_prefixes,
+    DCAT,
     DCTERMS,
     FOAF,
-    Graph,
-    Literal,
-    Namespace,
+    MODELLDCATNO,
     OWL,
     PROF,
     RDF,
     RDFS,
     SKOS,
-    URIRef,
+    XKOS,
     XSD,
 )
-from skolemizer import Skolemizer
-
-from modelldcatnotordf.document import FoafDocument
-from modelldcatnotordf.licensedocument import LicenseDocument
-
-DCAT = Namespace("http://www.w3.org/ns/dcat#")
-ODRL = Namespace("http://www.w3.org/ns/odrl/2/")
-MODELLDCATNO = Namespace("https://data.norge.no/vocabulary/modelldcatno#")
-XKOS = Namespace("http://rdf-vocabulary.ddialliance.org/xkos#")
-ADMS = Namespace("http://www.w3.org/ns/adms#")
+from modelldcatnotordf.ntriples import (
+    CANONICAL,
+    NTriplesWriter,
+    SortedNTriplesWriter,
+    TripleSink,
+    Writer,
+)
+from modelldcatnotordf.schema import (
+    CARDINALITY,
+    CONCEPT,
+    Field,
+    IRI,
+    LANGUAGE,
+    LITERAL,
+    REFERENCE,
+    SchemaMapping,
+)
+from modelldcatnotordf.turtle import TurtleWriter
+from modelldcatnotordf.uri import uri
 
 
 class Standard:
     """A class representing a dct:Standard."""
 
-    _g: Graph
+    _g = MappingState("_g")
+    _visited = MappingState("_visited")
     _identifier: URI
     _title: dict
     _has_reference: str
@@ -57,11 +102,15 @@ class Standard:
     @property
     def identifier(self) -> str:
         """Get for identifier."""
-        return self._identifier
+        try:
+            return self._identifier
+        except AttributeError:
+            # Labelled in the mapping in progress, unless set:
+            return labelled(self)
 
     @identifier.setter
     def identifier(self, identifier: str) -> None:
-        self._identifier = URI(identifier)
+        self._identifier = uri(identifier)
 
     @property
     def title(self) -> dict:
@@ -81,7 +130,7 @@ class Standard:
     @has_reference.setter
     def has_reference(self: Standard, has_reference: str) -> None:
         """Set for has_reference."""
-        self._has_reference = URI(has_reference)
+        self._has_reference = uri(has_reference)
 
     @property
     def has_version_number(self: Standard) -> str:
@@ -105,21 +154,49 @@ class Standard:
         Returns:
             a rdf serialization as a string according to format encoded as bytes.
         """
-        return self._to_graph().serialize(format=format, encoding=encoding)
+        return serialize(self._to_graph, format, encoding)
+
+    def to_ntriples_stream(self: Standard, fileobj: IO[bytes]) -> None:
+        """Maps the standard to rdf and writes it as N-Triples to fileobj.
+
+        The triples are written while the standard is mapped,
+        without collecting them in a graph first.
+
+        Args:
+            fileobj: a binary file object to write to
+        """
+        self._to_graph(g=NTriplesWriter(fileobj))
 
-    def _to_graph(self) -> Graph:
+    def content_hash(self: Standard) -> str:
+        """Returns a hash of the canonical N-Triples of the standard.
+
+        Returns:
+            the sha256 hex digest of the sorted N-Triples.
+        """
+        return _content_hash(self._to_graph)
+
+    @mapping
+    def _to_graph(
+        self,
+        g: Optional[TripleSink] = None,
+        visited: Optional[Dict[int, Node]] = None,
+    ) -> Graph:
         """Returns the standard as graph.
 
+        Args:
+            g: a graph to add the triples to. Default: None
+            visited: nodes of objects already added to the graph. Default: None
+
         Returns:
             the graph graph
         """
-        self._g = Graph()
-        self._g.bind("dct", DCTERMS)
+        self._g = bind_prefixes(Graph()) if g is None else g
+        self._visited = {} if visited is None else visited
 
-        if not getattr(self, "identifier", None):
-            self.identifier = Skolemizer.add_skolemization()
+        skolemize(self)
 
-        _self = URIRef(self.identifier)
+        _self = iri(self.identifier)
+        self._visited[id(self)] = _self
 
         self._g.add((_self, RDF.type, DCTERMS.Standard))
 
@@ -127,38 +204,32 @@ class Standard:
             for key in self.title:
                 self._g.add(
                     (
-                        URIRef(self.identifier),
+                        iri(self.identifier),
                         DCTERMS.title,
-                        Literal(self.title[key], lang=key),
+                        literal(self.title[key], lang=key),
                     )
                 )
 
         if getattr(self, "has_reference", None):
-            self._g.add(
-                (URIRef(self.identifier), RDFS.seeAlso, URIRef(self.has_reference))
-            )
+            self._g.add((iri(self.identifier), RDFS.seeAlso, iri(self.has_reference)))
 
         if getattr(self, "has_version_number", None):
             self._g.add(
                 (
-                    URIRef(self.identifier),
+                    iri(self.identifier),
                     OWL.versionInfo,
-                    Literal(self.has_version_number),
+                    literal(self.has_version_number),
                 )
             )
 
         return self._g
 
 
-class InformationModel(Resource, Standard):
+class InformationModel(Resource, Standard, SchemaMapping):
     """A class representing a modelldatno:InformationModel."""
 
     __slots__ = (
-        "_title",
         "_type",
-        "_description",
-        "_theme",
-        "_publisher",
         "_subject",
         "_modelelements",
         "_informationmodelidentifier",
@@ -175,13 +246,14 @@ class InformationModel(Resource, Standard):
         "_version_info",
         "_version_note",
         "_status",
-        "_creator",
         "_has_format",
         "_temporal",
         "_is_profile_of",
         "_conforms_to",
     )
 
+    # Shadows the graph slot of the datacatalogtordf resource:
+    _g = MappingState("_g")
     _title: dict
     _publisher: Union[Agent, URI]
     _subject: List[Union[Concept, URI]]
@@ -206,6 +278,23 @@ class InformationModel(Resource, Standard):
     _is_profile_of: Standard
     _conforms_to: Standard
 
+    # References to resources of their own, mapped with the graph of the model,
+    # and resources mapped to blank nodes are mapped by _to_graph:
+    _schema: Tuple[Field, ...] = (
+        Field("_subject", DCTERMS.subject, CONCEPT, many=True),
+        Field("_homepage", FOAF.homepage, IRI),
+        Field("_modified", DCTERMS.modified, LITERAL, datatype=XSD.date),
+        Field("_dct_type", DCTERMS.type, CONCEPT),
+        Field("_version_note", ADMS.versionNotes, LANGUAGE),
+        Field("_status", ADMS.status, CONCEPT),
+        Field(
+            "_informationmodelidentifier",
+            MODELLDCATNO.informationModelIdentifier,
+            LITERAL,
+        ),
+        Field("_version_info", OWL.versionInfo, LITERAL),
+    )
+
     def __init__(self, identifier: Optional[str] = None) -> None:
         """Inits InformationModel object with default values."""
         if identifier:
@@ -224,6 +313,20 @@ class InformationModel(Resource, Standard):
         self._has_format = []
         self._temporal = []
 
+    @property
+    def identifier(self) -> str:
+        """Get for identifier."""
+        try:
+            return self._identifier
+        except AttributeError:
+            # Labelled in the mapping in progress, unless set:
+            return labelled(self)
+
+    @identifier.setter
+    def identifier(self, identifier: str) -> None:
+        """Set for identifier."""
+        self._identifier = uri(identifier)
+
     @property
     def informationmodelidentifier(self) -> str:
         """Get for informationmodelidentifier."""
@@ -367,7 +470,7 @@ class InformationModel(Resource, Standard):
     @homepage.setter
     def homepage(self: InformationModel, homepage: str) -> None:
         """Set for homepage."""
-        self._homepage = URI(homepage)
+        self._homepage = uri(homepage)
 
     @property
     def contactpoints(self: InformationModel) -> List[Contact]:
@@ -497,6 +600,14 @@ class InformationModel(Resource, Standard):
         self: InformationModel,
         format: str = "turtle",
         encoding: Optional[str] = "utf-8",
+        workers: Optional[int] = None,
+        incremental: bool = False,
+        release: bool = False,
+        deterministic: bool = False,
+        shallow: bool = False,
+        max_depth: Optional[int] = None,
+        max_triples: Optional[int] = None,
+        timeout: Optional[float] = None,
     ) -> bytes:
         """Maps the information model to rdf.
 
@@ -504,154 +615,341 @@ class InformationModel(Resource, Standard):
          - turtle (default)
          - xml
          - json-ld
+         - nt-canonical: sorted N-Triples, to compare as strings
+
+        With more than one worker, the model elements are split into
+        as many partitions, which are mapped in separate processes.
+        Every model element is given its identifier before the partitions
+        are mapped, so that skolemized identifiers are kept on the objects
+        and shared between partitions.
+
+        No graph is kept on the objects after the mapping. With incremental,
+        every object keeps the triples it is mapped to, and an object that
+        has not changed since it was last mapped incrementally is mapped from
+        these triples instead of anew, so that mapping a model again after a
+        small change takes time in proportion to the change. An object is
+        changed by setting its attributes, or by changing a list or dict
+        attribute in place, e.g. appending to has_property. With release,
+        the triples kept on the information model and every object it refers
+        to are removed after the mapping, leaving the objects as small as
+        they were before.
+
+        Objects without identifier are given random skolemized identifiers,
+        which are kept on the objects, so that they are mapped to the same
+        IRIs every time, by every thread. Deterministic identifiers are
+        derived from the identifier of the object first referring to the
+        object, its position among the objects referred to, and its type and
+        literal attributes, so that an unchanged model gets the same
+        identifiers every time it is built and mapped. They are kept by the
+        thread mapping the model, and not set on the objects.
+
+        With shallow, an object referring to a model element of the
+        information model is only linked to it, and the model element is
+        mapped on its own. The triples are the same, but model elements are
+        not mapped from deep within other model elements, nor, with more
+        than one worker, mapped again by every partition referring to them.
+
+        The mapping can be bounded by the number of references followed from
+        the information model, the number of triples mapped from the objects,
+        and the seconds it may take. A mapping exceeding one of them raises a
+        MappingLimitError naming the path to the object being mapped.
 
         Args:
             format (str): a valid format.
             encoding (str): the encoding to serialize into
+            workers (int): the number of processes mapping model elements
+            incremental (bool): whether to map unchanged objects from the
+                triples kept on them
+            release (bool): whether to remove the state of the mapping
+            deterministic (bool): whether to derive skolemized identifiers
+            shallow (bool): whether to only link to model elements referred to
+            max_depth (int): the number of references followed at most
+            max_triples (int): the number of triples mapped at most
+            timeout (float): the seconds the mapping may take at most
 
         Returns:
             a rdf serialization as a string according to format encoded as bytes.
+
+        Raises:
+            MappingLimitError: if the mapping exceeds one of its limits, or
+                the model is nested too deep to be mapped within max_depth
+            RecursionError: if the model is nested too deep to be mapped in
+                parallel, and no max_depth is given
         """
-        return self._to_graph().serialize(format=format, encoding=encoding)
+        limits = None
+        if max_depth is not None or max_triples is not None or timeout is not None:
+            limits = Limits(
+                max_depth,
+                max_triples,
+                None if timeout is None else monotonic() + timeout,
+            )
 
-    # -
+        try:
+            rdf = serialize(
+                partial(
+                    self._to_graph,
+                    workers=workers,
+                    incremental=incremental,
+                    deterministic=deterministic,
+                    shallow=shallow,
+                    limits=limits,
+                ),
+                format,
+                encoding,
+            )
+        except RecursionError as error:
+            # E.g. when pickling a model nested too deep for the workers, which
+            # is only a limit of the mapping when a depth is given:
+            if max_depth is None:
+                raise
+            raise MappingLimitError("depth", max_depth, (self.identifier,)) from error
+        if release:
+            self.release()
+
+        return rdf
+
+    def release(self: InformationModel) -> None:
+        """Removes the state of mappings from the model and the objects it refers to.
+
+        The triples kept by incremental mappings are removed, leaving the
+        objects as small as they were before they were mapped.
+        """
+        _release(self)
+
+    def to_ntriples_stream(self: InformationModel, fileobj: IO[bytes]) -> None:
+        """Maps the information model to rdf and writes it as N-Triples to fileobj.
+
+        The triples are written while the information model is mapped,
+        without collecting them in a graph first.
+
+        Args:
+            fileobj: a binary file object to write to
+        """
+        self._to_graph(g=NTriplesWriter(fileobj))
 
-    def _to_graph(self: InformationModel) -> Graph:
+    def content_hash(self: InformationModel) -> str:
+        """Returns a hash of the canonical N-Triples of the information model.
 
-        super(InformationModel, self)._to_graph()
-        self._g.bind("modelldcatno", MODELLDCATNO)
+        Objects without identifier are labelled by deterministic identifiers
+        for the mapping, as with to_rdf(deterministic=True), so that the hash
+        of an unchanged model is the same every time it is built. The labels
+        are kept by the thread hashing the model, which is left as it is.
+
+        Returns:
+            the sha256 hex digest of the sorted N-Triples.
+        """
+        return _content_hash(partial(self._to_graph, deterministic=True))
 
-        self._g.add((URIRef(self.identifier), RDF.type, self._type))
+    # -
 
-        self._publisher_to_graph()
-        self._subject_to_graph()
-        self._modelelements_to_graph()
+    @mapping
+    def _to_graph(
+        self: InformationModel,
+        g: Optional[TripleSink] = None,
+        visited: Optional[Dict[int, Node]] = None,
+        workers: Optional[int] = None,
+        incremental: bool = False,
+        deterministic: bool = False,
+        shallow: bool = False,
+        limits: Optional[Limits] = None,
+    ) -> Graph:
+        if incremental:
+            map_incrementally()
+        if deterministic:
+            _label_by_content(self)
+        if limits is not None:
+            limit(limits, self)
+
+        # The resource part, publisher included, is mapped by datacatalogtordf
+        # into a graph of its own, with blank nodes of random labels:
+        with FOREIGN_LOCK:
+            resource = list(super(InformationModel, self)._to_graph())
+
+        self._g = bind_prefixes(Graph()) if g is None else g
+        graph = self._g
+        if limits is not None:
+            # Every triple is counted as it is added, whatever object it is of:
+            self._g = _CountingSink(graph)
+        for triple in relabel_blank_nodes(resource, self.identifier):
+            self._g.add(triple)
+        self._visited = {} if visited is None else visited
+        self._visited[id(self)] = iri(self.identifier)
+
+        self._g.add((iri(self.identifier), RDF.type, self._type))
+        self._emit(self, iri(self.identifier))
+
+        self._modelelements_to_graph(workers, shallow, limits)
         self._licensedocument_to_graph()
         self._replaces_to_graph()
         self._is_replaced_by_to_graph()
         self._has_part_to_graph()
         self._is_part_of_to_graph()
-        self._homepage_to_graph()
         self._contactpoints_to_graph()
         self._locations_to_graph()
-        self._modified_to_graph()
-        self._dct_type_to_graph()
-        self._version_note_to_graph()
-        self._status_to_graph()
         self._has_formats_to_graph()
         self._temporals_to_graph()
         self._is_profile_of_to_graph()
         self._conforms_to_to_graph()
 
-        if getattr(self, "informationmodelidentifier", None):
-            self._g.add(
-                (
-                    URIRef(self.identifier),
-                    MODELLDCATNO.informationModelIdentifier,
-                    Literal(self.informationmodelidentifier),
-                )
-            )
-
-        if getattr(self, "version_info", None):
-            self._g.add(
-                (
-                    URIRef(self.identifier),
-                    OWL.versionInfo,
-                    Literal(self.version_info),
-                )
-            )
-
-        return self._g
+        return graph
+
+    def _add(self: InformationModel, triple: Tuple[Node, Node, Node]) -> None:
+        self._g.add(triple)
+
+    def _publisher_to_graph(self: InformationModel) -> None:
+        publisher = getattr(self, "publisher", None)
+        try:
+            identifier = labelled(publisher)
+        except AttributeError:
+            identifier = None
+        if identifier is None or not isinstance(publisher, Agent):
+            super()._publisher_to_graph()
+            return
+
+        # Mapped as a copy identified by its label, as datacatalogtordf would
+        # give the agent itself a random identifier:
+        agent = copy(publisher)
+        agent._g = Graph()
+        agent.identifier = identifier
+        for triple in agent._to_graph():
+            self._g.add(triple)
+        self._g.add((iri(self.identifier), DCTERMS.publisher, iri(identifier)))
 
     def _is_profile_of_to_graph(self: InformationModel) -> None:
         if getattr(self, "_is_profile_of", None):
 
             _is_profile_of = (
-                URIRef(self.is_profile_of.identifier)
+                iri(self.is_profile_of.identifier)
                 if isinstance(self.is_profile_of, Standard)
-                else URIRef(self.is_profile_of)
+                else iri(self.is_profile_of)
             )
 
             if isinstance(self.is_profile_of, Standard):
-                for _s, p, o in self.is_profile_of._to_graph().triples(
-                    (None, None, None)
-                ):
-                    self._g.add((_is_profile_of, p, o))
-
-            self._g.add((URIRef(self.identifier), PROF.isProfileOf, _is_profile_of))
-
-    def _subject_to_graph(self: InformationModel) -> None:
-        if getattr(self, "subject", None):
+                if id(self.is_profile_of) not in self._visited:
+                    self.is_profile_of._to_graph(g=self._g, visited=self._visited)
 
-            for subject in self._subject:
+            self._g.add((iri(self.identifier), PROF.isProfileOf, _is_profile_of))
 
-                _subject = (
-                    URIRef(subject.identifier)
-                    if isinstance(subject, Concept)
-                    else URIRef(subject)
-                )
-
-                if isinstance(subject, Concept):
-                    for _s, p, o in subject._to_graph().triples((None, None, None)):
-                        self._g.add((_subject, p, o))
+    def _modelelements_to_graph(
+        self: InformationModel,
+        workers: Optional[int] = None,
+        shallow: bool = False,
+        limits: Optional[Limits] = None,
+    ) -> None:
 
-                self._g.add(
-                    (
-                        URIRef(self.identifier),
-                        DCTERMS.subject,
-                        _subject,
-                    )
-                )
+        if getattr(self, "modelelements", None):
 
-    def _modelelements_to_graph(self: InformationModel) -> None:
+            identifiers: Tuple[str, ...] = ()
+            if shallow:
+                identifiers = self._shallow_modelelements()
 
-        if getattr(self, "modelelements", None):
+            if workers is not None and workers > 1:
+                self._modelelements_in_parallel_to_graph(workers, identifiers, limits)
 
             for modelelement in self._modelelements:
 
                 if isinstance(modelelement, ModelElement):
 
-                    if not getattr(modelelement, "identifier", None):
-                        modelelement.identifier = Skolemizer.add_skolemization()
+                    skolemize(modelelement)
 
-                    _modelelement = URIRef(modelelement.identifier)
+                    _modelelement = iri(modelelement.identifier)
 
-                    for _s, p, o in modelelement._to_graph().triples(
-                        (None, None, None)
-                    ):
-                        self._g.add((_s, p, o))
+                    if id(modelelement) not in self._visited:
+                        self._visited[id(modelelement)] = _modelelement
+                        follow(
+                            modelelement,
+                            partial(
+                                modelelement._cached_to_graph, self._g, self._visited
+                            ),
+                        )
 
                 elif isinstance(modelelement, str):
-                    _modelelement = URIRef(modelelement)
+                    _modelelement = iri(modelelement)
 
                 self._g.add(
                     (
-                        URIRef(self.identifier),
+                        iri(self.identifier),
                         MODELLDCATNO.containsModelElement,
                         _modelelement,
                     )
                 )
 
+    def _shallow_modelelements(self: InformationModel) -> Tuple[str, ...]:
+        # Model elements are referred to by identifier, within this process or not:
+        modelelements = [
+            modelelement
+            for modelelement in self._modelelements
+            if isinstance(modelelement, ModelElement)
+        ]
+        for modelelement in modelelements:
+            skolemize(modelelement)
+        identifiers = tuple(modelelement.identifier for modelelement in modelelements)
+        shallow_references(identifiers)
+
+        return identifiers
+
+    def _modelelements_in_parallel_to_graph(
+        self: InformationModel,
+        workers: int,
+        shallow: Tuple[str, ...] = (),
+        limits: Optional[Limits] = None,
+    ) -> None:
+
+        modelelements = [
+            modelelement
+            for modelelement in self._modelelements
+            if isinstance(modelelement, ModelElement)
+            and id(modelelement) not in self._visited
+        ]
+        if not modelelements:
+            return
+
+        size = -(-len(modelelements) // workers)
+        partitions = [
+            modelelements[i : i + size] for i in range(0, len(modelelements), size)
+        ]
+        # Pickled with the partition, so that the objects labelled are the same:
+        labels = [_skolemize_all(partition) for partition in partitions]
+        # Checked before the model elements are pickled for the workers, as
+        # pickling follows the references recursively:
+        if limits is not None and limits.depth is not None:
+            _check_depth(modelelements, limits.depth, (self.identifier,))
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # The triples are returned in the order of the partitions:
+            for triples in executor.map(
+                partial(
+                    _modelelements_to_triples,
+                    shallow=shallow,
+                    limits=limits,
+                    path=(self.identifier,),
+                ),
+                partitions,
+                labels,
+            ):
+                for triple in triples:
+                    self._g.add(triple)
+
+        for modelelement in modelelements:
+            self._visited[id(modelelement)] = iri(modelelement.identifier)
+
     def _licensedocument_to_graph(self: InformationModel) -> None:
 
         if getattr(self, "licensedocument", None):
 
             if isinstance(self.licensedocument, LicenseDocument):
 
-                if not getattr(self.licensedocument, "identifier", None):
-                    self.licensedocument.identifier = Skolemizer.add_skolemization()
+                skolemize(self.licensedocument)
 
-                _licensedocument = URIRef(self.licensedocument.identifier)
+                _licensedocument = iri(self.licensedocument.identifier)
 
-                for _s, p, o in self.licensedocument._to_graph().triples(
-                    (None, None, None)
-                ):
-                    self._g.add((_s, p, o))
+                if id(self.licensedocument) not in self._visited:
+                    self.licensedocument._to_graph(g=self._g, visited=self._visited)
 
             elif isinstance(self.licensedocument, str):
-                _licensedocument = URIRef(self.licensedocument)
+                _licensedocument = iri(self.licensedocument)
 
-            self._g.add((URIRef(self.identifier), DCTERMS.license, _licensedocument))
+            self._g.add((iri(self.identifier), DCTERMS.license, _licensedocument))
 
     def _replaces_to_graph(self: InformationModel) -> None:
         if getattr(self, "replaces", None):
@@ -659,17 +957,17 @@ class InformationModel(Resource, Standard):
             for replaces in self._replaces:
 
                 if isinstance(replaces, InformationModel):
-                    _replaces = URIRef(replaces.identifier)
+                    _replaces = iri(replaces.identifier)
 
-                    for _s, p, o in replaces._to_graph().triples((None, None, None)):
-                        self._g.add((_replaces, p, o))
+                    if id(replaces) not in self._visited:
+                        replaces._to_graph(g=self._g, visited=self._visited)
 
                 elif isinstance(replaces, str):
-                    _replaces = URIRef(replaces)
+                    _replaces = iri(replaces)
 
                 self._g.add(
                     (
-                        URIRef(self.identifier),
+                        iri(self.identifier),
                         DCTERMS.replaces,
                         _replaces,
                     )
@@ -681,19 +979,17 @@ class InformationModel(Resource, Standard):
             for is_replaced_by in self._is_replaced_by:
 
                 if isinstance(is_replaced_by, InformationModel):
-                    _is_replaced_by = URIRef(is_replaced_by.identifier)
+                    _is_replaced_by = iri(is_replaced_by.identifier)
 
-                    for _s, p, o in is_replaced_by._to_graph().triples(
-                        (None, None, None)
-                    ):
-                        self._g.add((_is_replaced_by, p, o))
+                    if id(is_replaced_by) not in self._visited:
+                        is_replaced_by._to_graph(g=self._g, visited=self._visited)
 
                 elif isinstance(is_replaced_by, str):
-                    _is_replaced_by = URIRef(is_replaced_by)
+                    _is_replaced_by = iri(is_replaced_by)
 
                 self._g.add(
                     (
-                        URIRef(self.identifier),
+                        iri(self.identifier),
                         DCTERMS.isReplacedBy,
                         _is_replaced_by,
                     )
@@ -705,17 +1001,17 @@ class InformationModel(Resource, Standard):
             for has_part in self._has_part:
 
                 if isinstance(has_part, InformationModel):
-                    _has_part = URIRef(has_part.identifier)
+                    _has_part = iri(has_part.identifier)
 
-                    for _s, p, o in has_part._to_graph().triples((None, None, None)):
-                        self._g.add((_has_part, p, o))
+                    if id(has_part) not in self._visited:
+                        has_part._to_graph(g=self._g, visited=self._visited)
 
                 elif isinstance(has_part, str):
-                    _has_part = URIRef(has_part)
+                    _has_part = iri(has_part)
 
                 self._g.add(
                     (
-                        URIRef(self.identifier),
+                        iri(self.identifier),
                         DCTERMS.hasPart,
                         _has_part,
                     )
@@ -727,39 +1023,37 @@ class InformationModel(Resource, Standard):
             for is_part_of in self._is_part_of:
 
                 if isinstance(is_part_of, InformationModel):
-                    _is_part_of = URIRef(is_part_of.identifier)
+                    _is_part_of = iri(is_part_of.identifier)
 
-                    for _s, p, o in is_part_of._to_graph().triples((None, None, None)):
-                        self._g.add((_is_part_of, p, o))
+                    if id(is_part_of) not in self._visited:
+                        is_part_of._to_graph(g=self._g, visited=self._visited)
 
                 elif isinstance(is_part_of, str):
-                    _is_part_of = URIRef(is_part_of)
+                    _is_part_of = iri(is_part_of)
 
                 self._g.add(
                     (
-                        URIRef(self.identifier),
+                        iri(self.identifier),
                         DCTERMS.isPartOf,
                         _is_part_of,
                     )
                 )
 
-    def _homepage_to_graph(self: InformationModel) -> None:
-        if getattr(self, "homepage", None):
-            self._g.add((URIRef(self.identifier), FOAF.homepage, URIRef(self.homepage)))
-
     def _contactpoints_to_graph(self: InformationModel) -> None:
         if getattr(self, "contactpoints", None):
 
-            for contactpoint in self._contactpoints:
+            for i, contactpoint in enumerate(self._contactpoints):
 
-                _contactpoint = BNode()
+                _contactpoint = blank_node(self.identifier, DCAT.contactPoint, str(i))
 
-                for _s, p, o in contactpoint._to_graph().triples((None, None, None)):
+                for _s, p, o in relabel_blank_nodes(
+                    foreign_triples(contactpoint), str(_contactpoint)
+                ):
                     self._g.add((_contactpoint, p, o))
 
                 self._g.add(
                     (
-                        URIRef(self.identifier),
+                        iri(self.identifier),
                         DCAT.contactPoint,
                         _contactpoint,
                     )
@@ -768,84 +1062,27 @@ class InformationModel(Resource, Standard):
     def _locations_to_graph(self: InformationModel) -> None:
         if getattr(self, "locations", None):
 
-            for location in self._locations:
+            for i, location in enumerate(self._locations):
 
                 if isinstance(location, str):
-                    self._g.add(
-                        (URIRef(self.identifier), DCTERMS.spatial, URIRef(location))
-                    )
+                    self._g.add((iri(self.identifier), DCTERMS.spatial, iri(location)))
 
                 else:
-                    _location = BNode()
+                    _location = blank_node(self.identifier, DCTERMS.spatial, str(i))
 
-                    for _s, p, o in location._to_graph().triples((None, None, None)):
+                    for _s, p, o in relabel_blank_nodes(
+                        foreign_triples(location), str(_location)
+                    ):
                         self._g.add((_location, p, o))
 
                     self._g.add(
                         (
-                            URIRef(self.identifier),
+                            iri(self.identifier),
                             DCTERMS.spatial,
                             _location,
                         )
                     )
 
-    def _modified_to_graph(self: InformationModel) -> None:
-        if getattr(self, "modified", None):
-            self._g.add(
-                (
-                    URIRef(self.identifier),
-                    DCTERMS.modified,
-                    Literal(self.modified, datatype=XSD.date),
-                )
-            )
-
-    def _dct_type_to_graph(self: InformationModel) -> None:
-        if getattr(self, "dct_type", None):
-
-            if isinstance(self.dct_type, Concept):
-                _dct_type = URIRef(self.dct_type.identifier)
-
-                for _s, p, o in self.dct_type._to_graph().triples((None, None, None)):
-                    self._g.add((_dct_type, p, o))
-
-            elif isinstance(self.dct_type, str):
-                _dct_type = URIRef(self.dct_type)
-
-            self._g.add(
-                (
-                    URIRef(self.identifier),
-                    DCTERMS.type,
-                    _dct_type,
-                )
-            )
-
-    def _version_note_to_graph(self: InformationModel) -> None:
-        if getattr(self, "version_note", None):
-
-            for key in self.version_note:
-                self._g.add(
-                    (
-                        URIRef(self.identifier),
-                        ADMS.versionNotes,
-                        Literal(self.version_note[key], lang=key),
-                    )
-                )
-
-    def _status_to_graph(self: InformationModel) -> None:
-
-        if getattr(self, "status", None):
-
-            if isinstance(self.status, Concept):
-                _status = URIRef(self.status.identifier)
-
-                for _s, p, o in self.status._to_graph().triples((None, None, None)):
-                    self._g.add((_status, p, o))
-
-            elif isinstance(self.status, str):
-                _status = URIRef(self.status)
-
-            self._g.add((URIRef(self.identifier), ADMS.status, _status))
-
     def _has_formats_to_graph(self: InformationModel) -> None:
 
         if getattr(self, "has_format", None):
@@ -854,20 +1091,19 @@ class InformationModel(Resource, Standard):
 
                 if isinstance(has_format, FoafDocument):
 
-                    if not getattr(has_format, "identifier", None):
-                        has_format.identifier = Skolemizer.add_skolemization()
+                    skolemize(has_format)
 
-                    _has_format = URIRef(has_format.identifier)
+                    _has_format = iri(has_format.identifier)
 
-                    for _s, p, o in has_format._to_graph().triples((None, None, None)):
-                        self._g.add((_s, p, o))
+                    if id(has_format) not in self._visited:
+                        has_format._to_graph(g=self._g, visited=self._visited)
 
                 elif isinstance(has_format, str):
-                    _has_format = URIRef(has_format)
+                    _has_format = iri(has_format)
 
                 self._g.add(
                     (
-                        URIRef(self.identifier),
+                        iri(self.identifier),
                         DCTERMS.hasFormat,
                         _has_format,
                     )
@@ -876,16 +1112,18 @@ class InformationModel(Resource, Standard):
     def _temporals_to_graph(self: InformationModel) -> None:
         if getattr(self, "temporal", None):
 
-            for temporal in self._temporal:
+            for i, temporal in enumerate(self._temporal):
 
-                _temporal = BNode()
+                _temporal = blank_node(self.identifier, DCTERMS.temporal, str(i))
 
-                for _s, p, o in temporal._to_graph().triples((None, None, None)):
+                for _s, p, o in relabel_blank_nodes(
+                    foreign_triples(temporal), str(_temporal)
+                ):
                     self._g.add((_temporal, p, o))
 
                 self._g.add(
                     (
-                        URIRef(self.identifier),
+                        iri(self.identifier),
                         DCTERMS.temporal,
                         _temporal,
                     )
@@ -895,26 +1133,439 @@ class InformationModel(Resource, Standard):
         if getattr(self, "_conforms_to", None):
 
             _conforms_to = (
-                URIRef(self.conforms_to.identifier)
+                iri(self.conforms_to.identifier)
                 if isinstance(self.conforms_to, Standard)
-                else URIRef(self.conforms_to)
+                else iri(self.conforms_to)
             )
 
             if isinstance(self.conforms_to, Standard):
-                for _s, p, o in self.conforms_to._to_graph().triples(
-                    (None, None, None)
-                ):
-                    self._g.add((_conforms_to, p, o))
+                if id(self.conforms_to) not in self._visited:
+                    self.conforms_to._to_graph(g=self._g, visited=self._visited)
+
+            self._g.add((iri(self.identifier), DCTERMS.conformsTo, _conforms_to))
+
+
+_TRANSIENT_ATTRIBUTES = (
+    "_g",
+    "_visited",
+    "_dirty",
+    "_triples",
+    "_references",
+    "_cache",
+)
+
+
+class _CachedMapping(SchemaMapping):
+    """Base class for objects keeping the triples they were last mapped to.
+
+    Setting an attribute marks the object as dirty, and a list or dict
+    attribute that has changed in place since the object was last mapped,
+    e.g. through another name, makes it dirty as well: the lists and dicts
+    are kept as they are set, and copies of them are kept with the cache to
+    compare to. When an object that is not dirty is mapped again
+    incrementally, and its references are mapped to the same nodes as
+    before, its triples are added from the cache instead of being mapped
+    anew. Objects referring to a Concept are always mapped anew, as
+    changes to the concept cannot be tracked.
+    """
+
+    __slots__ = ("_dirty", "_cache")
+
+    _g = MappingState("_g")
+    _visited = MappingState("_visited")
+    _triples = MappingState("_triples")
+    _references = MappingState("_references")
+    _to_graph: Callable[..., Graph]
+    _dirty: bool
+    _cache: Tuple[
+        Node,
+        Tuple[Tuple[Node, Node, Node], ...],
+        Tuple[Tuple[_CachedMapping, Node], ...],
+        Tuple[Tuple[str, object], ...],
+    ]
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """Marks the object as dirty when an attribute is set."""
+        if name not in _TRANSIENT_ATTRIBUTES:
+            object.__setattr__(self, "_dirty", True)
+        object.__setattr__(self, name, value)
+
+    def content_hash(self) -> str:
+        """Returns a hash of the canonical N-Triples of the object.
+
+        Returns:
+            the sha256 hex digest of the sorted N-Triples.
+        """
+        return _content_hash(self._to_graph)
+
+    def __getstate__(self) -> Dict[str, object]:
+        """Returns the state to pickle, leaving out the state of mappings."""
+        return {
+            name: value
+            for name, value in _attributes(self).items()
+            if name not in _TRANSIENT_ATTRIBUTES
+        }
+
+    def __setstate__(self, state: Dict[str, object]) -> None:
+        """Sets the pickled state."""
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    def _add(self, triple: Tuple[Node, Node, Node]) -> None:
+        self._g.add(triple)
+        self._triples.append(triple)
+
+    def _reference_to_graph(
+        self, reference: Union[_CachedMapping, CodeElementColumns]
+    ) -> None:
+        self._references.append(reference)
+        self._map_reference(reference)
+
+    def _map_reference(
+        self, reference: Union[_CachedMapping, CodeElementColumns]
+    ) -> Node:
+        if id(reference) in self._visited:
+            return self._visited[id(reference)]
+        # Mapped on its own, e.g. as a model element of the information model:
+        if is_shallow(reference):
+            return iri(reference.identifier)  # type: ignore
+
+        # Mapped after this object, so that deep chains of references do not
+        # exhaust the stack:
+        if isinstance(reference, CodeElementColumns):
+            _reference = iri(reference._in_scheme.identifier)
+        else:
+            skolemize(reference)
+            _reference = iri(reference.identifier)  # type: ignore
+        self._visited[id(reference)] = _reference
+        follow(reference, partial(reference._cached_to_graph, self._g, self._visited))
+
+        return _reference
+
+    def _cached_to_graph(self, g: TripleSink, visited: Dict[int, Node]) -> None:
+        self._g = g
+        self._visited = visited
+
+        # Not from the cache when referred to by another node, e.g. a label:
+        if not self._from_cache(self._map_reference, visited[id(self)]):
+            self._to_graph(g=g, visited=visited)
+            self._to_cache()
+
+    def _from_cache(
+        self,
+        map_reference: Callable[[_CachedMapping], Node],
+        selfobject: Optional[Node] = None,
+    ) -> bool:
+        if (
+            not is_incremental()
+            or getattr(self, "_dirty", True)
+            or isinstance(getattr(self, "_subject", None), Concept)
+        ):
+            return False
+
+        _self, triples, references, contents = self._cache
+        if selfobject is not None and selfobject != _self:
+            return False
+        # Changed in place, which cannot be tracked without copying the lists
+        # and dicts when set, and so losing changes made through other names:
+        for name, content in contents:
+            if getattr(self, name) != content:
+                return False
+
+        self._visited[id(self)] = _self
+        for reference, _reference in references:
+            if map_reference(reference) != _reference:
+                return False
+
+        for triple in triples:
+            self._g.add(triple)
+
+        return True
+
+    def _to_cache(self) -> None:
+        if not is_incremental():
+            # Released, as it is of no use to mappings that are not incremental:
+            if hasattr(self, "_cache"):
+                del self._cache
+            return
+
+        # Kept as tuples, which are not over-allocated as the lists are. The
+        # references are all mapped, or shallow, by now:
+        self._cache = (
+            self._visited[id(self)],
+            tuple(self._triples),
+            tuple(
+                (reference, self._map_reference(reference))
+                for reference in self._references
+            ),
+            tuple(
+                (name, copy(value))
+                for name, value in _attributes(self).items()
+                if isinstance(value, (list, dict)) and name not in _TRANSIENT_ATTRIBUTES
+            ),
+        )
+        self._dirty = False
+
+
+def _attributes(modelobject: object) -> Dict[str, object]:
+    """Returns the attributes set on the object, by name."""
+    attributes = dict(getattr(modelobject, "__dict__", {}))
+    for cls in type(modelobject).__mro__:
+        slots = cls.__dict__.get("__slots__", ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            try:
+                attributes[name] = object.__getattribute__(modelobject, name)
+            except AttributeError:
+                pass
+
+    return attributes
+
+
+def _release(modelobject: object) -> None:
+    """Removes the state of mappings from the object and the objects it refers to."""
+    pending = [modelobject]
+    seen = set()
+    while pending:
+        modelobject = pending.pop()
+        if id(modelobject) in seen:
+            continue
+        seen.add(id(modelobject))
+
+        # Objects of other libraries, e.g. concepts and agents, rely on their graph:
+        if not type(modelobject).__module__.startswith("modelldcatnotordf"):
+            continue
+
+        attributes = _attributes(modelobject)
+        for name in _TRANSIENT_ATTRIBUTES:
+            if name in attributes:
+                delattr(modelobject, name)
+
+        for value in attributes.values():
+            for item in value if isinstance(value, list) else [value]:
+                if hasattr(item, "_to_graph"):
+                    pending.append(item)
+
+
+def _check_depth(
+    modelelements: Sequence[ModelElement], depth: int, path: Tuple[str, ...]
+) -> None:
+    """Raises a MappingLimitError if an object is referred to deeper than depth."""
+    # Walked level by level, in the order the mapping follows the references:
+    level: List[Tuple[object, Tuple[str, ...]]] = [
+        (modelelement, path + (modelelement.identifier,))
+        for modelelement in modelelements
+    ]
+    seen = {id(modelelement) for modelelement in modelelements}
+    for _ in range(depth):
+        references = []
+        for modelobject, _path in level:
+            for name, value in _attributes(modelobject).items():
+                if name in _TRANSIENT_ATTRIBUTES:
+                    continue
+                for item in value if isinstance(value, list) else [value]:
+                    if (
+                        hasattr(item, "_cached_to_graph")
+                        and id(item) not in seen
+                        and not is_shallow(item)
+                    ):
+                        seen.add(id(item))
+                        identifier = getattr(item, "identifier", None)
+                        references.append(
+                            (item, _path + (identifier or type(item).__name__,))
+                        )
+        level = references
+
+    if level:
+        raise MappingLimitError("depth", depth, level[0][1])
+
+
+def serialize(
+    to_graph: Callable[..., Graph], format: str, encoding: Optional[str]
+) -> bytes:
+    """Maps by to_graph and serializes the triples, writing some formats directly.
+
+    Turtle, JSON-LD and canonical N-Triples are written by a writer passed
+    to to_graph as the graph to add the triples to, the other formats are
+    serialized from the graph returned by to_graph.
+
+    Args:
+        to_graph: the function mapping the triples into the graph g given
+        format: a valid format
+        encoding: the encoding to serialize into
+
+    Returns:
+        the serialization
+    """
+    writers: Dict[str, Callable[[], Writer]] = {
+        "turtle": TurtleWriter,
+        "json-ld": JsonLdWriter,
+        CANONICAL: SortedNTriplesWriter,
+    }
+    if format in writers:
+        writer = writers[format]()
+        to_graph(g=writer)
+        return writer.getvalue(encoding)  # type: ignore
+
+    return to_graph().serialize(format=format, encoding=encoding)  # type: ignore
+
+
+def _content_hash(to_graph: Callable[..., Graph]) -> str:
+    """Returns the sha256 hex digest of the canonical N-Triples of an object."""
+    return hashlib.sha256(serialize(to_graph, CANONICAL, "utf-8")).hexdigest()
+
+
+def _skolemize_all(
+    modelobjects: Sequence[_CachedMapping],
+) -> List[Tuple[_CachedMapping, str]]:
+    """Gives the objects, and all objects they refer to, an identifier."""
+    # The objects labelled in the mapping in progress, with their labels:
+    labels = []
+    pending = list(modelobjects)
+    seen = set()
+    while pending:
+        modelobject = pending.pop()
+        if id(modelobject) in seen:
+            continue
+        seen.add(id(modelobject))
+
+        try:
+            labels.append((modelobject, labelled(modelobject)))
+        except AttributeError:
+            # Code elements without identifier are mapped to blank nodes:
+            if not isinstance(modelobject, CodeElement):
+                skolemize(modelobject)
+
+        for value in modelobject.__getstate__().values():
+            for item in value if isinstance(value, list) else [value]:
+                if isinstance(item, _CachedMapping):
+                    pending.append(item)
+
+    return labels
+
+
+def _label_by_content(informationmodel: InformationModel) -> None:
+    """Labels the objects of the model by identifiers of content and position."""
+
+    def identify(modelobject: object, *path: str) -> None:
+        if not getattr(modelobject, "identifier", None):
+            label(modelobject, skolemization(*path))
+
+    identify(informationmodel, _content(informationmodel))
+    pending: List[object] = [informationmodel]
+    seen = {id(informationmodel)}
+    while pending:
+        modelobject = pending.pop()
+        attributes = _attributes(modelobject)
+        for name in sorted(set(attributes) - set(_TRANSIENT_ATTRIBUTES)):
+            value = attributes[name]
+            for i, item in enumerate(value if isinstance(value, list) else [value]):
+                if id(item) in seen or not _skolemizable(item):
+                    continue
+                seen.add(id(item))
+                identify(
+                    item,
+                    getattr(modelobject, "identifier"),
+                    name,
+                    str(i),
+                    _content(item),
+                )
+                if not isinstance(item, Agent):
+                    pending.append(item)
+
+
+def _skolemizable(modelobject: object) -> bool:
+    """Returns whether the mapping would give the object a skolemized identifier."""
+    # Agents of datacatalogtordf skolemize themselves, while code elements
+    # without identifier are mapped to blank nodes:
+    return isinstance(modelobject, Agent) or (
+        hasattr(modelobject, "_to_graph")
+        and type(modelobject).__module__.startswith("modelldcatnotordf")
+        and not isinstance(modelobject, CodeElement)
+    )
+
+
+def _content(modelobject: object) -> str:
+    """Returns the type and the literal attributes of the object as text."""
+    content = [type(modelobject).__name__]
+    for name, value in sorted(_attributes(modelobject).items()):
+        if name in _TRANSIENT_ATTRIBUTES:
+            continue
+        if isinstance(value, dict):
+            content.append(f"{name}={sorted(value.items())!r}")
+        elif isinstance(value, (str, int, float)) or (
+            isinstance(value, list) and all(isinstance(item, str) for item in value)
+        ):
+            content.append(f"{name}={value!r}")
+
+    return "\n".join(content)
 
-            self._g.add((URIRef(self.identifier), DCTERMS.conformsTo, _conforms_to))
 
+class _CountingSink:
+    """A sink counting the triples added to it against the limits."""
 
-class ModelElement(ABC):
+    __slots__ = ("_sink",)
+
+    def __init__(self, sink: TripleSink) -> None:
+        """Inits the sink adding the triples to sink."""
+        self._sink = sink
+
+    def add(self, triple: Tuple[Node, Node, Node]) -> None:
+        """Counts the triple and adds it.
+
+        Args:
+            triple: the triple to add
+        """
+        count_triples(1)
+        self._sink.add(triple)
+
+
+class _Triples(List[Tuple[Node, Node, Node]]):
+    """A list of the triples added to it, e.g. returned by a worker process."""
+
+    __slots__ = ()
+
+    def add(self, triple: Tuple[Node, Node, Node]) -> None:
+        """Adds the triple.
+
+        Args:
+            triple: the triple to add
+        """
+        self.append(triple)
+
+
+@mapping
+def _modelelements_to_triples(
+    modelelements: List[ModelElement],
+    labels: Sequence[Tuple[object, str]] = (),
+    shallow: Tuple[str, ...] = (),
+    limits: Optional[Limits] = None,
+    path: Tuple[str, ...] = (),
+) -> _Triples:
+    """Maps a partition of model elements to triples in a worker process."""
+    for modelobject, identifier in labels:
+        label(modelobject, identifier)
+    shallow_references(shallow)
+    if limits is not None:
+        limit(limits, *path)
+    # Returned as terms, keeping the labels of the blank nodes:
+    triples = _Triples()
+    g: TripleSink = triples if limits is None else _CountingSink(triples)
+    visited: Dict[int, Node] = {}
+
+    for modelelement in modelelements:
+        if id(modelelement) not in visited:
+            visited[id(modelelement)] = iri(modelelement.identifier)
+            follow(modelelement, partial(modelelement._cached_to_graph, g, visited))
+    map_followed()
+
+    return triples
+
+
+class ModelElement(_CachedMapping, ABC):
     """A class representing a modelldcatno:ModelElement."""
 
     __slots__ = (
         "_type",
-        "_g",
         "_title",
         "_identifier",
         "_has_property",
@@ -924,7 +1575,7 @@ class ModelElement(ABC):
         "_description",
     )
 
-    _g: Graph
+    _visited: Dict[int, Node]
     _title: dict
     _identifier: URI
     _dct_identifier: str
@@ -933,6 +1584,15 @@ class ModelElement(ABC):
     _belongs_to_module: List[Union[Module, URI]]
     _description: dict
 
+    _schema: Tuple[Field, ...] = (
+        Field("_title", DCTERMS.title, LANGUAGE),
+        Field("_dct_identifier", DCTERMS.identifier, LITERAL),
+        Field("_has_property", MODELLDCATNO.hasProperty, REFERENCE, many=True),
+        Field("_belongs_to_module", MODELLDCATNO.belongsToModule, REFERENCE, many=True),
+        Field("_description", DCTERMS.description, LANGUAGE),
+        Field("_subject", DCTERMS.subject, CONCEPT),
+    )
+
     @abstractmethod
     def __init__(self) -> None:
         """Inits an object with default values."""
@@ -942,12 +1602,16 @@ class ModelElement(ABC):
     @property
     def identifier(self) -> str:
         """Get for identifier."""
-        return self._identifier
+        try:
+            return self._identifier
+        except AttributeError:
+            # Labelled in the mapping in progress, unless set:
+            return labelled(self)
 
     @identifier.setter
     def identifier(self, identifier: str) -> None:
         """Set for identifier."""
-        self._identifier = URI(identifier)
+        self._identifier = uri(identifier)
 
     @property
     def dct_identifier(self) -> str:
@@ -1021,145 +1685,59 @@ class ModelElement(ABC):
 
         """
 
+    def to_ntriples_stream(self: ModelElement, fileobj: IO[bytes]) -> None:
+        """Maps the modelelement to rdf and writes it as N-Triples to fileobj.
+
+        The triples are written while the modelelement is mapped,
+        without collecting them in a graph first.
+
+        Args:
+            fileobj: a binary file object to write to
+        """
+        self._to_graph(g=NTriplesWriter(fileobj))
+
     def _to_graph(
         self,
-        type: str = MODELLDCATNO.ModelElement,
-        selfobject: URIRef = None,
+        type: URIRef = MODELLDCATNO.ModelElement,
+        selfobject: Optional[URIRef] = None,
+        g: Optional[TripleSink] = None,
+        visited: Optional[Dict[int, Node]] = None,
     ) -> Graph:
         """Returns the modelelement as graph.
 
          Args:
             type: type for identifying class. Default: MODELLDCATNO.ModelElement
-            selfobject: a URIRef passed from a subclass Default: None
+            selfobject: a URIRef passed from a subclass Default: the identifier
+            g: a graph to add the triples to. Default: None
+            visited: nodes of objects already added to the graph. Default: None
 
         Returns:
             the modelelement graph
         """
         # Set up graph and namespaces:
-        self._g = Graph()
-        self._g.bind("modelldcatno", MODELLDCATNO)
-        self._g.bind("dct", DCTERMS)
-        self._g.bind("dcat", DCAT)
-        self._g.bind("skos", SKOS)
-        self._g.bind("xsd", XSD)
-
-        self._g.add((selfobject, RDF.type, type))
-
-        if getattr(self, "title", None):
-            for key in self.title:
-                self._g.add(
-                    (
-                        selfobject,
-                        DCTERMS.title,
-                        Literal(self.title[key], lang=key),
-                    )
-                )
-
-        if getattr(self, "dct_identifier", None):
-            self._g.add((selfobject, DCTERMS.identifier, Literal(self.dct_identifier)))
-
-        if getattr(self, "has_property", None):
-            self._has_property_to_graph(selfobject)
+        self._g = bind_prefixes(Graph()) if g is None else g
+        self._visited = {} if visited is None else visited
+        self._triples = []
+        self._references = []
 
-        self._belongs_to_module_to_graph(selfobject)
-        self._description_to_graph(selfobject)
-        self._subjet_to_graph(selfobject)
+        _self = iri(self.identifier) if selfobject is None else selfobject
+        self._visited[id(self)] = _self
+        self._add((_self, RDF.type, type))
+        self._emit(self, _self)
 
         return self._g
 
-    def _subjet_to_graph(self: ModelElement, selfobject: URIRef) -> None:
-
-        if getattr(self, "subject", None):
-
-            if isinstance(self.subject, Concept):
-                _subject = URIRef(self.subject.identifier)
-
-                for _s, p, o in self.subject._to_graph().triples((None, None, None)):
-                    self._g.add((_subject, p, o))
-
-            elif isinstance(self.subject, str):
-                _subject = URIRef(self.subject)
-
-            self._g.add((selfobject, DCTERMS.subject, _subject))
-
-    def _belongs_to_module_to_graph(self: ModelElement, selfobject: URIRef) -> None:
-        if getattr(self, "belongs_to_module", None):
-            for belongs_to_module in self._belongs_to_module:
-
-                if isinstance(belongs_to_module, Module):
-
-                    if not getattr(belongs_to_module, "identifier", None):
-                        belongs_to_module.identifier = Skolemizer.add_skolemization()
-
-                    _belongs_to_module = URIRef(belongs_to_module.identifier)
-
-                    for _s, p, o in belongs_to_module._to_graph().triples(
-                        (None, None, None)
-                    ):
-                        self._g.add((_s, p, o))
-
-                elif isinstance(belongs_to_module, str):
-                    _belongs_to_module = URIRef(belongs_to_module)
-
-                self._g.add(
-                    (
-                        selfobject,
-                        MODELLDCATNO.belongsToModule,
-                        _belongs_to_module,
-                    )
-                )
-
-    def _description_to_graph(self: ModelElement, selfobject: URIRef) -> None:
-        if getattr(self, "description", None):
-            for key in self.description:
-                self._g.add(
-                    (
-                        selfobject,
-                        DCTERMS.description,
-                        Literal(self.description[key], lang=key),
-                    )
-                )
-
-    def _has_property_to_graph(self, _self: URIRef) -> None:
-        if getattr(self, "has_property", None):
-            for has_property in self._has_property:
-
-                if isinstance(has_property, ModelProperty):
-
-                    if not getattr(has_property, "identifier", None):
-                        has_property.identifier = Skolemizer.add_skolemization()
-
-                    _has_property = URIRef(has_property.identifier)
-
-                    for _s, p, o in has_property._to_graph().triples(
-                        (None, None, None)
-                    ):
-                        self._g.add((_s, p, o))
-
-                elif isinstance(has_property, str):
-                    _has_property = URIRef(has_property)
-
-                self._g.add(
-                    (
-                        _self,
-                        MODELLDCATNO.hasProperty,
-                        _has_property,
-                    )
-                )
-
 
-class ModelProperty(ABC):
+class ModelProperty(_CachedMapping, ABC):
     """A class representing a modelldcatno:Property."""
 
     __slots__ = (
         "_type",
-        "_g",
         "_title",
         "_identifier",
         "_has_type",
         "_min_occurs",
         "_max_occurs",
-        "_title",
         "_subject",
         "_description",
         "_belongs_to_module",
@@ -1169,7 +1747,7 @@ class ModelProperty(ABC):
         "_navigable",
     )
 
-    _g: Graph
+    _visited: Dict[int, Node]
     _identifier: URI
     _has_type: List[Union[ModelElement, URI]]
     _min_occurs: int
@@ -1183,6 +1761,27 @@ class ModelProperty(ABC):
     _sequence_number: int
     _navigable: bool
 
+    _schema: Tuple[Field, ...] = (
+        Field("_has_type", MODELLDCATNO.hasType, REFERENCE, many=True),
+        Field(
+            "_sequence_number",
+            MODELLDCATNO.sequenceNumber,
+            LITERAL,
+            datatype=XSD.positiveInteger,
+            zero=True,
+        ),
+        # minOccurs and maxOccurs are not part of the rdflib XSD namespace:
+        Field("_min_occurs", URIRef(f"{XSD}minOccurs"), LITERAL, zero=True),
+        Field("_max_occurs", URIRef(f"{XSD}maxOccurs"), CARDINALITY, zero=True),
+        Field("_title", DCTERMS.title, LANGUAGE),
+        Field("_navigable", MODELLDCATNO.navigable, LITERAL, datatype=XSD.boolean),
+        Field("_subject", DCTERMS.subject, CONCEPT),
+        Field("_description", DCTERMS.description, LANGUAGE),
+        Field("_belongs_to_module", MODELLDCATNO.belongsToModule, REFERENCE, many=True),
+        Field("_forms_symmetry_with", MODELLDCATNO.formsSymmetryWith, REFERENCE),
+        Field("_relation_property_label", MODELLDCATNO.relationPropertyLabel, LANGUAGE),
+    )
+
     @abstractmethod
     def __init__(self) -> None:
         """Inits an object with default values."""
@@ -1222,12 +1821,16 @@ class ModelProperty(ABC):
     @property
     def identifier(self) -> str:
         """Get for identifier."""
-        return self._identifier
+        try:
+            return self._identifier
+        except AttributeError:
+            # Labelled in the mapping in progress, unless set:
+            return labelled(self)
 
     @identifier.setter
     def identifier(self, identifier: str) -> None:
         """Set for identifier."""
-        self._identifier = URI(identifier)
+        self._identifier = uri(identifier)
 
     @property
     def min_occurs(self) -> int:
@@ -1245,7 +1848,7 @@ class ModelProperty(ABC):
         return self._max_occurs
 
     @max_occurs.setter
-    def max_occurs(self, max_occurs: str) -> None:
+    def max_occurs(self, max_occurs: Union[int, str]) -> None:
         """Set for max_occurs."""
         self._max_occurs = max_occurs
 
@@ -1326,229 +1929,71 @@ class ModelProperty(ABC):
             encoding: the encoding to serialize into
         """
 
+    def to_ntriples_stream(self: ModelProperty, fileobj: IO[bytes]) -> None:
+        """Maps the property to rdf and writes it as N-Triples to fileobj.
+
+        The triples are written while the property is mapped,
+        without collecting them in a graph first.
+
+        Args:
+            fileobj: a binary file object to write to
+        """
+        self._to_graph(g=NTriplesWriter(fileobj))
+
     def _to_graph(
         self,
-        type: str = MODELLDCATNO.Property,
-        selfobject: URIRef = None,
+        type: URIRef = MODELLDCATNO.Property,
+        selfobject: Optional[URIRef] = None,
+        g: Optional[TripleSink] = None,
+        visited: Optional[Dict[int, Node]] = None,
     ) -> Graph:
         """Returns the property as graph.
 
         Args:
             type: type for identifying class. Default: MODELLDCATNO.Property
-            selfobject: a URIRef passed from a subclass Default: None
+            selfobject: a URIRef passed from a subclass Default: the identifier
+            g: a graph to add the triples to. Default: None
+            visited: nodes of objects already added to the graph. Default: None
 
         Returns:
             the property graph
         """
         # Set up graph and namespaces:
-        self._g = Graph()
-        self._g.bind("modelldcatno", MODELLDCATNO)
-        self._g.bind("dct", DCTERMS)
-        self._g.bind("skos", SKOS)
+        self._g = bind_prefixes(Graph()) if g is None else g
+        self._visited = {} if visited is None else visited
+        self._triples = []
+        self._references = []
 
-        self._g.add((selfobject, RDF.type, type))
+        _self = iri(self.identifier) if selfobject is None else selfobject
+        self._visited[id(self)] = _self
+        self._add((_self, RDF.type, type))
+        self._emit(self, _self)
 
-        self._has_type_to_graph(selfobject)
+        return self._g
 
-        if getattr(self, "sequence_number", None) is not None:
-            self._g.add(
-                (
-                    selfobject,
-                    MODELLDCATNO.sequenceNumber,
-                    Literal(self.sequence_number, datatype=XSD.positiveInteger),
-                )
-            )
 
-        if getattr(self, "min_occurs", None) is not None:
-            self._g.add((selfobject, XSD.minOccurs, Literal(self.min_occurs)))
+class Role(ModelProperty):
+    """A class representing a modelldcatno:Role."""
 
-        if getattr(self, "max_occurs", None) is not None:
+    __slots__ = ("_has_object_type",)
 
-            if isinstance(self.max_occurs, int):
-                self._g.add(
-                    (
-                        selfobject,
-                        XSD.maxOccurs,
-                        Literal(self.max_occurs, datatype=XSD.nonNegativeInteger),
-                    )
-                )
+    _identifier: URI
+    _has_object_type: Union[ObjectType, URI]
 
-            elif isinstance(self.max_occurs, str):
+    _schema: Tuple[Field, ...] = (
+        Field("_has_object_type", MODELLDCATNO.hasObjectType, REFERENCE),
+    )
 
-                if self.max_occurs.isdigit():
-                    self._g.add(
-                        (
-                            selfobject,
-                            XSD.maxOccurs,
-                            Literal(self.max_occurs, datatype=XSD.nonNegativeInteger),
-                        )
-                    )
-                else:
-                    self._g.add((selfobject, XSD.maxOccurs, Literal(self.max_occurs)))
+    def __init__(self, identifier: Optional[str] = None) -> None:
+        """Inits an object with default values."""
+        if identifier:
+            self.identifier = identifier
+        super().__init__()
 
-        if getattr(self, "title", None):
-            for key in self.title:
-                self._g.add(
-                    (
-                        selfobject,
-                        DCTERMS.title,
-                        Literal(self.title[key], lang=key),
-                    )
-                )
-
-        if getattr(self, "navigable", None):
-            self._g.add(
-                (
-                    selfobject,
-                    MODELLDCATNO.navigable,
-                    Literal(self.navigable, datatype=XSD.boolean),
-                )
-            )
-
-        self._subject_to_graph(selfobject)
-        self._description_to_graph(selfobject)
-        self._belongs_to_module_to_graph(selfobject)
-        self._forms_symmetry_with_to_graph(selfobject)
-        self._relation_property_label_to_graph(selfobject)
-
-        return self._g
-
-    def _subject_to_graph(self: ModelProperty, selfobject: URIRef) -> None:
-
-        if getattr(self, "subject", None):
-
-            if isinstance(self.subject, Concept):
-                _subject = URIRef(self.subject.identifier)
-
-                for _s, p, o in self.subject._to_graph().triples((None, None, None)):
-                    self._g.add((_subject, p, o))
-
-            elif isinstance(self.subject, str):
-                _subject = URIRef(self.subject)
-
-            self._g.add((selfobject, DCTERMS.subject, _subject))
-
-    def _has_type_to_graph(self, _self: URIRef) -> None:
-        if getattr(self, "has_type", None):
-
-            for has_type in self._has_type:
-
-                if isinstance(has_type, ModelElement):
-
-                    if not getattr(has_type, "identifier", None):
-                        has_type.identifier = Skolemizer.add_skolemization()
-
-                    _has_type = URIRef(has_type.identifier)
-
-                    for _s, p, o in has_type._to_graph().triples((None, None, None)):
-                        self._g.add((_s, p, o))
-
-                elif isinstance(has_type, str):
-                    _has_type = URIRef(has_type)
-
-                self._g.add(
-                    (
-                        _self,
-                        MODELLDCATNO.hasType,
-                        _has_type,
-                    )
-                )
-
-    def _description_to_graph(self: ModelProperty, selfobject: URIRef) -> None:
-        if getattr(self, "description", None):
-            for key in self.description:
-                self._g.add(
-                    (
-                        selfobject,
-                        DCTERMS.description,
-                        Literal(self.description[key], lang=key),
-                    )
-                )
-
-    def _belongs_to_module_to_graph(self: ModelProperty, selfobject: URIRef) -> None:
-        if getattr(self, "belongs_to_module", None):
-            for belongs_to_module in self._belongs_to_module:
-
-                if isinstance(belongs_to_module, Module):
-
-                    if not getattr(belongs_to_module, "identifier", None):
-                        belongs_to_module.identifier = Skolemizer.add_skolemization()
-
-                    _belongs_to_module = URIRef(belongs_to_module.identifier)
-
-                    for _s, p, o in belongs_to_module._to_graph().triples(
-                        (None, None, None)
-                    ):
-                        self._g.add((_s, p, o))
-
-                elif isinstance(belongs_to_module, str):
-                    _belongs_to_module = URIRef(belongs_to_module)
-
-                self._g.add(
-                    (
-                        selfobject,
-                        MODELLDCATNO.belongsToModule,
-                        _belongs_to_module,
-                    )
-                )
-
-    def _forms_symmetry_with_to_graph(self, _self: URIRef) -> None:
-
-        if getattr(self, "forms_symmetry_with", None):
-
-            if isinstance(self.forms_symmetry_with, ModelProperty):
-
-                if not getattr(self.forms_symmetry_with, "identifier", None):
-                    self.forms_symmetry_with.identifier = Skolemizer.add_skolemization()
-
-                _forms_symmetry_with = URIRef(self.forms_symmetry_with.identifier)
-
-                for _s, p, o in self.forms_symmetry_with._to_graph().triples(
-                    (None, None, None)
-                ):
-                    self._g.add((_s, p, o))
-
-            elif isinstance(self.forms_symmetry_with, str):
-                _forms_symmetry_with = URIRef(self.forms_symmetry_with)
-
-            self._g.add((_self, MODELLDCATNO.formsSymmetryWith, _forms_symmetry_with))
-
-    def _relation_property_label_to_graph(
-        self: ModelProperty, selfobject: URIRef
-    ) -> None:
-        if getattr(self, "relation_property_label", None):
-            for key in self.relation_property_label:
-                self._g.add(
-                    (
-                        selfobject,
-                        MODELLDCATNO.relationPropertyLabel,
-                        Literal(self.relation_property_label[key], lang=key),
-                    )
-                )
-
-
-class Role(ModelProperty):
-    """A class representing a modelldcatno:Role."""
-
-    __slots__ = (
-        "_identifier",
-        "_has_object_type",
-    )
-
-    _identifier: URI
-    _has_object_type: Union[ObjectType, URI]
-    _g: Graph
-
-    def __init__(self, identifier: Optional[str] = None) -> None:
-        """Inits an object with default values."""
-        if identifier:
-            self.identifier = identifier
-        super().__init__()
-
-    @property
-    def has_object_type(self: Role) -> Union[ObjectType, URI]:
-        """Get for has_object_type."""
-        return self._has_object_type
+    @property
+    def has_object_type(self: Role) -> Union[ObjectType, URI]:
+        """Get for has_object_type."""
+        return self._has_object_type
 
     @has_object_type.setter
     def has_object_type(self: Role, has_object_type: Union[ObjectType, URI]) -> None:
@@ -1567,61 +2012,43 @@ class Role(ModelProperty):
         Returns:
             a rdf serialization as a string according to format encoded as bytes.
         """
-        return self._to_graph().serialize(format=format, encoding=encoding)
+        return serialize(self._to_graph, format, encoding)
 
+    @mapping
     def _to_graph(
         self: Role,
-        type: str = MODELLDCATNO.Role,
-        selfobject: URIRef = None,
+        type: URIRef = MODELLDCATNO.Role,
+        selfobject: Optional[URIRef] = None,
+        g: Optional[TripleSink] = None,
+        visited: Optional[Dict[int, Node]] = None,
     ) -> Graph:
         """Returns the role as graph.
 
         Args:
             type: type for identifying class. Default: MODELLDCATNO.Role
             selfobject: a URIRef passed from a subclass Default: None
+            g: a graph to add the triples to. Default: None
+            visited: nodes of objects already added to the graph. Default: None
 
         Returns:
             the role graph
         """
-        if not getattr(self, "identifier", None):
-            self.identifier = Skolemizer.add_skolemization()
-
-        _self = URIRef(self.identifier)
+        skolemize(self)
 
-        super(Role, self)._to_graph(MODELLDCATNO.Role, _self)
+        _self = iri(self.identifier)
 
-        self._has_object_type_to_graph(_self)
+        super(Role, self)._to_graph(MODELLDCATNO.Role, _self, g, visited)
 
         return self._g
 
-    def _has_object_type_to_graph(self, _self: URIRef) -> None:
-
-        if getattr(self, "has_object_type", None):
-
-            if isinstance(self.has_object_type, ObjectType):
-
-                if not getattr(self.has_object_type, "identifier", None):
-                    self._has_object_type.identifier = Skolemizer.add_skolemization()
-
-                _has_object_type = URIRef(self.has_object_type.identifier)
-
-                for _s, p, o in self._has_object_type._to_graph().triples(
-                    (None, None, None)
-                ):
-                    self._g.add((_s, p, o))
-
-            elif isinstance(self.has_object_type, str):
-                _has_object_type = URIRef(self.has_object_type)
-
-            self._g.add((_self, MODELLDCATNO.hasObjectType, _has_object_type))
-
 
 class ObjectType(ModelElement):
     """A class representing a modelldcatno:ObjectType."""
 
+    __slots__ = ()
+
     _identifier: URI
     _dct_identifier: str
-    _g: Graph
     _belongs_to_module: List[Union[Module, URI]]
 
     def __init__(self, identifier: Optional[str] = None) -> None:
@@ -1642,27 +2069,31 @@ class ObjectType(ModelElement):
         Returns:
             a rdf serialization as a string according to format encoded as bytes.
         """
-        return self._to_graph().serialize(format=format, encoding=encoding)
+        return serialize(self._to_graph, format, encoding)
 
+    @mapping
     def _to_graph(
         self: ObjectType,
-        type: str = MODELLDCATNO.ObjectType,
-        selfobject: URIRef = None,
+        type: URIRef = MODELLDCATNO.ObjectType,
+        selfobject: Optional[URIRef] = None,
+        g: Optional[TripleSink] = None,
+        visited: Optional[Dict[int, Node]] = None,
     ) -> Graph:
         """Returns the object type as graph.
 
         Args:
             type: type for identifying class. Default: MODELLDCATNO.ObjectType
             selfobject: a URIRef passed from a subclass Default: None
+            g: a graph to add the triples to. Default: None
+            visited: nodes of objects already added to the graph. Default: None
 
         Returns:
             the object type graph
         """
-        if not getattr(self, "identifier", None):
-            self.identifier = Skolemizer.add_skolemization()
-        _self = URIRef(self.identifier)
+        skolemize(self)
+        _self = iri(self.identifier)
 
-        super(ObjectType, self)._to_graph(MODELLDCATNO.ObjectType, _self)
+        super(ObjectType, self)._to_graph(MODELLDCATNO.ObjectType, _self, g, visited)
 
         return self._g
 
@@ -1686,7 +2117,6 @@ class SimpleType(ModelElement):
 
     _identifier: URI
     _dct_identifier: str
-    _g: Graph
     _min_length: int
     _max_length: int
     _fraction_digits: int
@@ -1700,6 +2130,20 @@ class SimpleType(ModelElement):
     _pattern: str
     _belongs_to_module: List[Union[Module, URI]]
 
+    _schema: Tuple[Field, ...] = (
+        Field("_min_length", XSD.minLength, LITERAL, zero=True),
+        Field("_max_length", XSD.maxLength, LITERAL, zero=True),
+        Field("_fraction_digits", XSD.fractionDigits, LITERAL, zero=True),
+        Field("_length", XSD.length, LITERAL, zero=True),
+        Field("_total_digits", XSD.totalDigits, LITERAL, zero=True),
+        Field("_max_inclusive", XSD.maxInclusive, LITERAL),
+        Field("_min_inclusive", XSD.minInclusive, LITERAL),
+        Field("_min_exclusive", XSD.minExclusive, LITERAL),
+        Field("_max_exclusive", XSD.maxExclusive, LITERAL),
+        Field("_type_definition_reference", MODELLDCATNO.typeDefinitionReference, IRI),
+        Field("_pattern", XSD.pattern, LITERAL),
+    )
+
     def __init__(self, identifier: Optional[str] = None) -> None:
         """Inits an object with default values."""
         if identifier:
@@ -1804,7 +2248,7 @@ class SimpleType(ModelElement):
     @type_definition_reference.setter
     def type_definition_reference(self, type_definition_reference: str) -> None:
         """Set for type_definition_reference."""
-        self._type_definition_reference = URI(type_definition_reference)
+        self._type_definition_reference = uri(type_definition_reference)
 
     @property
     def pattern(self) -> str:
@@ -1828,74 +2272,35 @@ class SimpleType(ModelElement):
         Returns:
             a rdf serialization as a string according to format encoded as bytes.
         """
-        return self._to_graph().serialize(format=format, encoding=encoding)
+        return serialize(self._to_graph, format, encoding)
 
+    @mapping
     def _to_graph(
         self: SimpleType,
-        type: str = MODELLDCATNO.SimpleType,
-        selfobject: URIRef = None,
+        type: URIRef = MODELLDCATNO.SimpleType,
+        selfobject: Optional[URIRef] = None,
+        g: Optional[TripleSink] = None,
+        visited: Optional[Dict[int, Node]] = None,
     ) -> Graph:
         """Returns the object type as graph.
 
         Args:
             type: type for identifying class. Default: MODELLDCATNO.SimpleType
             selfobject: a URIRef passed from a subclass Default: None
+            g: a graph to add the triples to. Default: None
+            visited: nodes of objects already added to the graph. Default: None
 
         Returns:
             the object type graph
         """
-        if not getattr(self, "identifier", None):
-            self.identifier = Skolemizer.add_skolemization()
+        skolemize(self)
 
-        _self = URIRef(self.identifier)
+        _self = iri(self.identifier)
 
-        super(SimpleType, self)._to_graph(MODELLDCATNO.SimpleType, _self)
-
-        self._add_properties(_self)
+        super(SimpleType, self)._to_graph(MODELLDCATNO.SimpleType, _self, g, visited)
 
         return self._g
 
-    def _add_properties(self, _self: URIRef) -> None:  # noqa
-
-        if getattr(self, "min_length", None) is not None:
-            self._g.add((_self, XSD.minLength, Literal(self.min_length)))
-
-        if getattr(self, "max_length", None) is not None:
-            self._g.add((_self, XSD.maxLength, Literal(self.max_length)))
-
-        if getattr(self, "fraction_digits", None) is not None:
-            self._g.add((_self, XSD.fractionDigits, Literal(self.fraction_digits)))
-
-        if getattr(self, "length", None) is not None:
-            self._g.add((_self, XSD.length, Literal(self.length)))
-
-        if getattr(self, "total_digits", None) is not None:
-            self._g.add((_self, XSD.totalDigits, Literal(self.total_digits)))
-
-        if getattr(self, "max_inclusive", None):
-            self._g.add((_self, XSD.maxInclusive, Literal(self.max_inclusive)))
-
-        if getattr(self, "min_inclusive", None):
-            self._g.add((_self, XSD.minInclusive, Literal(self.min_inclusive)))
-
-        if getattr(self, "min_exclusive", None):
-            self._g.add((_self, XSD.minExclusive, Literal(self.min_exclusive)))
-
-        if getattr(self, "max_exclusive", None):
-            self._g.add((_self, XSD.maxExclusive, Literal(self.max_exclusive)))
-
-        if getattr(self, "type_definition_reference", None):
-            self._g.add(
-                (
-                    _self,
-                    MODELLDCATNO.typeDefinitionReference,
-                    URIRef(self.type_definition_reference),
-                ),
-            )
-
-        if getattr(self, "pattern", None):
-            self._g.add((_self, XSD.pattern, Literal(self.pattern)))
-
 
 class Composition(ModelProperty):
     """A class representing a modelldcatno:Composition."""
@@ -1904,7 +2309,8 @@ class Composition(ModelProperty):
 
     _contains: Union[ModelElement, URI]
     _identifier: URI
-    _g: Graph
+
+    _schema: Tuple[Field, ...] = (Field("_contains", MODELLDCATNO.contains, REFERENCE),)
 
     @property
     def contains(self: Composition) -> Union[ModelElement, URI]:
@@ -1934,52 +2340,35 @@ class Composition(ModelProperty):
         Returns:
             a rdf serialization as a string according to format encoded as bytes.
         """
-        return self._to_graph().serialize(format=format, encoding=encoding)
+        return serialize(self._to_graph, format, encoding)
 
+    @mapping
     def _to_graph(
         self: Composition,
-        type: str = MODELLDCATNO.Composition,
-        selfobject: URIRef = None,
+        type: URIRef = MODELLDCATNO.Composition,
+        selfobject: Optional[URIRef] = None,
+        g: Optional[TripleSink] = None,
+        visited: Optional[Dict[int, Node]] = None,
     ) -> Graph:
         """Returns the role as graph.
 
         Args:
             type: type for identifying class. Default: MODELLDCATNO.Composition
             selfobject: a URIRef passed from a subclass Default: None
+            g: a graph to add the triples to. Default: None
+            visited: nodes of objects already added to the graph. Default: None
 
         Returns:
             the role graph
         """
-        if not getattr(self, "identifier", None):
-            self.identifier = Skolemizer.add_skolemization()
-
-        _self = URIRef(self.identifier)
+        skolemize(self)
 
-        super(Composition, self)._to_graph(MODELLDCATNO.Composition, _self)
+        _self = iri(self.identifier)
 
-        self._contains_to_graph(_self)
+        super(Composition, self)._to_graph(MODELLDCATNO.Composition, _self, g, visited)
 
         return self._g
 
-    def _contains_to_graph(self, _self: URIRef) -> None:
-
-        if getattr(self, "contains", None):
-
-            if isinstance(self.contains, ModelElement):
-
-                if not getattr(self.contains, "identifier", None):
-                    self.contains.identifier = Skolemizer.add_skolemization()
-
-                _contains = URIRef(self.contains.identifier)
-
-                for _s, p, o in self._contains._to_graph().triples((None, None, None)):
-                    self._g.add((_s, p, o))
-
-            elif isinstance(self.contains, str):
-                _contains = URIRef(self.contains)
-
-            self._g.add((_self, MODELLDCATNO.contains, _contains))
-
 
 class Collection(ModelProperty):
     """A class representing a modelldcatno:Collection."""
@@ -1988,7 +2377,10 @@ class Collection(ModelProperty):
 
     _has_member: Union[ModelElement, URI]
     _identifier: URI
-    _g: Graph
+
+    _schema: Tuple[Field, ...] = (
+        Field("_has_member", MODELLDCATNO.hasMember, REFERENCE),
+    )
 
     @property
     def has_member(self: Collection) -> Union[ModelElement, URI]:
@@ -2018,54 +2410,35 @@ class Collection(ModelProperty):
         Returns:
             a rdf serialization as a string according to format encoded as bytes.
         """
-        return self._to_graph().serialize(format=format, encoding=encoding)
+        return serialize(self._to_graph, format, encoding)
 
+    @mapping
     def _to_graph(
         self: Collection,
-        type: str = MODELLDCATNO.Collection,
-        selfobject: URIRef = None,
+        type: URIRef = MODELLDCATNO.Collection,
+        selfobject: Optional[URIRef] = None,
+        g: Optional[TripleSink] = None,
+        visited: Optional[Dict[int, Node]] = None,
     ) -> Graph:
         """Returns the role as graph.
 
         Args:
             type: type for identifying class. Default: MODELLDCATNO.Collection
             selfobject: a URIRef passed from a subclass Default: None
+            g: a graph to add the triples to. Default: None
+            visited: nodes of objects already added to the graph. Default: None
 
         Returns:
             the role graph
         """
-        if not getattr(self, "identifier", None):
-            self.identifier = Skolemizer.add_skolemization()
-
-        _self = URIRef(self.identifier)
+        skolemize(self)
 
-        super(Collection, self)._to_graph(MODELLDCATNO.Collection, _self)
+        _self = iri(self.identifier)
 
-        self._has_member_to_graph(_self)
+        super(Collection, self)._to_graph(MODELLDCATNO.Collection, _self, g, visited)
 
         return self._g
 
-    def _has_member_to_graph(self, _self: URIRef) -> None:
-
-        if getattr(self, "has_member", None):
-
-            if isinstance(self.has_member, ModelElement):
-
-                if not getattr(self.has_member, "identifier", None):
-                    self.has_member.identifier = Skolemizer.add_skolemization()
-
-                _has_member = URIRef(self.has_member.identifier)
-
-                for _s, p, o in self._has_member._to_graph().triples(
-                    (None, None, None)
-                ):
-                    self._g.add((_s, p, o))
-
-            elif isinstance(self.has_member, str):
-                _has_member = URIRef(self.has_member)
-
-            self._g.add((_self, MODELLDCATNO.hasMember, _has_member))
-
 
 class Association(ModelProperty):
     """A class representing a modelldcatno:Association."""
@@ -2074,7 +2447,10 @@ class Association(ModelProperty):
 
     _refers_to: Union[ModelElement, URI]
     _identifier: URI
-    _g: Graph
+
+    _schema: Tuple[Field, ...] = (
+        Field("_refers_to", MODELLDCATNO.refersTo, REFERENCE),
+    )
 
     @property
     def refers_to(self: Association) -> Union[ModelElement, URI]:
@@ -2104,51 +2480,32 @@ class Association(ModelProperty):
         Returns:
             a rdf serialization as a string according to format encoded as bytes.
         """
-        return self._to_graph().serialize(format=format, encoding=encoding)
+        return serialize(self._to_graph, format, encoding)
 
+    @mapping
     def _to_graph(
         self: Association,
-        type: str = MODELLDCATNO.Association,
-        selfobject: URIRef = None,
+        type: URIRef = MODELLDCATNO.Association,
+        selfobject: Optional[URIRef] = None,
+        g: Optional[TripleSink] = None,
+        visited: Optional[Dict[int, Node]] = None,
     ) -> Graph:
         """Returns the association as graph.
 
         Args:
             type: type for identifying class. Default: MODELLDCATNO.Association
             selfobject: a URIRef passed from a subclass Default: None
+            g: a graph to add the triples to. Default: None
+            visited: nodes of objects already added to the graph. Default: None
 
         Returns:
             the association graph
         """
-        if not getattr(self, "identifier", None):
-            self.identifier = Skolemizer.add_skolemization()
-
-        _self = URIRef(self.identifier)
-
-        super(Association, self)._to_graph(MODELLDCATNO.Association, _self)
-
-        self._refers_to_to_graph(_self)
-
-        return self._g
-
-    def _refers_to_to_graph(self, _self: URIRef) -> None:
+        skolemize(self)
 
-        if getattr(self, "refers_to", None):
+        _self = iri(self.identifier)
 
-            if isinstance(self.refers_to, ModelElement):
-
-                if not getattr(self.refers_to, "identifier", None):
-                    self._refers_to.identifier = Skolemizer.add_skolemization()
-
-                _refers_to = URIRef(self.refers_to.identifier)
-
-                for _s, p, o in self._refers_to._to_graph().triples((None, None, None)):
-                    self._g.add((_s, p, o))
-
-            elif isinstance(self.refers_to, str):
-                _refers_to = URIRef(self.refers_to)
-
-            self._g.add((_self, MODELLDCATNO.refersTo, _refers_to))
+        super(Association, self)._to_graph(MODELLDCATNO.Association, _self, g, visited)
 
         return self._g
 
@@ -2160,7 +2517,10 @@ class Choice(ModelProperty):
 
     _has_some: List[Union[ModelElement, ModelProperty, URI]]
     _identifier: URI
-    _g: Graph
+
+    _schema: Tuple[Field, ...] = (
+        Field("_has_some", MODELLDCATNO.hasSome, REFERENCE, many=True),
+    )
 
     @property
     def has_some(self: Choice) -> List[Union[ModelElement, ModelProperty, URI]]:
@@ -2191,70 +2551,40 @@ class Choice(ModelProperty):
         Returns:
             a rdf serialization as a string according to format encoded as bytes.
         """
-        return self._to_graph().serialize(format=format, encoding=encoding)
+        return serialize(self._to_graph, format, encoding)
 
+    @mapping
     def _to_graph(
         self: Choice,
-        type: str = MODELLDCATNO.Choice,
-        selfobject: URIRef = None,
+        type: URIRef = MODELLDCATNO.Choice,
+        selfobject: Optional[URIRef] = None,
+        g: Optional[TripleSink] = None,
+        visited: Optional[Dict[int, Node]] = None,
     ) -> Graph:
         """Returns the role as graph.
 
         Args:
             type: type for identifying class. Default: MODELLDCATNO.Choice
             selfobject: a URIRef passed from a subclass Default: None
+            g: a graph to add the triples to. Default: None
+            visited: nodes of objects already added to the graph. Default: None
 
         Returns:
             the role graph
         """
-        if not getattr(self, "identifier", None):
-            self.identifier = Skolemizer.add_skolemization()
+        skolemize(self)
 
-        _self = URIRef(self.identifier)
+        _self = iri(self.identifier)
 
-        super(Choice, self)._to_graph(MODELLDCATNO.Choice, _self)
-
-        self._has_some_to_graph(_self)
+        super(Choice, self)._to_graph(MODELLDCATNO.Choice, _self, g, visited)
 
         return self._g
 
-    def _has_some_to_graph(self, _self: URIRef) -> None:
-
-        if getattr(self, "has_some", None):
-
-            for has_some in self._has_some:
-
-                if isinstance(has_some, ModelElement):
-
-                    if not getattr(has_some, "identifier", None):
-                        has_some.identifier = Skolemizer.add_skolemization()
-
-                    _has_some = URIRef(has_some.identifier)
-
-                    for _s, p, o in has_some._to_graph().triples((None, None, None)):
-                        self._g.add((_s, p, o))
-
-                elif isinstance(has_some, ModelProperty):
-
-                    if not getattr(has_some, "identifier", None):
-                        has_some.identifier = Skolemizer.add_skolemization()
-
-                    _has_some = URIRef(has_some.identifier)
-
-                    for _s, p, o in has_some._to_graph().triples((None, None, None)):
-                        self._g.add((_s, p, o))
-
-                elif isinstance(has_some, str):
-                    _has_some = URIRef(has_some)
-
-                self._g.add((_self, MODELLDCATNO.hasSome, _has_some))
-
 
 class Attribute(ModelProperty):
     """A class representing a modelldcatno:Attribute."""
 
     __slots__ = (
-        "_identifier",
         "_contains_object_type",
         "_has_simple_type",
         "_has_data_type",
@@ -2263,11 +2593,17 @@ class Attribute(ModelProperty):
 
     _identifier: URI
     _contains_object_type: Union[ObjectType, URI]
-    _g: Graph
     _has_simple_type: Union[SimpleType, URI]
     _has_data_type: Union[DataType, URI]
     _has_value_from: Union[CodeList, URI]
 
+    _schema: Tuple[Field, ...] = (
+        Field("_contains_object_type", MODELLDCATNO.containsObjectType, REFERENCE),
+        Field("_has_simple_type", MODELLDCATNO.hasSimpleType, REFERENCE),
+        Field("_has_data_type", MODELLDCATNO.hasDataType, REFERENCE),
+        Field("_has_value_from", MODELLDCATNO.hasValueFrom, REFERENCE),
+    )
+
     def __init__(self, identifier: Optional[str] = None) -> None:
         """Inits an object with default values."""
         if identifier:
@@ -2330,121 +2666,34 @@ class Attribute(ModelProperty):
         Returns:
             a rdf serialization as a string according to format encoded as bytes.
         """
-        return self._to_graph().serialize(format=format, encoding=encoding)
+        return serialize(self._to_graph, format, encoding)
 
+    @mapping
     def _to_graph(
         self: Attribute,
-        type: str = MODELLDCATNO.Attribute,
-        selfobject: URIRef = None,
+        type: URIRef = MODELLDCATNO.Attribute,
+        selfobject: Optional[URIRef] = None,
+        g: Optional[TripleSink] = None,
+        visited: Optional[Dict[int, Node]] = None,
     ) -> Graph:
         """Returns the role as graph.
 
         Args:
             type: type for identifying class. Default: MODELLDCATNO.Attribute
             selfobject: a URIRef passed from a subclass Default: None
+            g: a graph to add the triples to. Default: None
+            visited: nodes of objects already added to the graph. Default: None
 
         Returns:
             the role graph
         """
-        if not getattr(self, "identifier", None):
-            self.identifier = Skolemizer.add_skolemization()
-        _self = URIRef(self.identifier)
-
-        super(Attribute, self)._to_graph(MODELLDCATNO.Attribute, _self)
+        skolemize(self)
+        _self = iri(self.identifier)
 
-        self._contains_object_type_to_graph(_self)
-        self._has_simple_type_to_graph(_self)
-        self._has_data_type_to_graph(_self)
-        self._has_value_from_to_graph(_self)
+        super(Attribute, self)._to_graph(MODELLDCATNO.Attribute, _self, g, visited)
 
         return self._g
 
-    def _contains_object_type_to_graph(self, _self: URIRef) -> None:
-
-        if getattr(self, "contains_object_type", None):
-
-            if isinstance(self.contains_object_type, ObjectType):
-
-                if not getattr(self.contains_object_type, "identifier", None):
-                    self.contains_object_type.identifier = (
-                        Skolemizer.add_skolemization()
-                    )
-
-                _contains_object_type = URIRef(self.contains_object_type.identifier)
-
-                for _s, p, o in self._contains_object_type._to_graph().triples(
-                    (None, None, None)
-                ):
-                    self._g.add((_s, p, o))
-
-            elif isinstance(self.contains_object_type, str):
-                _contains_object_type = URIRef(self.contains_object_type)
-
-            self._g.add((_self, MODELLDCATNO.containsObjectType, _contains_object_type))
-
-    def _has_simple_type_to_graph(self, _self: URIRef) -> None:
-
-        if getattr(self, "has_simple_type", None):
-
-            if isinstance(self.has_simple_type, SimpleType):
-
-                if not getattr(self.has_simple_type, "identifier", None):
-                    self.has_simple_type.identifier = Skolemizer.add_skolemization()
-
-                _has_simple_type = URIRef(self.has_simple_type.identifier)
-
-                for _s, p, o in self._has_simple_type._to_graph().triples(
-                    (None, None, None)
-                ):
-                    self._g.add((_s, p, o))
-
-            elif isinstance(self.has_simple_type, str):
-                _has_simple_type = URIRef(self.has_simple_type)
-
-            self._g.add((_self, MODELLDCATNO.hasSimpleType, _has_simple_type))
-
-    def _has_data_type_to_graph(self, _self: URIRef) -> None:
-
-        if getattr(self, "has_data_type", None):
-
-            if isinstance(self.has_data_type, DataType):
-
-                if not getattr(self.has_data_type, "identifier", None):
-                    self.has_data_type.identifier = Skolemizer.add_skolemization()
-
-                _has_data_type = URIRef(self.has_data_type.identifier)
-
-                for _s, p, o in self._has_data_type._to_graph().triples(
-                    (None, None, None)
-                ):
-                    self._g.add((_s, p, o))
-
-            elif isinstance(self.has_data_type, str):
-                _has_data_type = URIRef(self.has_data_type)
-
-            self._g.add((_self, MODELLDCATNO.hasDataType, _has_data_type))
-
-    def _has_value_from_to_graph(self, _self: URIRef) -> None:
-
-        if getattr(self, "has_value_from", None):
-
-            if isinstance(self.has_value_from, CodeList):
-
-                if not getattr(self.has_value_from, "identifier", None):
-                    self.has_value_from.identifier = Skolemizer.add_skolemization()
-
-                _has_value_from = URIRef(self.has_value_from.identifier)
-
-                for _s, p, o in self._has_value_from._to_graph().triples(
-                    (None, None, None)
-                ):
-                    self._g.add((_s, p, o))
-
-            elif isinstance(self.has_value_from, str):
-                _has_value_from = URIRef(self.has_value_from)
-
-            self._g.add((_self, MODELLDCATNO.hasValueFrom, _has_value_from))
-
 
 class Specialization(ModelProperty):
     """A class representing a modelldcatno:Specialization."""
@@ -2453,7 +2702,10 @@ class Specialization(ModelProperty):
 
     _has_general_concept: Union[ModelElement, URI]
     _identifier: URI
-    _g: Graph
+
+    _schema: Tuple[Field, ...] = (
+        Field("_has_general_concept", MODELLDCATNO.hasGeneralConcept, REFERENCE),
+    )
 
     @property
     def has_general_concept(self: Specialization) -> Union[ModelElement, URI]:
@@ -2485,54 +2737,37 @@ class Specialization(ModelProperty):
         Returns:
             a rdf serialization as a string according to format encoded as bytes.
         """
-        return self._to_graph().serialize(format=format, encoding=encoding)
+        return serialize(self._to_graph, format, encoding)
 
+    @mapping
     def _to_graph(
         self: Specialization,
-        type: str = MODELLDCATNO.Specialization,
-        selfobject: URIRef = None,
+        type: URIRef = MODELLDCATNO.Specialization,
+        selfobject: Optional[URIRef] = None,
+        g: Optional[TripleSink] = None,
+        visited: Optional[Dict[int, Node]] = None,
     ) -> Graph:
         """Returns the role as graph.
 
         Args:
             type: type for identifying class. Default: MODELLDCATNO.Association
             selfobject: a URIRef passed from a subclass Default: None
+            g: a graph to add the triples to. Default: None
+            visited: nodes of objects already added to the graph. Default: None
 
         Returns:
             the role graph
         """
-        if not getattr(self, "identifier", None):
-            self.identifier = Skolemizer.add_skolemization()
-
-        _self = URIRef(self.identifier)
+        skolemize(self)
 
-        super(Specialization, self)._to_graph(MODELLDCATNO.Specialization, _self)
+        _self = iri(self.identifier)
 
-        self._has_general_concept_to_graph(_self)
+        super(Specialization, self)._to_graph(
+            MODELLDCATNO.Specialization, _self, g, visited
+        )
 
         return self._g
 
-    def _has_general_concept_to_graph(self, _self: URIRef) -> None:
-
-        if getattr(self, "has_general_concept", None):
-
-            if isinstance(self.has_general_concept, ModelElement):
-
-                if not getattr(self.has_general_concept, "identifier", None):
-                    self.has_general_concept.identifier = Skolemizer.add_skolemization()
-
-                _has_general_concept = URIRef(self.has_general_concept.identifier)
-
-                for _s, p, o in self._has_general_concept._to_graph().triples(
-                    (None, None, None)
-                ):
-                    self._g.add((_s, p, o))
-
-            elif isinstance(self.has_general_concept, str):
-                _has_general_concept = URIRef(self.has_general_concept)
-
-            self._g.add((_self, MODELLDCATNO.hasGeneralConcept, _has_general_concept))
-
 
 class Realization(ModelProperty):
     """A class representing a modelldcatno:Realization."""
@@ -2541,7 +2776,10 @@ class Realization(ModelProperty):
 
     _has_supplier: Union[ModelElement, ModelProperty, URI]
     _identifier: URI
-    _g: Graph
+
+    _schema: Tuple[Field, ...] = (
+        Field("_has_supplier", MODELLDCATNO.hasSupplier, REFERENCE),
+    )
 
     @property
     def has_supplier(self: Realization) -> Union[ModelElement, ModelProperty, URI]:
@@ -2573,56 +2811,35 @@ class Realization(ModelProperty):
         Returns:
             a rdf serialization as a string according to format encoded as bytes.
         """
-        return self._to_graph().serialize(format=format, encoding=encoding)
+        return serialize(self._to_graph, format, encoding)
 
+    @mapping
     def _to_graph(
         self: Realization,
-        type: str = MODELLDCATNO.Realization,
-        selfobject: URIRef = None,
+        type: URIRef = MODELLDCATNO.Realization,
+        selfobject: Optional[URIRef] = None,
+        g: Optional[TripleSink] = None,
+        visited: Optional[Dict[int, Node]] = None,
     ) -> Graph:
         """Returns the realization as graph.
 
         Args:
             type: type for identifying class. Default: MODELLDCATNO.Association
             selfobject: a URIRef passed from a subclass Default: None
+            g: a graph to add the triples to. Default: None
+            visited: nodes of objects already added to the graph. Default: None
 
         Returns:
             the assocation graph
         """
-        if not getattr(self, "identifier", None):
-            self.identifier = Skolemizer.add_skolemization()
-
-        _self = URIRef(self.identifier)
+        skolemize(self)
 
-        super(Realization, self)._to_graph(MODELLDCATNO.Realization, _self)
+        _self = iri(self.identifier)
 
-        self._has_supplier_to_graph(_self)
+        super(Realization, self)._to_graph(MODELLDCATNO.Realization, _self, g, visited)
 
         return self._g
 
-    def _has_supplier_to_graph(self, _self: URIRef) -> None:
-
-        if getattr(self, "has_supplier", None):
-
-            if isinstance(self.has_supplier, ModelElement) or isinstance(
-                self.has_supplier, ModelProperty
-            ):
-
-                if not getattr(self.has_supplier, "identifier", None):
-                    self.has_supplier.identifier = Skolemizer.add_skolemization()
-
-                _has_supplier = URIRef(self.has_supplier.identifier)
-
-                for _s, p, o in self._has_supplier._to_graph().triples(
-                    (None, None, None)
-                ):
-                    self._g.add((_s, p, o))
-
-            elif isinstance(self.has_supplier, str):
-                _has_supplier = URIRef(self.has_supplier)
-
-            self._g.add((_self, MODELLDCATNO.hasSupplier, _has_supplier))
-
 
 class Abstraction(ModelProperty):
     """A class representing a modelldcatno:Abstraction."""
@@ -2631,7 +2848,10 @@ class Abstraction(ModelProperty):
 
     _is_abstraction_of: Union[ModelElement, ModelProperty, URI]
     _identifier: URI
-    _g: Graph
+
+    _schema: Tuple[Field, ...] = (
+        Field("_is_abstraction_of", MODELLDCATNO.isAbstractionOf, REFERENCE),
+    )
 
     @property
     def is_abstraction_of(self: Abstraction) -> Union[ModelElement, ModelProperty, URI]:
@@ -2663,73 +2883,43 @@ class Abstraction(ModelProperty):
         Returns:
             a rdf serialization as a string according to format encoded as bytes.
         """
-        return self._to_graph().serialize(format=format, encoding=encoding)
+        return serialize(self._to_graph, format, encoding)
 
+    @mapping
     def _to_graph(
         self: Abstraction,
-        type: str = MODELLDCATNO.Abstraction,
-        selfobject: URIRef = None,
+        type: URIRef = MODELLDCATNO.Abstraction,
+        selfobject: Optional[URIRef] = None,
+        g: Optional[TripleSink] = None,
+        visited: Optional[Dict[int, Node]] = None,
     ) -> Graph:
         """Returns the role as graph.
 
         Args:
             type: type for identifying class. Default: MODELLDCATNO.Abstraction
             selfobject: a URIRef passed from a subclass Default: None
+            g: a graph to add the triples to. Default: None
+            visited: nodes of objects already added to the graph. Default: None
 
         Returns:
             the role graph
         """
-        if not getattr(self, "identifier", None):
-            self.identifier = Skolemizer.add_skolemization()
-
-        _self = URIRef(self.identifier)
+        skolemize(self)
 
-        super(Abstraction, self)._to_graph(MODELLDCATNO.Abstraction, _self)
+        _self = iri(self.identifier)
 
-        self._is_abstraction_of_to_graph(_self)
+        super(Abstraction, self)._to_graph(MODELLDCATNO.Abstraction, _self, g, visited)
 
         return self._g
 
-    def _is_abstraction_of_to_graph(self, _self: URIRef) -> None:
-
-        if getattr(self, "is_abstraction_of", None):
-
-            if isinstance(self.is_abstraction_of, ModelElement):
-
-                if not getattr(self.is_abstraction_of, "identifier", None):
-                    self.is_abstraction_of.identifier = Skolemizer.add_skolemization()
-
-                _is_abstraction_of = URIRef(self.is_abstraction_of.identifier)
-
-                for _s, p, o in self._is_abstraction_of._to_graph().triples(
-                    (None, None, None)
-                ):
-                    self._g.add((_s, p, o))
-
-            elif isinstance(self.is_abstraction_of, ModelProperty):
-
-                if not getattr(self.is_abstraction_of, "identifier", None):
-                    self.is_abstraction_of.identifier = Skolemizer.add_skolemization()
-
-                _is_abstraction_of = URIRef(self.is_abstraction_of.identifier)
-
-                for _s, p, o in self._is_abstraction_of._to_graph().triples(
-                    (None, None, None)
-                ):
-                    self._g.add((_s, p, o))
-
-            elif isinstance(self.is_abstraction_of, str):
-                _is_abstraction_of = URIRef(self.is_abstraction_of)
-
-            self._g.add((_self, MODELLDCATNO.isAbstractionOf, _is_abstraction_of))
-
 
 class DataType(ModelElement):
     """A class representing a modelldcatno:DataType."""
 
+    __slots__ = ()
+
     _identifier: URI
     _dct_identifier: str
-    _g: Graph
     _belongs_to_module: List[Union[Module, URI]]
 
     def __init__(self, identifier: Optional[str] = None) -> None:
@@ -2750,27 +2940,31 @@ class DataType(ModelElement):
         Returns:
             a rdf serialization as a string according to format encoded as bytes.
         """
-        return self._to_graph().serialize(format=format, encoding=encoding)
+        return serialize(self._to_graph, format, encoding)
 
+    @mapping
     def _to_graph(
         self: DataType,
-        type: str = MODELLDCATNO.DataType,
-        selfobject: URIRef = None,
+        type: URIRef = MODELLDCATNO.DataType,
+        selfobject: Optional[URIRef] = None,
+        g: Optional[TripleSink] = None,
+        visited: Optional[Dict[int, Node]] = None,
     ) -> Graph:
         """Returns the data type as graph.
 
         Args:
             type: type for identifying class. Default: MODELLDCATNO.DataType
             selfobject: a URIRef passed from a subclass Default: None
+            g: a graph to add the triples to. Default: None
+            visited: nodes of objects already added to the graph. Default: None
 
         Returns:
             the object type graph
         """
-        if not getattr(self, "identifier", None):
-            self.identifier = Skolemizer.add_skolemization()
-        _self = URIRef(self.identifier)
+        skolemize(self)
+        _self = iri(self.identifier)
 
-        super(DataType, self)._to_graph(MODELLDCATNO.DataType, _self)
+        super(DataType, self)._to_graph(MODELLDCATNO.DataType, _self, g, visited)
 
         return self._g
 
@@ -2778,9 +2972,10 @@ class DataType(ModelElement):
 class RootObjectType(ModelElement):
     """A class representing a modelldcatno:RootObjectType."""
 
+    __slots__ = ()
+
     _identifier: URI
     _dct_identifier: str
-    _g: Graph
     _belongs_to_module: List[Union[Module, URI]]
 
     def __init__(self, identifier: Optional[str] = None) -> None:
@@ -2801,47 +2996,68 @@ class RootObjectType(ModelElement):
         Returns:
             a rdf serialization as a string according to format encoded as bytes.
         """
-        return self._to_graph().serialize(format=format, encoding=encoding)
+        return serialize(self._to_graph, format, encoding)
 
+    @mapping
     def _to_graph(
         self: RootObjectType,
-        type: str = MODELLDCATNO.RootObjectType,
-        selfobject: URIRef = None,
+        type: URIRef = MODELLDCATNO.RootObjectType,
+        selfobject: Optional[URIRef] = None,
+        g: Optional[TripleSink] = None,
+        visited: Optional[Dict[int, Node]] = None,
     ) -> Graph:
         """Returns the root object type as graph.
 
         Args:
             type: type for identifying class. Default: MODELLDCATNO.RootObjectType
             selfobject: a URIRef passed from a subclass Default: None
+            g: a graph to add the triples to. Default: None
+            visited: nodes of objects already added to the graph. Default: None
 
         Returns:
             the root object type graph
         """
-        if not getattr(self, "identifier", None):
-            self.identifier = Skolemizer.add_skolemization()
+        skolemize(self)
 
-        _self = URIRef(self.identifier)
+        _self = iri(self.identifier)
 
-        super(RootObjectType, self)._to_graph(MODELLDCATNO.RootObjectType, _self)
+        super(RootObjectType, self)._to_graph(
+            MODELLDCATNO.RootObjectType, _self, g, visited
+        )
 
         return self._g
 
 
 class CodeList(ModelElement):
-    """A class representing a modelldcatno:CodeList."""
-
-    __slots__ = (
-        "_identifier",
-        "_dct_identifier",
-        "g",
-        "_has_reference",
-    )
+    """A class representing a modelldcatno:CodeList.
+
+    The code elements of an ordered code list are given once, in order, as
+    ordered_elements. They are mapped with the code list, which links each
+    of them to the code list by skos:inScheme, to the code element after it
+    by xkos:next and to the one before it by xkos:previous, so that their
+    in_scheme, next_element and previous_element need not be set.
+
+    Example:
+        >>> from modelldcatnotordf.modelldcatno import CodeElement, CodeList
+        >>>
+        >>> codelist = CodeList("http://example.com/codelists/1")
+        >>> codelist.ordered_elements = [
+        ...     CodeElement(f"http://example.com/codeelements/{i}") for i in range(3)
+        ... ]
+        >>> len(codelist._to_graph())
+        11
+    """
+
+    __slots__ = ("_has_reference", "_code_elements", "_ordered_elements")
 
     _identifier: URI
     _dct_identifier: str
-    _g: Graph
     _belongs_to_module: List[Union[Module, URI]]
     _has_reference: str
+    _code_elements: CodeElementColumns
+    _ordered_elements: List[Union[CodeElement, URI]]
+
+    _schema: Tuple[Field, ...] = (Field("_has_reference", RDFS.seeAlso, IRI),)
 
     def __init__(self, identifier: Optional[str] = None) -> None:
         """Inits an object with default values."""
@@ -2857,7 +3073,29 @@ class CodeList(ModelElement):
     @has_reference.setter
     def has_reference(self: CodeList, has_reference: str) -> None:
         """Set for has_reference."""
-        self._has_reference = URI(has_reference)
+        self._has_reference = uri(has_reference)
+
+    @property
+    def code_elements(self: CodeList) -> CodeElementColumns:
+        """Get for code_elements."""
+        return self._code_elements
+
+    @code_elements.setter
+    def code_elements(self: CodeList, code_elements: CodeElementColumns) -> None:
+        """Set for code_elements."""
+        self._code_elements = code_elements
+
+    @property
+    def ordered_elements(self: CodeList) -> List[Union[CodeElement, URI]]:
+        """Get for ordered_elements."""
+        return self._ordered_elements
+
+    @ordered_elements.setter
+    def ordered_elements(
+        self: CodeList, ordered_elements: List[Union[CodeElement, URI]]
+    ) -> None:
+        """Set for ordered_elements."""
+        self._ordered_elements = list(ordered_elements)
 
     def to_rdf(
         self: CodeList, format: str = "turtle", encoding: Optional[str] = "utf-8"
@@ -2871,44 +3109,65 @@ class CodeList(ModelElement):
         Returns:
             a rdf serialization as a string according to format encoded as bytes.
         """
-        return self._to_graph().serialize(format=format, encoding=encoding)
+        return serialize(self._to_graph, format, encoding)
 
+    @mapping
     def _to_graph(
         self: CodeList,
-        type: str = MODELLDCATNO.CodeList,
-        selfobject: URIRef = None,
+        type: URIRef = MODELLDCATNO.CodeList,
+        selfobject: Optional[URIRef] = None,
+        g: Optional[TripleSink] = None,
+        visited: Optional[Dict[int, Node]] = None,
     ) -> Graph:
         """Returns the root object type as graph.
 
         Args:
             type: type for identifying class. Default: MODELLDCATNO.CodeList
             selfobject: a URIRef passed from a subclass Default: None
+            g: a graph to add the triples to. Default: None
+            visited: nodes of objects already added to the graph. Default: None
 
         Returns:
             the root object type graph
         """
-        if not getattr(self, "identifier", None):
-            self.identifier = Skolemizer.add_skolemization()
+        skolemize(self)
 
-        _self = URIRef(self.identifier)
+        _self = iri(self.identifier)
 
-        super(CodeList, self)._to_graph(MODELLDCATNO.CodeList, _self)
+        super(CodeList, self)._to_graph(MODELLDCATNO.CodeList, _self, g, visited)
 
-        if getattr(self, "has_reference", None):
-            self._g.add(
-                (URIRef(self.identifier), RDFS.seeAlso, URIRef(self.has_reference))
-            )
+        if getattr(self, "_code_elements", None) is not None:
+            self._reference_to_graph(self._code_elements)
 
-        return self._g
+        self._ordered_elements_to_graph()
 
+        return self._g
 
-class CodeElement:
+    def _ordered_elements_to_graph(self: CodeList) -> None:
+        # Each code element is mapped once, and linked to the one before it:
+        _self = iri(self.identifier)
+        _previous: Optional[Node] = None
+        for codeelement in getattr(self, "_ordered_elements", None) or []:
+            _codeelement: Node
+            if isinstance(codeelement, CodeElement):
+                self._references.append(codeelement)
+                _codeelement = self._map_reference(codeelement)
+            else:
+                _codeelement = iri(codeelement)
+
+            self._add((_codeelement, SKOS.inScheme, _self))
+            if _previous is not None:
+                self._add((_previous, XKOS.next, _codeelement))
+                self._add((_codeelement, XKOS.previous, _previous))
+            _previous = _codeelement
+
+
+class CodeElement(_CachedMapping):
     """A class representing a modelldcatno:CodeElement."""
 
     __slots__ = (
         "_identifier",
         "_dct_identifier",
-        "_g",
         "_type",
         "_subject",
         "_preflabel",
@@ -2929,8 +3188,8 @@ class CodeElement:
 
     _identifier: URI
     _dct_identifier: str
-    _g: Graph
-    _type: str
+    _visited: Dict[int, Node]
+    _type: URIRef
     _subject: Union[Concept, URI]
     _preflabel: dict
     _notation: str
@@ -2947,6 +3206,24 @@ class CodeElement:
     _next_element: Union[CodeElement, URI]
     _previous_element: Union[CodeElement, URI]
 
+    # The next and previous elements are mapped from the worklist of _to_graph:
+    _schema: Tuple[Field, ...] = (
+        Field("_dct_identifier", DCTERMS.identifier, LITERAL),
+        Field("_notation", SKOS.notation, LITERAL),
+        Field("_preflabel", SKOS.prefLabel, LANGUAGE),
+        Field("_subject", DCTERMS.subject, CONCEPT),
+        Field("_in_scheme", SKOS.inScheme, REFERENCE, many=True),
+        Field("_top_concept_of", SKOS.topConceptOf, REFERENCE, many=True),
+        Field("_altlabel", SKOS.altLabel, LANGUAGE),
+        Field("_definition", SKOS.definition, LANGUAGE),
+        Field("_example", SKOS.example, LITERAL, many=True),
+        Field("_hiddenlabel", SKOS.hiddenLabel, LANGUAGE),
+        Field("_note", SKOS.note, LANGUAGE),
+        Field("_scopenote", SKOS.scopeNote, LANGUAGE),
+        Field("_exclusion_note", XKOS.exclusionNote, LANGUAGE),
+        Field("_inclusion_note", XKOS.inclusionNote, LANGUAGE),
+    )
+
     def __init__(self, identifier: Optional[str] = None) -> None:
         """Inits an object with default values."""
         if identifier:
@@ -2956,12 +3233,16 @@ class CodeElement:
     @property
     def identifier(self: CodeElement) -> str:
         """Get for identifier."""
-        return self._identifier
+        try:
+            return self._identifier
+        except AttributeError:
+            # Labelled in the mapping in progress, unless set:
+            return labelled(self)
 
     @identifier.setter
     def identifier(self: CodeElement, identifier: str) -> None:
         """Set for identifier."""
-        self._identifier = URI(identifier)
+        self._identifier = uri(identifier)
 
     @property
     def dct_identifier(self: CodeElement) -> str:
@@ -3139,273 +3420,307 @@ class CodeElement:
         Returns:
             a rdf serialization as a string according to format encoded as bytes.
         """
-        return self._to_graph().serialize(format=format, encoding=encoding)
+        return serialize(self._to_graph, format, encoding)
+
+    def to_ntriples_stream(self: CodeElement, fileobj: IO[bytes]) -> None:
+        """Maps the code element to rdf and writes it as N-Triples to fileobj.
+
+        The triples are written while the code element is mapped,
+        without collecting them in a graph first.
+
+        Args:
+            fileobj: a binary file object to write to
+        """
+        self._to_graph(g=NTriplesWriter(fileobj))
 
-    def _to_graph(self: CodeElement) -> Graph:
+    @mapping
+    def _to_graph(
+        self: CodeElement,
+        g: Optional[TripleSink] = None,
+        visited: Optional[Dict[int, Node]] = None,
+        selfobject: Optional[BNode] = None,
+    ) -> Graph:
         """Returns the code element as graph.
 
+        Args:
+            g: a graph to add the triples to. Default: None
+            visited: nodes of objects already added to the graph. Default: None
+            selfobject: a blank node to use as subject. Default: None
+
         Returns:
             the code element graph
         """
-        if not getattr(self, "identifier", None):
-            self.identifier = Skolemizer.add_skolemization()
-
-        _self = URIRef(self.identifier)
-
         # Set up graph and namespaces:
-        self._g = Graph()
-        self._g.bind("modelldcatno", MODELLDCATNO)
-        self._g.bind("dct", DCTERMS)
-        self._g.bind("skos", SKOS)
-
-        self._g.add((_self, RDF.type, self._type))
-
-        if getattr(self, "dct_identifier", None):
-            self._g.add((_self, DCTERMS.identifier, Literal(self.dct_identifier)))
-
-        if getattr(self, "notation", None):
-            self._g.add((_self, SKOS.notation, Literal(self.notation)))
-
-        self._preflabel_to_graph(_self)
-        self._subject_to_graph(_self)
-        self._in_scheme_to_graph(_self)
-        self._top_concept_of_to_graph(_self)
-        self._altlabel_to_graph(_self)
-        self._definition_to_graph(_self)
-        self._example_to_graph(_self)
-        self._hiddenlabel_to_graph(_self)
-        self._note_to_graph(_self)
-        self._scopenote_to_graph(_self)
-        self._exclusion_note_to_graph(_self)
-        self._inclusion_note_to_graph(_self)
-        self._next_element_to_graph(_self)
-        self._previous_element_to_graph(_self)
+        self._g = bind_prefixes(Graph()) if g is None else g
+        self._visited = {} if visited is None else visited
+
+        # Elements linked by next/previous are mapped from a worklist instead of
+        # recursively, so that long code lists do not exhaust the stack:
+        codeelements: List[Tuple[CodeElement, Optional[Node]]] = [(self, selfobject)]
+        while codeelements:
+            codeelement, _node = codeelements.pop()
+            codeelement._g = self._g
+            codeelement._visited = self._visited
+            codeelements.extend(codeelement._code_element_to_graph(_node))
 
         return self._g
 
-    def _subject_to_graph(self, _self: URIRef) -> None:
-
-        if getattr(self, "subject", None):
+    def _code_element_to_graph(
+        self, selfobject: Optional[Node]
+    ) -> List[Tuple[CodeElement, Optional[Node]]]:
+        if selfobject is not None:
+            _self = selfobject
+        else:
+            skolemize(self)
 
-            if isinstance(self.subject, Concept):
+            _self = iri(self.identifier)
 
-                _subject = URIRef(self.subject.identifier)
+        self._visited[id(self)] = _self
 
-                for _s, p, o in self.subject._to_graph().triples((None, None, None)):
-                    self._g.add((_subject, p, o))
+        neighbours: List[Tuple[CodeElement, Optional[Node]]] = []
 
-            elif isinstance(self.subject, str):
-                _subject = URIRef(self.subject)
+        def map_reference(reference: _CachedMapping) -> Node:
+            if isinstance(reference, CodeElement):
+                return self._neighbour_to_node(reference, _self, neighbours)
+            return self._map_reference(reference)
 
-            self._g.add((_self, DCTERMS.subject, _subject))
+        if self._from_cache(map_reference, _self):
+            return neighbours
 
-    def _preflabel_to_graph(self, _self: URIRef) -> None:
+        self._triples = []
+        self._references = []
 
-        if getattr(self, "preflabel", None):
+        self._add((_self, RDF.type, self._type))
+        self._emit(self, _self)
 
-            for key in self.preflabel:
-                self._g.add(
-                    (
-                        _self,
-                        SKOS.prefLabel,
-                        Literal(self.preflabel[key], lang=key),
-                    )
-                )
-
-    def _in_scheme_to_graph(self, _self: URIRef) -> None:
-
-        if getattr(self, "in_scheme", None):
-
-            for in_scheme in self._in_scheme:
-
-                if isinstance(in_scheme, CodeList):
-                    if not getattr(in_scheme, "identifier", None):
-                        in_scheme.identifier = Skolemizer.add_skolemization()
-
-                    _in_scheme = URIRef(in_scheme.identifier)
-
-                    for _s, p, o in in_scheme._to_graph().triples((None, None, None)):
-                        self._g.add((_s, p, o))
-
-                elif isinstance(in_scheme, str):
-                    _in_scheme = URIRef(in_scheme)
-
-                self._g.add((_self, SKOS.inScheme, _in_scheme))
-
-    def _top_concept_of_to_graph(self, _self: URIRef) -> None:
-
-        if getattr(self, "top_concept_of", None):
+        self._next_element_to_graph(_self, neighbours)
+        self._previous_element_to_graph(_self, neighbours)
 
-            for top_concept_of in self._top_concept_of:
+        self._to_cache()
 
-                if isinstance(top_concept_of, CodeList):
+        return neighbours
 
-                    if not getattr(top_concept_of, "identifier", None):
-                        top_concept_of.identifier = Skolemizer.add_skolemization()
-
-                    _top_concept_of = URIRef(top_concept_of.identifier)
-
-                    for _s, p, o in top_concept_of._to_graph().triples(
-                        (None, None, None)
-                    ):
-                        self._g.add((_s, p, o))
-
-                elif isinstance(top_concept_of, str):
-                    _top_concept_of = URIRef(top_concept_of)
-
-                self._g.add((_self, SKOS.topConceptOf, _top_concept_of))
-
-    def _altlabel_to_graph(self, _self: URIRef) -> None:
+    def _neighbour_to_node(
+        self,
+        neighbour: CodeElement,
+        _self: Node,
+        neighbours: List[Tuple[CodeElement, Optional[Node]]],
+    ) -> Node:
+        if id(neighbour) in self._visited:
+            return self._visited[id(neighbour)]
+
+        _neighbour: Node
+        if getattr(neighbour, "identifier", None):
+            _neighbour = iri(neighbour.identifier)
+        else:
+            predicate = (
+                XKOS.next
+                if neighbour is getattr(self, "next_element", None)
+                else XKOS.previous
+            )
+            _neighbour = blank_node(str(_self), predicate)
 
-        if getattr(self, "altlabel", None):
+        self._visited[id(neighbour)] = _neighbour
+        neighbours.append((neighbour, _neighbour))
 
-            for key in self.altlabel:
-                self._g.add(
-                    (
-                        _self,
-                        SKOS.altLabel,
-                        Literal(self.altlabel[key], lang=key),
-                    )
-                )
+        return _neighbour
 
-    def _definition_to_graph(self, _self: URIRef) -> None:
+    def _next_element_to_graph(
+        self,
+        _self: Node,
+        neighbours: List[Tuple[CodeElement, Optional[Node]]],
+    ) -> None:
 
-        if getattr(self, "definition", None):
+        if getattr(self, "next_element", None):
 
-            for key in self.definition:
-                self._g.add(
-                    (
-                        _self,
-                        SKOS.definition,
-                        Literal(self.definition[key], lang=key),
-                    )
+            _next_element: Node
+            if isinstance(self.next_element, CodeElement):
+                _next_element = self._neighbour_to_node(
+                    self.next_element, _self, neighbours
                 )
+                self._references.append(self.next_element)
+            elif isinstance(self.next_element, str):
+                _next_element = iri(self.next_element)
 
-    def _example_to_graph(self, _self: URIRef) -> None:
-
-        if getattr(self, "example", None):
-
-            for example in self.example:
-                self._g.add((_self, SKOS.example, Literal(example)))
+            self._add((_self, XKOS.next, _next_element))
 
-    def _hiddenlabel_to_graph(self, _self: URIRef) -> None:
+    def _previous_element_to_graph(
+        self,
+        _self: Node,
+        neighbours: List[Tuple[CodeElement, Optional[Node]]],
+    ) -> None:
 
-        if getattr(self, "hiddenlabel", None):
+        if getattr(self, "previous_element", None):
 
-            for key in self.hiddenlabel:
-                self._g.add(
-                    (
-                        _self,
-                        SKOS.hiddenLabel,
-                        Literal(self.hiddenlabel[key], lang=key),
-                    )
+            _previous_element: Node
+            if isinstance(self.previous_element, CodeElement):
+                _previous_element = self._neighbour_to_node(
+                    self.previous_element, _self, neighbours
                 )
+                self._references.append(self.previous_element)
+            elif isinstance(self.previous_element, str):
+                _previous_element = iri(self.previous_element)
 
-    def _note_to_graph(self, _self: URIRef) -> None:
+            self._add((_self, XKOS.previous, _previous_element))
 
-        if getattr(self, "note", None):
 
-            for key in self.note:
-                self._g.add(
-                    (
-                        _self,
-                        SKOS.note,
-                        Literal(self.note[key], lang=key),
-                    )
-                )
+class CodeElementColumns:
+    """The code elements of a code list, kept as columns.
 
-    def _scopenote_to_graph(self, _self: URIRef) -> None:
+    A code element is a row of the columns, mapped straight to triples
+    without a CodeElement object per row. The code elements are mapped with
+    the code list, to IRIs when identifiers are given, else to blank nodes
+    labelled by their notation, as a CodeElement without identifier is. A
+    code element without a parent is mapped as a top concept of the code
+    list when parents are given, and each code element is linked by next and
+    previous to the rows next to it with the same parent. As a CodeElement
+    has no broader element, the parents are not mapped themselves.
 
-        if getattr(self, "scopenote", None):
+    Use modelldcatnotordf.bulk to build a code list with its code elements.
+    """
 
-            for key in self.scopenote:
-                self._g.add(
-                    (
-                        _self,
-                        SKOS.scopeNote,
-                        Literal(self.scopenote[key], lang=key),
-                    )
-                )
+    __slots__ = ("_in_scheme", "_notation", "_identifier", "_preflabel", "_parent")
 
-    def _exclusion_note_to_graph(self, _self: URIRef) -> None:
-        if getattr(self, "exclusion_note", None):
+    _in_scheme: CodeList
+    _notation: Tuple[str, ...]
+    _identifier: Optional[Tuple[Optional[str], ...]]
+    _preflabel: Dict[str, Tuple[Optional[str], ...]]
+    _parent: Optional[Tuple[Optional[str], ...]]
 
-            for key in self.exclusion_note:
-                self._g.add(
-                    (
-                        _self,
-                        XKOS.exclusionNote,
-                        Literal(self.exclusion_note[key], lang=key),
-                    )
-                )
-
-    def _inclusion_note_to_graph(self, _self: URIRef) -> None:
-        if getattr(self, "inclusion_note", None):
+    def __init__(
+        self,
+        in_scheme: CodeList,
+        notation: Sequence[str],
+        preflabel: Optional[Dict[str, Sequence[Optional[str]]]] = None,
+        identifier: Optional[Sequence[Optional[str]]] = None,
+        parent: Optional[Sequence[Optional[str]]] = None,
+    ) -> None:
+        """Inits the columns, in the order of the code elements.
 
-            for key in self.inclusion_note:
-                self._g.add(
-                    (
-                        _self,
-                        XKOS.inclusionNote,
-                        Literal(self.inclusion_note[key], lang=key),
+        Args:
+            in_scheme: the code list of the code elements
+            notation: the notation of each code element
+            preflabel: the preferred label of each code element, by language
+            identifier: the identifier of each code element, if any
+            parent: the notation of the parent of each code element, if any
+
+        Raises:
+            ValueError: if a column is not as long as the notation column, a
+                notation labelling a blank node or referred to by parents is
+                not unique, or a parent is not the notation of a code element
+        """
+        self._in_scheme = in_scheme
+        self._notation = tuple(notation)
+        self._preflabel = {
+            language: self._column(f"preflabel@{language}", labels)
+            for language, labels in (preflabel or {}).items()
+        }
+        self._identifier = (
+            None
+            if identifier is None
+            else tuple(
+                None if value is None else uri(value)
+                for value in self._column("identifier", identifier)
+            )
+        )
+        self._parent = None if parent is None else self._column("parent", parent)
+
+        # The notations label the blank nodes, and are referred to by parents:
+        if (
+            self._identifier is None
+            or None in self._identifier
+            or self._parent is not None
+        ):
+            notations = set()
+            for notation in self._notation:
+                if notation in notations:
+                    raise ValueError(
+                        f"The notation {notation!r} is given to more than one "
+                        "code element"
                     )
-                )
-
-    def _next_element_to_graph(self, _self: URIRef) -> None:
+                notations.add(notation)
+        if self._parent is not None:
+            for value in self._parent:
+                if value is not None and value not in notations:
+                    raise ValueError(f"No code element has the parent {value!r}")
 
-        if getattr(self, "next_element", None):
-
-            if isinstance(self.next_element, CodeElement):
-                _next_element = (
-                    URIRef(self.next_element.identifier)
-                    if getattr(self.next_element, "identifier", None)
-                    else BNode()
-                )
+    def __len__(self) -> int:
+        """Returns the number of code elements."""
+        return len(self._notation)
 
-                for _s, p, o in self.next_element._to_graph().triples(
-                    (None, None, None)
-                ):
-                    self._g.add(
-                        (_next_element, p, o)
-                        if isinstance(_next_element, BNode)
-                        else (_s, p, o)
-                    )
-            elif isinstance(self.next_element, str):
-                _next_element = URIRef(self.next_element)
+    @property
+    def notation(self) -> Tuple[str, ...]:
+        """Get for notation."""
+        return self._notation
 
-            self._g.add((_self, XKOS.next, _next_element))
+    @property
+    def identifier(self) -> Optional[Tuple[Optional[str], ...]]:
+        """Get for identifier."""
+        return self._identifier
 
-    def _previous_element_to_graph(self, _self: URIRef) -> None:
+    @property
+    def preflabel(self) -> Dict[str, Tuple[Optional[str], ...]]:
+        """Get for preflabel."""
+        return self._preflabel
 
-        if getattr(self, "previous_element", None):
+    @property
+    def parent(self) -> Optional[Tuple[Optional[str], ...]]:
+        """Get for parent."""
+        return self._parent
+
+    def _column(self, name: str, values: Sequence[Any]) -> Tuple[Any, ...]:
+        if len(values) != len(self._notation):
+            raise ValueError(
+                f"The column {name} has {len(values)} values, "
+                f"not {len(self._notation)}"
+            )
+        return tuple(values)
+
+    def _cached_to_graph(self, g: TripleSink, visited: Dict[int, Node]) -> None:
+        # Mapped anew every time, the triples being too many to cache:
+        _scheme = iri(self._in_scheme.identifier)
+        visited[id(self)] = _scheme
+
+        identifiers = self._identifier or (None,) * len(self._notation)
+        nodes: List[Node] = [
+            blank_node(_scheme, SKOS.notation, notation)
+            if identifiers[i] is None
+            else iri(identifiers[i])  # type: ignore
+            for i, notation in enumerate(self._notation)
+        ]
+        parents = self._parent or (None,) * len(nodes)
+        last: Dict[Optional[str], Node] = {}
+
+        for i, _self in enumerate(nodes):
+            row: List[Tuple[Node, Node, Node]] = [
+                (_self, RDF.type, MODELLDCATNO.CodeElement),
+                (_self, SKOS.notation, literal(self._notation[i])),
+                (_self, SKOS.inScheme, _scheme),
+            ]
+            for language, labels in self._preflabel.items():
+                if labels[i]:
+                    row.append(
+                        (_self, SKOS.prefLabel, literal(labels[i], lang=language))
+                    )
 
-            if isinstance(self.previous_element, CodeElement):
-                _previous_element = (
-                    URIRef(self.previous_element.identifier)
-                    if getattr(self.previous_element, "identifier", None)
-                    else BNode()
-                )
+            parent = parents[i]
+            if parent is None and self._parent is not None:
+                row.append((_self, SKOS.topConceptOf, _scheme))
 
-                for _s, p, o in self.previous_element._to_graph().triples(
-                    (None, None, None)
-                ):
-                    self._g.add(
-                        (_previous_element, p, o)
-                        if isinstance(_previous_element, BNode)
-                        else (_s, p, o)
-                    )
-            elif isinstance(self.previous_element, str):
-                _previous_element = URIRef(self.previous_element)
+            if parent in last:
+                row.append((last[parent], XKOS.next, _self))
+                row.append((_self, XKOS.previous, last[parent]))
+            last[parent] = _self
 
-            self._g.add((_self, XKOS.previous, _previous_element))
+            for triple in row:
+                g.add(triple)
 
 
-class Note:
+class Note(_CachedMapping):
     """A class representing a modelldcatno:Note."""
 
     __slots__ = (
         "_identifier",
-        "_g",
         "_property_note",
         "_belongs_to_module",
         "_title",
@@ -3415,21 +3730,33 @@ class Note:
 
     _property_note: dict
     _identifier: URI
-    _g: Graph
+    _visited: Dict[int, Node]
     _belongs_to_module: List[Union[Module, URI]]
     _title: dict
     _dct_identifier: str
     _annotates: List[Union[ModelProperty, ModelElement, URI]]
 
+    _schema: Tuple[Field, ...] = (
+        Field("_dct_identifier", DCTERMS.identifier, LITERAL),
+        Field("_title", DCTERMS.title, LANGUAGE),
+        Field("_property_note", MODELLDCATNO.propertyNote, LANGUAGE),
+        Field("_belongs_to_module", MODELLDCATNO.belongsToModule, REFERENCE, many=True),
+        Field("_annotates", MODELLDCATNO.annotates, REFERENCE, many=True),
+    )
+
     @property
     def identifier(self: Note) -> str:
         """Get for identifier."""
-        return self._identifier
+        try:
+            return self._identifier
+        except AttributeError:
+            # Labelled in the mapping in progress, unless set:
+            return labelled(self)
 
     @identifier.setter
     def identifier(self: Note, identifier: str) -> None:
         """Set for identifier."""
-        self._identifier = URI(identifier)
+        self._identifier = uri(identifier)
 
     @property
     def property_note(self: Note) -> dict:
@@ -3500,129 +3827,68 @@ class Note:
         Returns:
             a rdf serialization as a string according to format encoded as bytes.
         """
-        return self._to_graph().serialize(format=format, encoding=encoding)
+        return serialize(self._to_graph, format, encoding)
+
+    def to_ntriples_stream(self: Note, fileobj: IO[bytes]) -> None:
+        """Maps the note to rdf and writes it as N-Triples to fileobj.
+
+        The triples are written while the note is mapped,
+        without collecting them in a graph first.
+
+        Args:
+            fileobj: a binary file object to write to
+        """
+        self._to_graph(g=NTriplesWriter(fileobj))
 
+    @mapping
     def _to_graph(
         self: Note,
-        type: str = MODELLDCATNO.Note,
-        selfobject: URIRef = None,
+        type: URIRef = MODELLDCATNO.Note,
+        selfobject: Optional[URIRef] = None,
+        g: Optional[TripleSink] = None,
+        visited: Optional[Dict[int, Node]] = None,
     ) -> Graph:
         """Returns the role as graph.
 
         Args:
             type: type for identifying class. Default: MODELLDCATNO.Note
             selfobject: a URIRef passed from a subclass Default: None
+            g: a graph to add the triples to. Default: None
+            visited: nodes of objects already added to the graph. Default: None
 
         Returns:
             the role graph
         """
-        self._g = Graph()
+        self._g = bind_prefixes(Graph()) if g is None else g
+        self._visited = {} if visited is None else visited
+        self._triples = []
+        self._references = []
 
-        if not getattr(self, "identifier", None):
-            self.identifier = Skolemizer.add_skolemization()
+        skolemize(self)
 
-        _self = URIRef(self.identifier)
+        _self = iri(self.identifier)
+        self._visited[id(self)] = _self
 
-        self._g.add((_self, RDF.type, type))
-
-        if getattr(self, "dct_identifier", None):
-            self._g.add((_self, DCTERMS.identifier, Literal(self.dct_identifier)))
-
-        self._title_to_graph(_self)
-        self._property_note_to_graph(_self)
-        self._belongs_to_module_to_graph(_self)
-        self._annotates_to_graph(_self)
+        self._add((_self, RDF.type, type))
+        self._emit(self, _self)
 
         return self._g
 
-    def _title_to_graph(self: Note, _self: URIRef) -> None:
-        if getattr(self, "title", None):
-            for key in self.title:
-                self._g.add(
-                    (
-                        _self,
-                        DCTERMS.title,
-                        Literal(self.title[key], lang=key),
-                    )
-                )
-
-    def _property_note_to_graph(self: Note, _self: URIRef) -> None:
-        if getattr(self, "property_note", None):
-
-            for key in self.property_note:
-                self._g.add(
-                    (
-                        _self,
-                        MODELLDCATNO.propertyNote,
-                        Literal(self.property_note[key], lang=key),
-                    )
-                )
-
-    def _belongs_to_module_to_graph(self: Note, selfobject: URIRef) -> None:
-        if getattr(self, "belongs_to_module", None):
-            for belongs_to_module in self._belongs_to_module:
-
-                if isinstance(belongs_to_module, Module):
-
-                    if not getattr(belongs_to_module, "identifier", None):
-                        belongs_to_module.identifier = Skolemizer.add_skolemization()
-
-                    _belongs_to_module = URIRef(belongs_to_module.identifier)
-
-                    for _s, p, o in belongs_to_module._to_graph().triples(
-                        (None, None, None)
-                    ):
-                        self._g.add((_s, p, o))
-
-                elif isinstance(belongs_to_module, str):
-                    _belongs_to_module = URIRef(belongs_to_module)
-
-                self._g.add(
-                    (
-                        selfobject,
-                        MODELLDCATNO.belongsToModule,
-                        _belongs_to_module,
-                    )
-                )
-
-    def _annotates_to_graph(self: Note, selfobject: URIRef) -> None:
-        if getattr(self, "annotates", None):
-            for annotates in self._annotates:
-
-                if isinstance(annotates, ModelElement) or isinstance(
-                    annotates, ModelProperty
-                ):
-
-                    if not getattr(annotates, "identifier", None):
-                        annotates.identifier = Skolemizer.add_skolemization()
-
-                    _annotates = URIRef(annotates.identifier)
-
-                    for _s, p, o in annotates._to_graph().triples((None, None, None)):
-                        self._g.add((_s, p, o))
-
-                elif isinstance(annotates, str):
-                    _annotates = URIRef(annotates)
-
-                self._g.add(
-                    (
-                        selfobject,
-                        MODELLDCATNO.annotates,
-                        _annotates,
-                    )
-                )
-
 
 class ConstraintRule(Note):
     """A class representing a modelldcatno:ConstraintRule."""
 
-    slots = "_contrains", "constraint_expression"
+    __slots__ = ("_constrains", "_constraint_expression")
 
-    _g: Graph
     _constrains: List[Union[ModelElement, ModelProperty, URI]]
     _identifier: URI
     _constraint_expression: dict
 
+    _schema: Tuple[Field, ...] = (
+        Field("_constraint_expression", MODELLDCATNO.constraintExpression, LANGUAGE),
+        Field("_constrains", MODELLDCATNO.constrains, REFERENCE, many=True),
+    )
+
     @property
     def constrains(
         self: ConstraintRule,
@@ -3632,7 +3898,8 @@ class ConstraintRule(Note):
 
     @constrains.setter
     def constrains(
-        self: ConstraintRule, constrains: List[Union[ModelElement, ModelProperty]]
+        self: ConstraintRule,
+        constrains: List[Union[ModelElement, ModelProperty, URI]],
     ) -> None:
         """Set for constrains."""
         self._constrains = constrains
@@ -3665,79 +3932,41 @@ class ConstraintRule(Note):
         Returns:
             a rdf serialization as a string according to format encoded as bytes.
         """
-        return self._to_graph().serialize(format=format, encoding=encoding)
+        return serialize(self._to_graph, format, encoding)
 
+    @mapping
     def _to_graph(
         self: ConstraintRule,
-        type: str = MODELLDCATNO.ConstraintRule,
-        selfobject: URIRef = None,
+        type: URIRef = MODELLDCATNO.ConstraintRule,
+        selfobject: Optional[URIRef] = None,
+        g: Optional[TripleSink] = None,
+        visited: Optional[Dict[int, Node]] = None,
     ) -> Graph:
         """Returns the constraint rule as graph.
 
         Args:
             type: type for identifying class. Default: MODELLDCATNO.ConstraintRule
             selfobject: a URIRef passed from a subclass Default: None
+            g: a graph to add the triples to. Default: None
+            visited: nodes of objects already added to the graph. Default: None
 
         Returns:
             the role graph
         """
-        if not getattr(self, "identifier", None):
-            self.identifier = Skolemizer.add_skolemization()
-
-        _self = URIRef(self.identifier)
-
-        super(ConstraintRule, self)._to_graph(type, _self)
+        skolemize(self)
 
-        if getattr(self, "constraint_expression", None):
-            for key in self.constraint_expression:
-                self._g.add(
-                    (
-                        URIRef(self.identifier),
-                        MODELLDCATNO.constraintExpression,
-                        Literal(self.constraint_expression[key], lang=key),
-                    )
-                )
+        _self = iri(self.identifier)
 
-        self._constrains_to_graph(_self)
+        super(ConstraintRule, self)._to_graph(type, _self, g, visited)
 
         return self._g
 
-    def _constrains_to_graph(self, _self: URIRef) -> None:
-
-        if getattr(self, "constrains", None):
-
-            for constrains in self.constrains:
-
-                if isinstance(constrains, ModelElement):
-
-                    if not getattr(constrains, "identifier", None):
-                        constrains.identifier = Skolemizer.add_skolemization()
-
-                    _constrains = URIRef(constrains.identifier)
-
-                    for _s, p, o in constrains._to_graph().triples((None, None, None)):
-                        self._g.add((_s, p, o))
-
-                elif isinstance(constrains, ModelProperty):
-
-                    if not getattr(constrains, "identifier", None):
-                        constrains.identifier = Skolemizer.add_skolemization()
-
-                    _constrains = URIRef(constrains.identifier)
-
-                    for _s, p, o in constrains._to_graph().triples((None, None, None)):
-                        self._g.add((_s, p, o))
-
-                elif isinstance(constrains, str):
-                    _constrains = URIRef(constrains)
-
-                self._g.add((_self, MODELLDCATNO.constrains, _constrains))
-
 
 class Or(ConstraintRule):
     """A class representing a modelldcatno:Or."""
 
-    _g: Graph
+    __slots__ = ()
+
     _constrains: List[Union[ModelElement, ModelProperty, URI]]
     _identifier: URI
 
@@ -3759,28 +3988,32 @@ class Or(ConstraintRule):
         Returns:
             a rdf serialization as a string according to format encoded as bytes.
         """
-        return self._to_graph().serialize(format=format, encoding=encoding)
+        return serialize(self._to_graph, format, encoding)
 
+    @mapping
     def _to_graph(
         self: Or,
-        type: str = MODELLDCATNO.Or,
-        selfobject: URIRef = None,
+        type: URIRef = MODELLDCATNO.Or,
+        selfobject: Optional[URIRef] = None,
+        g: Optional[TripleSink] = None,
+        visited: Optional[Dict[int, Node]] = None,
     ) -> Graph:
         """Returns the modelldcatno:Or as graph.
 
         Args:
             type: type for identifying class. Default: MODELLDCATNO.Or
             selfobject: a URIRef passed from a subclass Default: None
+            g: a graph to add the triples to. Default: None
+            visited: nodes of objects already added to the graph. Default: None
 
         Returns:
             the Or graph
         """
-        if not getattr(self, "identifier", None):
-            self.identifier = Skolemizer.add_skolemization()
+        skolemize(self)
 
-        _self = URIRef(self.identifier)
+        _self = iri(self.identifier)
 
-        super(Or, self)._to_graph(MODELLDCATNO.Or, _self)
+        super(Or, self)._to_graph(MODELLDCATNO.Or, _self, g, visited)
 
         return self._g
 
@@ -3788,7 +4021,8 @@ class Or(ConstraintRule):
 class Xor(ConstraintRule):
     """A class representing a modelldcatno:Xor."""
 
-    _g: Graph
+    __slots__ = ()
+
     _constrains: List[Union[ModelElement, ModelProperty, URI]]
     _identifier: URI
 
@@ -3810,28 +4044,32 @@ class Xor(ConstraintRule):
         Returns:
             a rdf serialization as a string according to format encoded as bytes.
         """
-        return self._to_graph().serialize(format=format, encoding=encoding)
+        return serialize(self._to_graph, format, encoding)
 
+    @mapping
     def _to_graph(
         self: Xor,
-        type: str = MODELLDCATNO.Xor,
-        selfobject: URIRef = None,
+        type: URIRef = MODELLDCATNO.Xor,
+        selfobject: Optional[URIRef] = None,
+        g: Optional[TripleSink] = None,
+        visited: Optional[Dict[int, Node]] = None,
     ) -> Graph:
         """Returns the modelldcatno:Xor as graph.
 
         Args:
             type: type for identifying class. Default: MODELLDCATNO.Xor
             selfobject: a URIRef passed from a subclass Default: None
+            g: a graph to add the triples to. Default: None
+            visited: nodes of objects already added to the graph. Default: None
 
         Returns:
             the Xor graph
         """
-        if not getattr(self, "identifier", None):
-            self.identifier = Skolemizer.add_skolemization()
+        skolemize(self)
 
-        _self = URIRef(self.identifier)
+        _self = iri(self.identifier)
 
-        super(Xor, self)._to_graph(MODELLDCATNO.Xor, _self)
+        super(Xor, self)._to_graph(MODELLDCATNO.Xor, _self, g, visited)
 
         return self._g
 
@@ -3839,8 +4077,9 @@ class Xor(ConstraintRule):
 class Module(ModelElement):
     """A class representing a modelldcatno:Module."""
 
+    __slots__ = ()
+
     _identifier: URI
-    _g: Graph
 
     def __init__(self, identifier: Optional[str] = None) -> None:
         """Inits an object with default values."""
@@ -3860,26 +4099,30 @@ class Module(ModelElement):
         Returns:
             a rdf serialization as a string according to format encoded as bytes.
         """
-        return self._to_graph().serialize(format=format, encoding=encoding)
+        return serialize(self._to_graph, format, encoding)
 
+    @mapping
     def _to_graph(
         self: Module,
-        type: str = MODELLDCATNO.Module,
-        selfobject: URIRef = None,
+        type: URIRef = MODELLDCATNO.Module,
+        selfobject: Optional[URIRef] = None,
+        g: Optional[TripleSink] = None,
+        visited: Optional[Dict[int, Node]] = None,
     ) -> Graph:
         """Returns the module as graph.
 
         Args:
             type: type for identifying class. Default: MODELLDCATNO.Module
             selfobject: a URIRef passed from a subclass Default: None
+            g: a graph to add the triples to. Default: None
+            visited: nodes of objects already added to the graph. Default: None
 
         Returns:
             the module graph
         """
-        if not getattr(self, "identifier", None):
-            self.identifier = Skolemizer.add_skolemization()
-        _self = URIRef(self.identifier)
+        skolemize(self)
+        _self = iri(self.identifier)
 
-        super(Module, self)._to_graph(type, _self)
+        super(Module, self)._to_graph(type, _self, g, visited)
 
         return self._g
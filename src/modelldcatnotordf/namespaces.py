@@ -0,0 +1,133 @@
+"""Module for the namespaces used when mapping to rdf.
+
+This module contains the namespaces used by the library, as vocabularies
+creating each of their terms once, and the table of prefixes bound in the
+graphs serialized by the library.
+
+The prefixes are bound once, in the graph an object is mapped into, and
+not by each of the objects referred to. Graphs given to a mapping, e.g.
+the graph of a parent object, are expected to have the prefixes bound.
+
+Example:
+    >>> from rdflib import Graph
+    >>> from modelldcatnotordf.namespaces import bind_prefixes, MODELLDCATNO
+    >>>
+    >>> g = bind_prefixes(Graph())
+    >>> g.namespace_manager.compute_qname(MODELLDCATNO.ObjectType)[0]
+    'modelldcatno'
+"""
+from __future__ import annotations
+
+import re
+from typing import Dict, Optional, Tuple, Type, Union
+
+import rdflib
+from rdflib import Graph, Namespace, URIRef
+from rdflib.namespace import DefinedNamespace
+
+
+class Vocabulary(Namespace):
+    """A namespace creating each of its terms once.
+
+    Getting a term of an rdflib namespace creates and validates a new IRI
+    every time. The terms of a vocabulary are kept on the vocabulary once
+    created, e.g. the predicates of the triples added by every mapping.
+    The terms of a defined namespace, e.g. DCTERMS, are checked by it.
+    """
+
+    def __new__(cls, namespace: Union[str, Type[DefinedNamespace]]) -> Vocabulary:
+        """Creates a vocabulary of the terms of the namespace."""
+        vocabulary = super().__new__(cls, str(namespace))
+        vocabulary.__dict__["_namespace"] = (
+            Namespace(namespace) if isinstance(namespace, str) else namespace
+        )
+        return vocabulary  # type: ignore
+
+    def __getattr__(self, name: str) -> URIRef:
+        """Returns the term, created the first time it is got."""
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        term = getattr(self.__dict__["_namespace"], name)
+        self.__dict__[name] = term
+        return term
+
+    @property
+    def title(self) -> URIRef:  # type: ignore[override]
+        """Returns the term title, which Namespace overrides str.title with."""
+        try:
+            return self.__dict__["title"]
+        except KeyError:
+            return self.__getattr__("title")
+
+
+ADMS = Vocabulary("http://www.w3.org/ns/adms#")
+DCAT = Vocabulary("http://www.w3.org/ns/dcat#")
+DCTERMS = Vocabulary(rdflib.DCTERMS)
+FOAF = Vocabulary(rdflib.FOAF)
+MODELLDCATNO = Vocabulary("https://data.norge.no/vocabulary/modelldcatno#")
+ODRL = Vocabulary("http://www.w3.org/ns/odrl/2/")
+OWL = Vocabulary(rdflib.OWL)
+PROF = Vocabulary(rdflib.PROF)
+RDF = Vocabulary(rdflib.RDF)
+RDFS = Vocabulary(rdflib.RDFS)
+SKOS = Vocabulary(rdflib.SKOS)
+XKOS = Vocabulary("http://rdf-vocabulary.ddialliance.org/xkos#")
+XSD = Vocabulary(rdflib.XSD)
+
+PREFIXES: Dict[str, Namespace] = {
+    "adms": ADMS,
+    "dcat": DCAT,
+    "dct": DCTERMS,
+    "foaf": FOAF,
+    "modelldcatno": MODELLDCATNO,
+    "odrl": ODRL,
+    "owl": OWL,
+    "prof": PROF,
+    "rdf": RDF,
+    "rdfs": RDFS,
+    "skos": SKOS,
+    "xkos": XKOS,
+    "xsd": XSD,
+}
+
+# The local names written with a prefix, other IRIs are written in full:
+_LOCAL_NAME = re.compile(r"[A-Za-z_][A-Za-z0-9_\-]*")
+
+# Longest namespace first, so that an IRI gets the most specific prefix:
+_NAMESPACES = sorted(
+    ((str(namespace), prefix) for prefix, namespace in PREFIXES.items()),
+    key=lambda namespace: -len(namespace[0]),
+)
+
+
+def bind_prefixes(g: Graph) -> Graph:
+    """Binds the prefixes of the library in the graph.
+
+    Args:
+        g: the graph to bind the prefixes in
+
+    Returns:
+        the graph
+    """
+    for prefix, namespace in PREFIXES.items():
+        g.bind(prefix, namespace)
+
+    return g
+
+
+def prefixed_name(iri: str) -> Optional[Tuple[str, str]]:
+    """Returns the prefix and local name of the iri.
+
+    Args:
+        iri: the iri to split
+
+    Returns:
+        the prefix and the local name, or None if the iri has no prefix
+        in the table or a local name not safe to write with a prefix.
+    """
+    for namespace, prefix in _NAMESPACES:
+        if iri.startswith(namespace) and _LOCAL_NAME.fullmatch(iri, len(namespace)):
+            return prefix, iri[len(namespace) :]
+
+    return None
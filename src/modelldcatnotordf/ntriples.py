@@ -0,0 +1,136 @@
+"""Module for writing triples as N-Triples while they are mapped.
+
+This module contains the protocols of what triples are mapped into, a
+writer that writes the triples added to it directly to a file object,
+instead of keeping them in a store, and a writer that writes them as
+canonical N-Triples: one line per distinct triple, sorted. As blank
+nodes are labelled by the path to them, the canonical N-Triples of
+unchanged objects can be compared as strings.
+
+Example:
+    >>> from io import BytesIO
+    >>> from modelldcatnotordf.modelldcatno import ObjectType
+    >>> from modelldcatnotordf.ntriples import CANONICAL
+    >>>
+    >>> objecttype = ObjectType("http://example.com/objecttypes/1")
+    >>> stream = BytesIO()
+    >>> objecttype.to_ntriples_stream(stream)
+    >>> rdf = objecttype.to_rdf(format=CANONICAL)
+    >>> rdf == objecttype.to_rdf(format=CANONICAL)
+    True
+"""
+from __future__ import annotations
+
+from typing import IO, Optional, Protocol, Set, Tuple, Union
+
+from rdflib.plugins.serializers.nt import _nt_row
+from rdflib.term import Node
+
+# The format of canonical N-Triples:
+CANONICAL = "nt-canonical"
+
+
+class TripleSink(Protocol):
+    """What the triples of a mapping are added to, e.g. a graph or a writer."""
+
+    def add(self, triple: Tuple[Node, Node, Node]) -> object:
+        """Adds the triple.
+
+        Args:
+            triple: the triple to add
+        """
+
+
+class Writer(TripleSink, Protocol):
+    """A sink serializing the triples added to it once they are all added.
+
+    A writer is not a graph: the triples added cannot be read back.
+    """
+
+    def write(self, fileobj: IO[bytes], encoding: str = "utf-8") -> None:
+        """Writes the triples added to fileobj.
+
+        Args:
+            fileobj: a binary file object to write to
+            encoding: the encoding to write in
+        """
+
+    def getvalue(self, encoding: Optional[str] = "utf-8") -> Union[bytes, str]:
+        """Returns the triples added, serialized.
+
+        Args:
+            encoding: the encoding to serialize into, or None for a string
+        """
+
+
+class NTriplesWriter:
+    """A sink writing the triples added to it as N-Triples to a file object.
+
+    The triples are written as they are added, and are not kept.
+    A triple added more than once is written more than once.
+    """
+
+    __slots__ = ("_fileobj",)
+
+    def __init__(self, fileobj: IO[bytes]) -> None:
+        """Inits the writer with the file object to write to."""
+        self._fileobj = fileobj
+
+    def add(self, triple: Tuple[Node, Node, Node]) -> NTriplesWriter:
+        """Writes the triple to the file object.
+
+        Args:
+            triple: the triple to write
+
+        Returns:
+            the writer
+        """
+        self._fileobj.write(_nt_row(triple).encode())
+        return self
+
+
+class SortedNTriplesWriter:
+    """A writer writing the triples added to it as canonical N-Triples.
+
+    The triples are kept as N-Triples lines, and written once each, sorted.
+    """
+
+    __slots__ = ("_rows",)
+
+    def __init__(self) -> None:
+        """Inits the writer without triples."""
+        self._rows: Set[str] = set()
+
+    def add(self, triple: Tuple[Node, Node, Node]) -> SortedNTriplesWriter:
+        """Adds the triple as an N-Triples line.
+
+        Args:
+            triple: the triple to add
+
+        Returns:
+            the writer
+        """
+        self._rows.add(_nt_row(triple))
+        return self
+
+    def write(self, fileobj: IO[bytes], encoding: str = "utf-8") -> None:
+        """Writes the triples added as sorted N-Triples to fileobj.
+
+        Args:
+            fileobj: a binary file object to write to
+            encoding: the encoding to write in
+        """
+        for row in sorted(self._rows):
+            fileobj.write(row.encode(encoding))
+
+    def getvalue(self, encoding: Optional[str] = "utf-8") -> Union[bytes, str]:
+        """Returns the triples added as sorted N-Triples.
+
+        Args:
+            encoding: the encoding to serialize into, or None for a string
+
+        Returns:
+            a canonical serialization, encoded as bytes unless encoding is None.
+        """
+        ntriples = "".join(sorted(self._rows))
+        return ntriples if encoding is None else ntriples.encode(encoding)
@@ -0,0 +1,409 @@
+"""Module for mapping rdf back to modelldcat-ap-no objects.
+
+This module contains functions for reading a graph published
+according to the modelldcat-ap-no specification
+into InformationModel, ModelElement, ModelProperty, CodeElement,
+FoafDocument and LicenseDocument objects.
+
+Resources are looked up by type, and every reference to a resource is
+resolved into the same object. References to resources of types that are
+not read, e.g. concepts and agents, are kept as IRIs. Blank nodes of types
+that are not read, e.g. contact points, locations and periods of time,
+cannot be kept as IRIs, and are left out with a warning.
+
+Example:
+    >>> from modelldcatnotordf.modelldcatno import InformationModel
+    >>> from modelldcatnotordf.reader import from_rdf
+    >>>
+    >>> src = '''
+    ...     @prefix dct: <http://purl.org/dc/terms/> .
+    ...     @prefix modelldcatno: <https://data.norge.no/vocabulary/modelldcatno#> .
+    ...
+    ...     <http://example.com/informationmodels/1>
+    ...         a modelldcatno:InformationModel ;
+    ...         dct:title "Modell 1"@nb .
+    ... '''
+    >>> objects = from_rdf(src)
+    >>> model = objects["http://example.com/informationmodels/1"]
+    >>> isinstance(model, InformationModel)
+    True
+    >>> model.title
+    {'nb': 'Modell 1'}
+"""
+from __future__ import annotations
+
+from typing import Any, Callable, cast, Dict, List, Optional, Tuple, Union
+import warnings
+
+from rdflib import BNode, Graph, Literal, URIRef
+from rdflib.term import Node
+
+from modelldcatnotordf.document import FoafDocument
+from modelldcatnotordf.licensedocument import LicenseDocument
+from modelldcatnotordf.modelldcatno import (
+    Abstraction,
+    Association,
+    Attribute,
+    Choice,
+    CodeElement,
+    CodeList,
+    Collection,
+    Composition,
+    ConstraintRule,
+    DataType,
+    InformationModel,
+    ModelElement,
+    ModelProperty,
+    Module,
+    Note,
+    ObjectType,
+    Or,
+    Realization,
+    Role,
+    RootObjectType,
+    SimpleType,
+    Specialization,
+    Standard,
+    Xor,
+)
+from modelldcatnotordf.namespaces import (
+    ADMS,
+    DCAT,
+    DCTERMS,
+    FOAF,
+    MODELLDCATNO,
+    OWL,
+    PROF,
+    RDF,
+    RDFS,
+    SKOS,
+    XKOS,
+    XSD,
+)
+
+ModelObject = Union[
+    Standard,
+    ModelElement,
+    ModelProperty,
+    CodeElement,
+    Note,
+    FoafDocument,
+    LicenseDocument,
+]
+
+
+def _set_str(
+    modelobject: ModelObject, name: str, o: Node, objects: Dict[Node, ModelObject]
+) -> None:
+    setattr(modelobject, name, str(o))
+
+
+def _set_value(
+    modelobject: ModelObject, name: str, o: Node, objects: Dict[Node, ModelObject]
+) -> None:
+    setattr(modelobject, name, cast(Literal, o).toPython())
+
+
+def _set_dict(
+    modelobject: ModelObject, name: str, o: Node, objects: Dict[Node, ModelObject]
+) -> None:
+    value = getattr(modelobject, name, None) or {}
+    value[getattr(o, "language", None)] = str(o)
+    setattr(modelobject, name, value)
+
+
+def _set_ref(
+    modelobject: ModelObject, name: str, o: Node, objects: Dict[Node, ModelObject]
+) -> None:
+    ref = _resolve(o, objects)
+    if ref is not None:
+        setattr(modelobject, name, ref)
+
+
+def _append_str(
+    modelobject: ModelObject, name: str, o: Node, objects: Dict[Node, ModelObject]
+) -> None:
+    _list(modelobject, name).append(str(o))
+
+
+def _append_ref(
+    modelobject: ModelObject, name: str, o: Node, objects: Dict[Node, ModelObject]
+) -> None:
+    ref = _resolve(o, objects)
+    if ref is not None:
+        _list(modelobject, name).append(ref)
+
+
+def _resolve(
+    o: Node, objects: Dict[Node, ModelObject]
+) -> Optional[Union[ModelObject, str]]:
+    if o in objects:
+        return objects[o]
+    if isinstance(o, URIRef):
+        return str(o)
+    return None
+
+
+def _list(modelobject: ModelObject, name: str) -> List[Any]:
+    value = getattr(modelobject, name, None)
+    if value is None:
+        # Read back, as the list set may be copied:
+        setattr(modelobject, name, [])
+        value = getattr(modelobject, name)
+    return value
+
+
+_Setter = Callable[[ModelObject, str, Node, Dict[Node, ModelObject]], None]
+# The objects of a property without setter are of types that are not read:
+_Properties = Dict[Node, Tuple[str, Optional[_Setter]]]
+
+_STANDARD: _Properties = {
+    DCTERMS.title: ("title", _set_dict),
+    RDFS.seeAlso: ("has_reference", _set_str),
+    OWL.versionInfo: ("has_version_number", _set_str),
+}
+
+_INFORMATIONMODEL: _Properties = {
+    DCTERMS.title: ("title", _set_dict),
+    DCTERMS.description: ("description", _set_dict),
+    DCTERMS.publisher: ("publisher", _set_ref),
+    DCTERMS.subject: ("subject", _append_ref),
+    MODELLDCATNO.containsModelElement: ("modelelements", _append_ref),
+    DCTERMS.license: ("licensedocument", _set_ref),
+    DCTERMS.replaces: ("replaces", _append_ref),
+    DCTERMS.isReplacedBy: ("is_replaced_by", _append_ref),
+    DCTERMS.hasPart: ("has_part", _append_ref),
+    DCTERMS.isPartOf: ("is_part_of", _append_ref),
+    FOAF.homepage: ("homepage", _set_str),
+    DCTERMS.modified: ("modified", _set_str),
+    DCTERMS.type: ("dct_type", _set_ref),
+    ADMS.versionNotes: ("version_note", _set_dict),
+    ADMS.status: ("status", _set_ref),
+    DCTERMS.hasFormat: ("has_format", _append_ref),
+    PROF.isProfileOf: ("is_profile_of", _set_ref),
+    DCTERMS.conformsTo: ("conforms_to", _set_ref),
+    MODELLDCATNO.informationModelIdentifier: (
+        "informationmodelidentifier",
+        _set_str,
+    ),
+    OWL.versionInfo: ("version_info", _set_str),
+    DCAT.contactPoint: ("contactpoints", None),
+    DCTERMS.spatial: ("locations", _append_ref),
+    DCTERMS.temporal: ("temporal", None),
+}
+
+_DOCUMENT: _Properties = {
+    DCTERMS.title: ("title", _set_dict),
+    DCTERMS.language: ("language", _set_str),
+    DCTERMS["format"]: ("format", _set_str),
+    RDFS.seeAlso: ("rdfs_see_also", _set_str),
+}
+
+_LICENSEDOCUMENT: _Properties = {
+    DCTERMS.type: ("type", _append_ref),
+}
+
+_MODELELEMENT: _Properties = {
+    DCTERMS.title: ("title", _set_dict),
+    DCTERMS.identifier: ("dct_identifier", _set_str),
+    DCTERMS.subject: ("subject", _set_ref),
+    MODELLDCATNO.belongsToModule: ("belongs_to_module", _append_ref),
+    DCTERMS.description: ("description", _set_dict),
+    MODELLDCATNO.hasProperty: ("has_property", _append_ref),
+}
+
+_SIMPLETYPE: _Properties = {
+    **_MODELELEMENT,
+    XSD.minLength: ("min_length", _set_value),
+    XSD.maxLength: ("max_length", _set_value),
+    XSD.fractionDigits: ("fraction_digits", _set_value),
+    XSD.length: ("length", _set_value),
+    XSD.totalDigits: ("total_digits", _set_value),
+    XSD.maxInclusive: ("max_inclusive", _set_value),
+    XSD.minInclusive: ("min_inclusive", _set_value),
+    XSD.minExclusive: ("min_exclusive", _set_value),
+    XSD.maxExclusive: ("max_exclusive", _set_value),
+    MODELLDCATNO.typeDefinitionReference: ("type_definition_reference", _set_str),
+    XSD.pattern: ("pattern", _set_str),
+}
+
+_CODELIST: _Properties = {
+    **_MODELELEMENT,
+    RDFS.seeAlso: ("has_reference", _set_str),
+}
+
+_MODELPROPERTY: _Properties = {
+    MODELLDCATNO.sequenceNumber: ("sequence_number", _set_value),
+    # minOccurs and maxOccurs are not part of the rdflib XSD namespace:
+    URIRef(f"{XSD}minOccurs"): ("min_occurs", _set_value),
+    URIRef(f"{XSD}maxOccurs"): ("max_occurs", _set_value),
+    DCTERMS.title: ("title", _set_dict),
+    MODELLDCATNO.navigable: ("navigable", _set_value),
+    DCTERMS.subject: ("subject", _set_ref),
+    MODELLDCATNO.hasType: ("has_type", _append_ref),
+    DCTERMS.description: ("description", _set_dict),
+    MODELLDCATNO.belongsToModule: ("belongs_to_module", _append_ref),
+    MODELLDCATNO.formsSymmetryWith: ("forms_symmetry_with", _set_ref),
+    MODELLDCATNO.relationPropertyLabel: ("relation_property_label", _set_dict),
+}
+
+_ROLE: _Properties = {
+    **_MODELPROPERTY,
+    MODELLDCATNO.hasObjectType: ("has_object_type", _set_ref),
+}
+
+_COMPOSITION: _Properties = {
+    **_MODELPROPERTY,
+    MODELLDCATNO.contains: ("contains", _set_ref),
+}
+
+_COLLECTION: _Properties = {
+    **_MODELPROPERTY,
+    MODELLDCATNO.hasMember: ("has_member", _set_ref),
+}
+
+_ASSOCIATION: _Properties = {
+    **_MODELPROPERTY,
+    MODELLDCATNO.refersTo: ("refers_to", _set_ref),
+}
+
+_CHOICE: _Properties = {
+    **_MODELPROPERTY,
+    MODELLDCATNO.hasSome: ("has_some", _append_ref),
+}
+
+_ATTRIBUTE: _Properties = {
+    **_MODELPROPERTY,
+    MODELLDCATNO.containsObjectType: ("contains_object_type", _set_ref),
+    MODELLDCATNO.hasSimpleType: ("has_simple_type", _set_ref),
+    MODELLDCATNO.hasDataType: ("has_data_type", _set_ref),
+    MODELLDCATNO.hasValueFrom: ("has_value_from", _set_ref),
+}
+
+_SPECIALIZATION: _Properties = {
+    **_MODELPROPERTY,
+    MODELLDCATNO.hasGeneralConcept: ("has_general_concept", _set_ref),
+}
+
+_REALIZATION: _Properties = {
+    **_MODELPROPERTY,
+    MODELLDCATNO.hasSupplier: ("has_supplier", _set_ref),
+}
+
+_ABSTRACTION: _Properties = {
+    **_MODELPROPERTY,
+    MODELLDCATNO.isAbstractionOf: ("is_abstraction_of", _set_ref),
+}
+
+_CODEELEMENT: _Properties = {
+    DCTERMS.identifier: ("dct_identifier", _set_str),
+    SKOS.notation: ("notation", _set_str),
+    DCTERMS.subject: ("subject", _set_ref),
+    SKOS.prefLabel: ("preflabel", _set_dict),
+    SKOS.inScheme: ("in_scheme", _append_ref),
+    SKOS.topConceptOf: ("top_concept_of", _append_ref),
+    SKOS.altLabel: ("altlabel", _set_dict),
+    SKOS.definition: ("definition", _set_dict),
+    SKOS.example: ("example", _append_str),
+    SKOS.hiddenLabel: ("hiddenlabel", _set_dict),
+    SKOS.note: ("note", _set_dict),
+    SKOS.scopeNote: ("scopenote", _set_dict),
+    XKOS.exclusionNote: ("exclusion_note", _set_dict),
+    XKOS.inclusionNote: ("inclusion_note", _set_dict),
+    XKOS.next: ("next_element", _set_ref),
+    XKOS.previous: ("previous_element", _set_ref),
+}
+
+_NOTE: _Properties = {
+    DCTERMS.identifier: ("dct_identifier", _set_str),
+    DCTERMS.title: ("title", _set_dict),
+    MODELLDCATNO.propertyNote: ("property_note", _set_dict),
+    MODELLDCATNO.belongsToModule: ("belongs_to_module", _append_ref),
+    MODELLDCATNO.annotates: ("annotates", _append_ref),
+}
+
+_CONSTRAINTRULE: _Properties = {
+    **_NOTE,
+    MODELLDCATNO.constraintExpression: ("constraint_expression", _set_dict),
+    MODELLDCATNO.constrains: ("constrains", _append_ref),
+}
+
+_TYPES: Dict[Node, Tuple[Callable[..., ModelObject], _Properties]] = {
+    DCTERMS.Standard: (Standard, _STANDARD),
+    MODELLDCATNO.InformationModel: (InformationModel, _INFORMATIONMODEL),
+    MODELLDCATNO.ObjectType: (ObjectType, _MODELELEMENT),
+    MODELLDCATNO.DataType: (DataType, _MODELELEMENT),
+    MODELLDCATNO.RootObjectType: (RootObjectType, _MODELELEMENT),
+    MODELLDCATNO.Module: (Module, _MODELELEMENT),
+    MODELLDCATNO.SimpleType: (SimpleType, _SIMPLETYPE),
+    MODELLDCATNO.CodeList: (CodeList, _CODELIST),
+    MODELLDCATNO.Role: (Role, _ROLE),
+    MODELLDCATNO.Composition: (Composition, _COMPOSITION),
+    MODELLDCATNO.Collection: (Collection, _COLLECTION),
+    MODELLDCATNO.Association: (Association, _ASSOCIATION),
+    MODELLDCATNO.Choice: (Choice, _CHOICE),
+    MODELLDCATNO.Attribute: (Attribute, _ATTRIBUTE),
+    MODELLDCATNO.Specialization: (Specialization, _SPECIALIZATION),
+    MODELLDCATNO.Realization: (Realization, _REALIZATION),
+    MODELLDCATNO.Abstraction: (Abstraction, _ABSTRACTION),
+    MODELLDCATNO.CodeElement: (CodeElement, _CODEELEMENT),
+    MODELLDCATNO.Note: (Note, _NOTE),
+    MODELLDCATNO.ConstraintRule: (ConstraintRule, _CONSTRAINTRULE),
+    MODELLDCATNO.Or: (Or, _CONSTRAINTRULE),
+    MODELLDCATNO.Xor: (Xor, _CONSTRAINTRULE),
+    FOAF.Document: (FoafDocument, _DOCUMENT),
+    DCTERMS.LicenseDocument: (LicenseDocument, _LICENSEDOCUMENT),
+}
+
+
+def from_rdf(data: Union[str, bytes], format: str = "turtle") -> Dict[str, ModelObject]:
+    """Maps rdf to modelldcat-ap-no objects.
+
+    Args:
+        data: a rdf serialization
+        format: the format of the serialization. Default: turtle
+
+    Returns:
+        the objects with an identifier, keyed by identifier
+    """
+    return from_graph(Graph().parse(data=data, format=format))
+
+
+def from_graph(g: Graph) -> Dict[str, ModelObject]:
+    """Maps a graph to modelldcat-ap-no objects.
+
+    The graph is read in two passes: one over the type triples to create
+    an object for every typed resource, and one over all triples
+    to set the properties of the objects.
+
+    Args:
+        g: the graph to map
+
+    Returns:
+        the objects with an identifier, keyed by identifier
+    """
+    objects: Dict[Node, ModelObject] = {}
+    properties: Dict[Node, _Properties] = {}
+
+    for s, o in g.subject_objects(RDF.type):
+        if o in _TYPES and s not in objects:
+            cls, properties[s] = _TYPES[o]
+            objects[s] = cls(str(s)) if isinstance(s, URIRef) else cls()
+
+    for s, p, o in g:
+        if s in objects and p in properties[s]:
+            name, setter = properties[s][p]
+            if setter is None or (isinstance(o, BNode) and o not in objects):
+                warnings.warn(
+                    f"The {name} {o} of {s} is of a type that is not read, "
+                    "and is left out",
+                    stacklevel=2,
+                )
+            else:
+                setter(objects[s], name, o, objects)
+
+    return {
+        str(s): modelobject
+        for s, modelobject in objects.items()
+        if isinstance(s, URIRef)
+    }
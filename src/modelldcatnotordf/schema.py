@@ -0,0 +1,258 @@
+"""Module for mapping the attributes of objects to triples by a schema.
+
+A class declares the attributes it maps as a schema: a field per attribute,
+with the predicate it is mapped to, the kind of term it is mapped to and
+whether it holds many values. When the class is defined, the fields of the
+class and of the classes it inherits from are compiled into an emitter, a
+function per field specialised for its kind, so that mapping an object is
+one loop over the emitters of its class.
+
+The kinds of terms are:
+ - LANGUAGE: a dict of texts by language, mapped to language-tagged literals
+ - LITERAL: a value mapped to a literal, of the datatype of the field if any
+ - IRI: an identifier mapped to an IRI
+ - REFERENCE: an object, mapped to its identifier and mapped itself, or an
+   identifier
+ - CONCEPT: a concept, mapped to its identifier with its triples, or an
+   identifier
+ - CARDINALITY: a number, or "*", mapped to an xsd:maxOccurs literal
+
+Example:
+    >>> from modelldcatnotordf.modelldcatno import SimpleType
+    >>> from modelldcatnotordf.schema import fields
+    >>>
+    >>> for field in fields(SimpleType)[:3]:
+    ...     print(field.attribute, field.predicate, field.kind)
+    _title http://purl.org/dc/terms/title language
+    _dct_identifier http://purl.org/dc/terms/identifier literal
+    _has_property https://data.norge.no/vocabulary/modelldcatno#hasProperty reference
+"""
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from concepttordf import Concept
+from rdflib import URIRef
+from rdflib.term import Node
+
+from modelldcatnotordf.mapping import (
+    foreign_triples,
+    iri,
+    is_shallow,
+    literal,
+    relabel_blank_nodes,
+    skolemize,
+)
+from modelldcatnotordf.namespaces import XSD
+
+LANGUAGE = "language"
+LITERAL = "literal"
+IRI = "iri"
+REFERENCE = "reference"
+CONCEPT = "concept"
+CARDINALITY = "cardinality"
+
+Emitter = Callable[[Any, Node], None]
+
+
+class Field(NamedTuple):
+    """A field of a schema, mapping an attribute to a predicate.
+
+    Attributes:
+        attribute: the name of the attribute holding the value
+        predicate: the predicate the value is mapped to
+        kind: the kind of term the value is mapped to
+        many: whether the attribute holds a list of values
+        datatype: the datatype of a literal
+        zero: whether a value of zero is mapped, and not only a value set
+    """
+
+    attribute: str
+    predicate: URIRef
+    kind: str
+    many: bool = False
+    datatype: Optional[URIRef] = None
+    zero: bool = False
+
+
+class SchemaMapping:
+    """Base class for objects mapped by the schema of their class.
+
+    The schema of a class holds its own fields, which are mapped after the
+    fields of the classes it inherits from by the emitter of the class.
+    """
+
+    __slots__ = ()
+
+    _schema: Tuple[Field, ...] = ()
+    _emit: Emitter
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:  # noqa: ANN401
+        """Compiles the emitter of the class from its fields."""
+        super().__init_subclass__(**kwargs)
+        cls._emit = staticmethod(compile_schema(fields(cls)))  # type: ignore
+
+
+def fields(cls: type) -> List[Field]:
+    """Returns the fields of the class, inherited fields first.
+
+    Args:
+        cls: a class with a schema
+
+    Returns:
+        the fields the objects of the class are mapped by.
+    """
+    return [
+        field
+        for klass in reversed(cls.__mro__)
+        for field in klass.__dict__.get("_schema", ())
+    ]
+
+
+def compile_schema(schema: Sequence[Field]) -> Emitter:
+    """Returns an emitter adding the triples of the fields set on an object.
+
+    The emitter takes the object, with the _add method adding a triple
+    to the mapping in progress, and the node the object is mapped to.
+
+    Args:
+        schema: the fields to map
+
+    Returns:
+        the emitter of the fields.
+    """
+    emitters = [_EMITTERS[field.kind](field) for field in schema]
+
+    def emit(modelobject: Any, _self: Node) -> None:  # noqa: ANN401
+        for emitter in emitters:
+            emitter(modelobject, _self)
+
+    return emit
+
+
+def _values(field: Field) -> Callable[[Any], List[Any]]:
+    """Returns a function getting the values of the field set on an object."""
+    attribute = field.attribute
+
+    if field.many:
+        return lambda modelobject: getattr(modelobject, attribute, None) or []
+
+    if field.zero:
+
+        def present(modelobject: Any) -> List[Any]:  # noqa: ANN401
+            value = getattr(modelobject, attribute, None)
+            return [] if value is None else [value]
+
+        return present
+
+    def truthy(modelobject: Any) -> List[Any]:  # noqa: ANN401
+        value = getattr(modelobject, attribute, None)
+        return [value] if value else []
+
+    return truthy
+
+
+def _language(field: Field) -> Emitter:
+    """Returns an emitter of language-tagged literals."""
+    attribute, predicate = field.attribute, field.predicate
+
+    def emit(modelobject: Any, _self: Node) -> None:  # noqa: ANN401
+        texts = getattr(modelobject, attribute, None)
+        if texts:
+            add = modelobject._add
+            for key in texts:
+                add((_self, predicate, literal(texts[key], lang=key)))
+
+    return emit
+
+
+def _literal(field: Field) -> Emitter:
+    """Returns an emitter of literals of the datatype of the field."""
+    values, predicate, datatype = _values(field), field.predicate, field.datatype
+
+    def emit(modelobject: Any, _self: Node) -> None:  # noqa: ANN401
+        for value in values(modelobject):
+            modelobject._add((_self, predicate, literal(value, datatype=datatype)))
+
+    return emit
+
+
+def _iri(field: Field) -> Emitter:
+    """Returns an emitter of IRIs."""
+    values, predicate = _values(field), field.predicate
+
+    def emit(modelobject: Any, _self: Node) -> None:  # noqa: ANN401
+        for value in values(modelobject):
+            modelobject._add((_self, predicate, iri(value)))
+
+    return emit
+
+
+def _reference(field: Field) -> Emitter:
+    """Returns an emitter of references, mapping the objects referred to."""
+    values, predicate = _values(field), field.predicate
+
+    def emit(modelobject: Any, _self: Node) -> None:  # noqa: ANN401
+        for value in values(modelobject):
+            if isinstance(value, str):
+                _value = iri(value)
+            else:
+                skolemize(value)
+                _value = iri(value.identifier)
+                modelobject._reference_to_graph(value)
+
+            modelobject._add((_self, predicate, _value))
+
+    return emit
+
+
+def _concept(field: Field) -> Emitter:
+    """Returns an emitter of concepts, with the triples of each concept once."""
+    values, predicate = _values(field), field.predicate
+
+    def emit(modelobject: Any, _self: Node) -> None:  # noqa: ANN401
+        for value in values(modelobject):
+            if isinstance(value, Concept):
+                _value = iri(value.identifier)
+
+                visited = modelobject._visited
+                # Shallow when mapped with an earlier model of a batch:
+                if id(value) not in visited and not is_shallow(value):
+                    visited[id(value)] = _value
+
+                    for _s, p, o in relabel_blank_nodes(
+                        foreign_triples(value), str(_value)
+                    ):
+                        modelobject._add((_value, p, o))
+            else:
+                _value = iri(value)
+
+            modelobject._add((_self, predicate, _value))
+
+    return emit
+
+
+def _cardinality(field: Field) -> Emitter:
+    """Returns an emitter of upper bounds, a number or unbounded."""
+    values, predicate = _values(field), field.predicate
+
+    def emit(modelobject: Any, _self: Node) -> None:  # noqa: ANN401
+        for value in values(modelobject):
+            if isinstance(value, int) or (isinstance(value, str) and value.isdigit()):
+                _value = literal(value, datatype=XSD.nonNegativeInteger)
+            else:
+                _value = literal(value)
+
+            modelobject._add((_self, predicate, _value))
+
+    return emit
+
+
+_EMITTERS: Dict[str, Callable[[Field], Emitter]] = {
+    LANGUAGE: _language,
+    LITERAL: _literal,
+    IRI: _iri,
+    REFERENCE: _reference,
+    CONCEPT: _concept,
+    CARDINALITY: _cardinality,
+}
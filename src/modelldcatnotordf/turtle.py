@@ -0,0 +1,147 @@
+"""Module for writing triples as Turtle while they are mapped.
+
+This module contains a writer that groups the triples added to it by
+subject and predicate, and writes them as Turtle, with a predicate-object
+list per subject, instead of keeping them in a store and serializing the
+store with rdflib.
+
+Only the prefixes of the library are used, and only the prefixes of the
+terms written are declared.
+
+Example:
+    >>> from modelldcatnotordf.modelldcatno import ObjectType
+    >>> from modelldcatnotordf.turtle import TurtleWriter
+    >>>
+    >>> objecttype = ObjectType("http://example.com/objecttypes/1")
+    >>> writer = TurtleWriter()
+    >>> _ = objecttype._to_graph(g=writer)
+    >>> print(writer.getvalue(encoding=None))
+    @prefix modelldcatno: <https://data.norge.no/vocabulary/modelldcatno#> .
+    <BLANKLINE>
+    <http://example.com/objecttypes/1> a modelldcatno:ObjectType .
+    <BLANKLINE>
+    <BLANKLINE>
+"""
+from __future__ import annotations
+
+from typing import Callable, Dict, IO, List, Optional, Set, Tuple, Union
+
+from rdflib import BNode, Literal
+from rdflib.term import Node
+
+from modelldcatnotordf.namespaces import prefixed_name, PREFIXES, RDF
+
+_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r"})
+
+
+class TurtleWriter:
+    """A writer writing the triples added to it as Turtle.
+
+    The triples are kept grouped by subject and predicate, in the order
+    they are added. A triple added more than once is written once.
+    """
+
+    __slots__ = ("_subjects", "_terms", "_prefixes")
+
+    def __init__(self) -> None:
+        """Inits the writer without triples."""
+        self._subjects: Dict[Node, Dict[Node, Dict[Node, None]]] = {}
+        self._terms: Dict[Node, str] = {}
+        self._prefixes: Set[str] = set()
+
+    def add(self, triple: Tuple[Node, Node, Node]) -> TurtleWriter:
+        """Adds the triple to the predicate-object list of its subject.
+
+        Args:
+            triple: the triple to add
+
+        Returns:
+            the writer
+        """
+        s, p, o = triple
+        self._subjects.setdefault(s, {}).setdefault(p, {})[o] = None
+        return self
+
+    def write(self, fileobj: IO[bytes], encoding: str = "utf-8") -> None:
+        """Writes the triples added as Turtle to fileobj.
+
+        Args:
+            fileobj: a binary file object to write to
+            encoding: the encoding to write in
+        """
+        for chunk in self._chunks():
+            fileobj.write(chunk.encode(encoding))
+
+    def getvalue(self, encoding: Optional[str] = "utf-8") -> Union[bytes, str]:
+        """Returns the triples added as Turtle.
+
+        Args:
+            encoding: the encoding to serialize into, or None for a string
+
+        Returns:
+            a turtle serialization, encoded as bytes unless encoding is None.
+        """
+        turtle = "".join(self._chunks())
+        return turtle if encoding is None else turtle.encode(encoding)
+
+    def _chunks(self) -> List[str]:
+        """Returns the prefix declarations followed by a block per subject."""
+        blocks = [
+            self._block(s, predicates) for s, predicates in self._subjects.items()
+        ]
+        prefixes = [
+            f"@prefix {prefix}: <{PREFIXES[prefix]}> .\n"
+            for prefix in sorted(self._prefixes)
+        ]
+        return prefixes + ["\n"] + blocks if prefixes else blocks
+
+    def _block(self, s: Node, predicates: Dict[Node, Dict[Node, None]]) -> str:
+        """Returns the subject with its predicate-object list."""
+        lines = []
+        if RDF.type in predicates:
+            lines.append(f"a {self._objects(predicates[RDF.type])}")
+        for p, objects in predicates.items():
+            if p != RDF.type:
+                lines.append(f"{self._term(p)} {self._objects(objects)}")
+
+        return f"{self._term(s)} " + " ;\n    ".join(lines) + " .\n\n"
+
+    def _objects(self, objects: Dict[Node, None]) -> str:
+        """Returns the objects of a predicate as an object list."""
+        return ",\n        ".join(self._term(o) for o in objects)
+
+    def _term(self, term: Node) -> str:
+        """Returns the term as written in Turtle."""
+        try:
+            return self._terms[term]
+        except KeyError:
+            pass
+
+        if isinstance(term, Literal):
+            written = _literal(term, self._term)
+        elif isinstance(term, BNode):
+            written = f"_:{term}"
+        else:
+            written = self._iri(str(term))
+
+        self._terms[term] = written
+        return written
+
+    def _iri(self, iri: str) -> str:
+        """Returns the iri as a prefixed name when it has a prefix."""
+        name = prefixed_name(iri)
+        if name is None:
+            return f"<{iri}>"
+
+        self._prefixes.add(name[0])
+        return ":".join(name)
+
+
+def _literal(literal: Literal, term: Callable[[Node], str]) -> str:
+    """Returns the literal with its language or datatype as written in Turtle."""
+    lexical = '"' + str(literal).translate(_ESCAPES) + '"'
+    if literal.language:
+        return f"{lexical}@{literal.language}"
+    if literal.datatype:
+        return f"{lexical}^^{term(literal.datatype)}"
+    return lexical
@@ -0,0 +1,63 @@
+"""Module for validating the URIs set on objects.
+
+The identifiers and other URIs set on objects are validated as
+datacatalogtordf URIs. A value is validated once while it is kept in a
+bounded cache of validated URIs, so that values set on many objects, e.g.
+a reference shared by the elements of a model, are not validated again.
+
+Input known to be valid, e.g. identifiers read from a registry, can be set
+without validation in a trusted_input block, which speeds up building
+large models.
+
+Example:
+    >>> from modelldcatnotordf.modelldcatno import ObjectType
+    >>> from modelldcatnotordf.uri import trusted_input
+    >>>
+    >>> with trusted_input():
+    ...     objecttypes = [
+    ...         ObjectType(f"http://example.com/objecttypes/{i}") for i in range(3)
+    ...     ]
+    >>> objecttypes[2].identifier
+    'http://example.com/objecttypes/2'
+"""
+from contextlib import contextmanager
+from functools import lru_cache
+import threading
+from typing import Iterator
+
+from datacatalogtordf import URI
+
+# The number of validated URIs kept:
+CACHE_SIZE = 4096
+
+_local = threading.local()
+_validated = lru_cache(maxsize=CACHE_SIZE)(URI)
+
+
+def uri(value: str) -> URI:
+    """Returns the value as a URI, validated unless in a trusted_input block.
+
+    Args:
+        value: the value to validate
+
+    Returns:
+        the value as a URI
+    """
+    if getattr(_local, "trusted", 0):
+        return str.__new__(URI, value)
+
+    return _validated(value)
+
+
+@contextmanager
+def trusted_input() -> Iterator[None]:
+    """Sets the URIs set in the block, in this thread, without validating them.
+
+    Yields:
+        nothing
+    """
+    _local.trusted = getattr(_local, "trusted", 0) + 1
+    try:
+        yield
+    finally:
+        _local.trusted -= 1
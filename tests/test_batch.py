@@ -0,0 +1,194 @@
+"""Test cases for the batch module."""
+from io import BytesIO
+from typing import List
+
+from concepttordf import Concept
+from datacatalogtordf import Agent
+from pytest_mock import MockFixture
+from rdflib import DCTERMS, FOAF, Graph, URIRef
+
+from modelldcatnotordf.batch import iter_rdf, to_ntriples_stream, to_rdf
+from modelldcatnotordf.licensedocument import LicenseDocument
+from modelldcatnotordf.modelldcatno import (
+    CodeElement,
+    CodeList,
+    InformationModel,
+    Module,
+    ObjectType,
+)
+from modelldcatnotordf.namespaces import SKOS, XKOS
+from tests.testutils import assert_isomorphic
+
+
+def _informationmodels() -> List[InformationModel]:
+    publisher = Agent()
+    publisher.identifier = "http://example.com/publishers/1"
+    publisher.name = {"nb": "Utgiver 1"}
+
+    subject = Concept()
+    subject.identifier = "http://example.com/subjects/1"
+
+    licensedocument = LicenseDocument("http://example.com/licensedocuments/1")
+    licensedocument.type.append("http://example.com/licensetypes/1")
+
+    informationmodels = []
+    for i in range(3):
+        informationmodel = InformationModel(f"http://example.com/informationmodels/{i}")
+        informationmodel.title = {"nb": f"Modell {i}"}
+        informationmodel.publisher = publisher
+        informationmodel.subject.append(subject)
+        informationmodel.licensedocument = licensedocument
+        informationmodel.modelelements.append(
+            ObjectType(f"http://example.com/objecttypes/{i}")
+        )
+        informationmodels.append(informationmodel)
+
+    return informationmodels
+
+
+def _graph(informationmodels: List[InformationModel]) -> Graph:
+    g = Graph()
+    for informationmodel in informationmodels:
+        for triple in informationmodel._to_graph():
+            g.add(triple)
+    return g
+
+
+def test_to_rdf_should_return_combined_graph() -> None:
+    """It returns one graph containing all the information models."""
+    informationmodels = _informationmodels()
+
+    g1 = Graph().parse(data=to_rdf(informationmodels), format="turtle")
+    g2 = _graph(informationmodels)
+
+    assert_isomorphic(g1, g2)
+
+
+def test_iter_rdf_should_emit_shared_resources_once() -> None:
+    """It emits the triples of a shared resource with the first model only."""
+    informationmodels = _informationmodels()
+    publisher = URIRef("http://example.com/publishers/1")
+
+    documents = list(iter_rdf(informationmodels, format="nt"))
+    graphs = [Graph().parse(data=rdf, format="nt") for _, rdf in documents]
+
+    assert [identifier for identifier, _ in documents] == [
+        "http://example.com/informationmodels/0",
+        "http://example.com/informationmodels/1",
+        "http://example.com/informationmodels/2",
+    ]
+    assert (publisher, FOAF.name, None) in graphs[0]
+    assert (publisher, FOAF.name, None) not in graphs[1]
+    assert (
+        URIRef("http://example.com/informationmodels/2"),
+        DCTERMS.publisher,
+        publisher,
+    ) in graphs[2]
+    assert_isomorphic(graphs[0] + graphs[1] + graphs[2], _graph(informationmodels))
+
+
+def test_iter_rdf_should_map_shared_objects_once(mocker: MockFixture) -> None:
+    """It only links to the objects mapped with an earlier model."""
+    informationmodels = _informationmodels()
+    module = Module("http://example.com/modules/1")
+    for informationmodel in informationmodels:
+        objecttype = informationmodel.modelelements[0]
+        assert isinstance(objecttype, ObjectType)
+        objecttype.belongs_to_module = [module]
+
+    module_to_graph = mocker.spy(Module, "_to_graph")
+    subject_to_graph = mocker.spy(Concept, "_to_graph")
+
+    graphs = [
+        Graph().parse(data=rdf, format="nt")
+        for _, rdf in iter_rdf(informationmodels, format="nt")
+    ]
+
+    assert module_to_graph.call_count == 1
+    assert subject_to_graph.call_count == 1
+    assert (None, None, URIRef("http://example.com/modules/1")) in graphs[2]
+    assert_isomorphic(graphs[0] + graphs[1] + graphs[2], _graph(informationmodels))
+
+
+def test_iter_rdf_should_emit_triples_of_later_models_about_shared_objects() -> (None):
+    """It emits what a later model says about an object shared with an earlier."""
+    codeelement = CodeElement("http://example.com/codeelements/1")
+    informationmodels = []
+    for i in range(2):
+        codelist = CodeList(f"http://example.com/codelists/{i}")
+        codelist.ordered_elements = [
+            codeelement,
+            f"http://example.com/codeelements/{i + 2}",
+        ]
+        informationmodel = InformationModel(f"http://example.com/informationmodels/{i}")
+        informationmodel.modelelements.append(codelist)
+        informationmodels.append(informationmodel)
+
+    graphs = [
+        Graph().parse(data=rdf, format="nt")
+        for _, rdf in iter_rdf(informationmodels, format="nt")
+    ]
+
+    assert (
+        URIRef("http://example.com/codeelements/1"),
+        SKOS.inScheme,
+        URIRef("http://example.com/codelists/1"),
+    ) in graphs[1]
+    assert (
+        URIRef("http://example.com/codeelements/1"),
+        XKOS.next,
+        URIRef("http://example.com/codeelements/3"),
+    ) in graphs[1]
+    assert_isomorphic(graphs[0] + graphs[1], _graph(informationmodels))
+
+
+def test_to_rdf_should_write_turtle_and_json_ld() -> None:
+    """It writes the combined graph in the formats of the writers too."""
+    informationmodels = _informationmodels()
+
+    for format in ["turtle", "json-ld", "xml"]:
+        g = Graph().parse(data=to_rdf(informationmodels, format=format), format=format)
+        assert_isomorphic(g, _graph(informationmodels))
+
+
+def test_iter_rdf_should_emit_triples_again_once_forgotten(
+    mocker: MockFixture,
+) -> None:
+    """It only remembers the last triples emitted, as many as EMITTED_TRIPLES."""
+    informationmodels = _informationmodels()
+    publisher = URIRef("http://example.com/publishers/1")
+    mocker.patch("modelldcatnotordf.batch.EMITTED_TRIPLES", 1)
+
+    graphs = [
+        Graph().parse(data=rdf, format="turtle")
+        for _, rdf in iter_rdf(informationmodels)
+    ]
+
+    assert (publisher, FOAF.name, None) in graphs[1]
+
+
+def test_to_ntriples_stream_should_write_every_triple_once() -> None:
+    """It writes the triples of all the models, without duplicates."""
+    informationmodels = _informationmodels()
+    stream = BytesIO()
+
+    to_ntriples_stream(iter(informationmodels), stream)
+
+    lines = stream.getvalue().decode().splitlines()
+    g = Graph().parse(data=stream.getvalue(), format="nt")
+
+    assert len(lines) == len(set(lines))
+    assert_isomorphic(g, _graph(informationmodels))
+
+
+def test_to_rdf_with_release_should_remove_state_of_mapping() -> None:
+    """It removes the graphs from the models after mapping them."""
+    informationmodels = _informationmodels()
+
+    g = Graph().parse(data=to_rdf(informationmodels, release=True), format="turtle")
+
+    assert_isomorphic(g, _graph(informationmodels))
+    for informationmodel in informationmodels:
+        informationmodel.to_rdf(release=True)
+        assert not hasattr(informationmodel, "_g")
+        assert not hasattr(informationmodel.modelelements[0], "_g")
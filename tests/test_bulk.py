@@ -0,0 +1,174 @@
+"""Test cases for the bulk module."""
+from io import StringIO
+
+from datacatalogtordf.exceptions import InvalidURIError
+import pytest
+from rdflib import Graph
+
+from modelldcatnotordf.bulk import codelist_from_columns, codelist_from_csv
+from modelldcatnotordf.modelldcatno import CodeElement, CodeElementColumns, CodeList
+from tests.testutils import assert_isomorphic
+
+PREFIXES = """
+    @prefix dct: <http://purl.org/dc/terms/> .
+    @prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .
+    @prefix skos: <http://www.w3.org/2004/02/skos/core#> .
+    @prefix xkos: <http://rdf-vocabulary.ddialliance.org/xkos#> .
+    @prefix modelldcatno: <https://data.norge.no/vocabulary/modelldcatno#> .
+    """
+
+
+def test_codelist_from_columns_should_map_as_code_elements() -> None:
+    """It returns a graph isomorphic to one of a code element per row."""
+    codelist = CodeList("http://example.com/codelists/1")
+    previous = None
+    for i in range(3):
+        codeelement = CodeElement(f"http://example.com/codeelements/{i}")
+        codeelement.notation = str(i)
+        codeelement.preflabel = {"nb": f"Kode {i}", "en": f"Code {i}"}
+        codeelement.in_scheme = [codelist]
+        if previous is not None:
+            previous.next_element = codeelement
+            codeelement.previous_element = previous
+        previous = codeelement
+
+    bulk = codelist_from_columns(
+        "http://example.com/codelists/1",
+        {
+            "identifier": [f"http://example.com/codeelements/{i}" for i in range(3)],
+            "notation": [0, 1, 2],
+            "preflabel@nb": [f"Kode {i}" for i in range(3)],
+            "preflabel@en": [f"Code {i}" for i in range(3)],
+        },
+    )
+
+    g1 = Graph().parse(data=bulk.to_rdf(), format="turtle")
+    g2 = Graph().parse(data=codeelement.to_rdf(), format="turtle")
+
+    assert len(bulk.code_elements) == 3
+    assert_isomorphic(g1, g2)
+
+
+def test_codelist_from_csv_should_map_hierarchy_in_order() -> None:
+    """It maps top concepts, and siblings by next and previous in order."""
+    csv = (
+        "notation,preflabel@nb,parent,order\n"
+        "03,Oslo,,2\n"
+        "0301,Oslo kommune,03,1\n"
+        "02,Akershus,,1\n"
+        "0219,Bærum,02,2\n"
+        "0220,Asker,02,1\n"
+    )
+    codelist = codelist_from_csv("http://example.com/codelists/1", StringIO(csv))
+
+    src = (
+        PREFIXES
+        + """
+        <http://example.com/codelists/1> a modelldcatno:CodeList .
+
+        _:02 a modelldcatno:CodeElement ;
+            skos:notation "02" ; skos:prefLabel "Akershus"@nb ;
+            skos:inScheme <http://example.com/codelists/1> ;
+            skos:topConceptOf <http://example.com/codelists/1> ;
+            xkos:next _:03 .
+        _:03 a modelldcatno:CodeElement ;
+            skos:notation "03" ; skos:prefLabel "Oslo"@nb ;
+            skos:inScheme <http://example.com/codelists/1> ;
+            skos:topConceptOf <http://example.com/codelists/1> ;
+            xkos:previous _:02 .
+        _:0220 a modelldcatno:CodeElement ;
+            skos:notation "0220" ; skos:prefLabel "Asker"@nb ;
+            skos:inScheme <http://example.com/codelists/1> ;
+            xkos:next _:0219 .
+        _:0219 a modelldcatno:CodeElement ;
+            skos:notation "0219" ; skos:prefLabel "Bærum"@nb ;
+            skos:inScheme <http://example.com/codelists/1> ;
+            xkos:previous _:0220 .
+        _:0301 a modelldcatno:CodeElement ;
+            skos:notation "0301" ; skos:prefLabel "Oslo kommune"@nb ;
+            skos:inScheme <http://example.com/codelists/1> .
+        """
+    )
+    g1 = Graph().parse(data=codelist.to_rdf(), format="turtle")
+    g2 = Graph().parse(data=src, format="turtle")
+
+    assert codelist.code_elements.notation == ("0301", "02", "0220", "03", "0219")
+    assert codelist.code_elements.parent == ("03", None, "02", None, "02")
+    assert codelist.code_elements.identifier is None
+    assert codelist.code_elements.preflabel["nb"][1] == "Akershus"
+    assert_isomorphic(g1, g2)
+
+
+def test_codelist_from_columns_should_map_empty_identifiers_to_blank_nodes() -> None:
+    """It maps the code elements with an empty identifier to blank nodes."""
+    codelist = codelist_from_columns(
+        "http://example.com/codelists/1",
+        {"notation": ["NO", "SE"], "identifier": ["", "http://example.com/se"]},
+    )
+
+    src = (
+        PREFIXES
+        + """
+        <http://example.com/codelists/1> a modelldcatno:CodeList .
+
+        _:NO a modelldcatno:CodeElement ;
+            skos:notation "NO" ;
+            skos:inScheme <http://example.com/codelists/1> ;
+            xkos:next <http://example.com/se> .
+        <http://example.com/se> a modelldcatno:CodeElement ;
+            skos:notation "SE" ;
+            skos:inScheme <http://example.com/codelists/1> ;
+            xkos:previous _:NO .
+        """
+    )
+    g1 = Graph().parse(data=codelist.to_rdf(), format="turtle")
+    g2 = Graph().parse(data=src, format="turtle")
+
+    assert codelist.code_elements.identifier == (None, "http://example.com/se")
+    assert_isomorphic(g1, g2)
+
+
+def test_codelist_from_columns_should_map_code_elements_after_cache_hit() -> None:
+    """It maps the code elements again when the code list is mapped again."""
+    codelist = codelist_from_columns(
+        "http://example.com/codelists/1", {"notation": ["1", "2"]}
+    )
+
+    assert codelist.to_rdf(format="nt-canonical") == codelist.to_rdf(
+        format="nt-canonical"
+    )
+    assert len(codelist._to_graph()) == 9
+
+
+@pytest.mark.parametrize(
+    "columns, message",
+    [
+        ({"preflabel@nb": ["Norge"]}, "notation column is missing"),
+        ({"notation": ["NO"], "label": ["Norge"]}, "Unknown columns: label"),
+        ({"notation": ["NO"], "order": [1, 2]}, "order has 2 values, not 1"),
+        ({"notation": ["NO"], "parent": ["SE"]}, "has the parent 'SE'"),
+        ({"notation": ["NO", "NO"], "parent": ["", "NO"]}, "notation 'NO'"),
+        ({"notation": ["NO", "NO"]}, "notation 'NO' is given to more than one"),
+        (
+            {"notation": ["NO", "NO"], "identifier": ["", "http://example.com/no"]},
+            "notation 'NO' is given to more than one",
+        ),
+        ({"notation": ["NO", "SE"], "order": ["1", ""]}, "order has '' in row 2"),
+    ],
+)
+def test_codelist_from_columns_should_raise_on_invalid_columns(
+    columns: dict, message: str
+) -> None:
+    """It raises a ValueError naming what is wrong with the columns."""
+    with pytest.raises(ValueError, match=message):
+        codelist_from_columns("http://example.com/codelists/1", columns)
+
+
+def test_code_element_columns_should_validate_columns() -> None:
+    """It raises on columns of other lengths, and on invalid identifiers."""
+    codelist = CodeList("http://example.com/codelists/1")
+
+    with pytest.raises(ValueError, match="preflabel@nb has 0 values, not 1"):
+        CodeElementColumns(codelist, ["NO"], preflabel={"nb": []})
+    with pytest.raises(InvalidURIError):
+        CodeElementColumns(codelist, ["NO"], identifier=["not a uri"])
@@ -1,14 +1,16 @@
 """A test class for testing the class CodeElement."""
+from io import BytesIO
 from typing import List, Union
 
 from concepttordf import Concept
 from datacatalogtordf import URI
 import pytest
 from pytest_mock import MockFixture
-from rdflib import Graph
+from rdflib import Graph, Literal, SKOS
 from skolemizer.testutils import skolemization, SkolemUtils
 
-from modelldcatnotordf.modelldcatno import CodeElement, CodeList
+from modelldcatnotordf.mapping import map_incrementally, mapping
+from modelldcatnotordf.modelldcatno import CodeElement, CodeList, XKOS
 from tests.testutils import assert_isomorphic
 
 
@@ -984,3 +986,184 @@ def test_to_graph_should_return_previous_as_uri() -> None:
     g2 = Graph().parse(data=src, format="turtle")
 
     assert_isomorphic(g1, g2)
+
+
+def test_to_graph_should_return_next_and_previous_both_ways() -> None:
+    """It returns an identifier graph isomorphic to spec."""
+    codeelement1 = CodeElement()
+    codeelement1.identifier = "http://example.com/codeelements/1"
+
+    codeelement2 = CodeElement()
+    codeelement2.identifier = "http://example.com/codeelements/2"
+
+    codeelement1.next_element = codeelement2
+    codeelement2.previous_element = codeelement1
+
+    src = """
+        @prefix dct: <http://purl.org/dc/terms/> .
+        @prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .
+        @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+        @prefix dcat: <http://www.w3.org/ns/dcat#> .
+        @prefix modelldcatno: <https://data.norge.no/vocabulary/modelldcatno#> .
+        @prefix skos: <http://www.w3.org/2004/02/skos/core#> .
+        @prefix xkos: <http://rdf-vocabulary.ddialliance.org/xkos#> .
+
+
+        <http://example.com/codeelements/1>
+                a modelldcatno:CodeElement;
+                    xkos:next <http://example.com/codeelements/2> .
+
+        <http://example.com/codeelements/2>
+                a modelldcatno:CodeElement;
+                    xkos:previous <http://example.com/codeelements/1> .
+
+        """
+    g1 = Graph().parse(data=codeelement2.to_rdf(), format="turtle")
+    g2 = Graph().parse(data=src, format="turtle")
+
+    assert_isomorphic(g1, g2)
+
+
+def test_to_graph_should_return_next_and_previous_blank_nodes_both_ways() -> None:
+    """It returns a graph isomorphic to spec."""
+    codeelement1 = CodeElement()
+    codeelement1.identifier = "http://example.com/codeelements/1"
+
+    codeelement2 = CodeElement()
+    codeelement3 = CodeElement()
+
+    codeelement1.next_element = codeelement2
+    codeelement2.previous_element = codeelement1
+    codeelement2.next_element = codeelement3
+    codeelement3.previous_element = codeelement2
+
+    src = """
+        @prefix dct: <http://purl.org/dc/terms/> .
+        @prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .
+        @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+        @prefix dcat: <http://www.w3.org/ns/dcat#> .
+        @prefix modelldcatno: <https://data.norge.no/vocabulary/modelldcatno#> .
+        @prefix skos: <http://www.w3.org/2004/02/skos/core#> .
+        @prefix xkos: <http://rdf-vocabulary.ddialliance.org/xkos#> .
+
+
+        <http://example.com/codeelements/1>
+                a modelldcatno:CodeElement;
+                    xkos:next _:codeelement2 .
+
+        _:codeelement2 a modelldcatno:CodeElement;
+                    xkos:previous <http://example.com/codeelements/1> ;
+                    xkos:next _:codeelement3 .
+
+        _:codeelement3 a modelldcatno:CodeElement;
+                    xkos:previous _:codeelement2 .
+
+        """
+    g1 = Graph().parse(data=codeelement1.to_rdf(), format="turtle")
+    g2 = Graph().parse(data=src, format="turtle")
+
+    assert_isomorphic(g1, g2)
+
+
+def test_to_graph_should_map_long_chain_of_next_and_previous() -> None:
+    """It does not exhaust the stack on a long code list."""
+    codeelements: List[CodeElement] = []
+    for i in range(5000):
+        codeelement = CodeElement()
+        codeelement.identifier = f"http://example.com/codeelements/{i}"
+        if codeelements:
+            codeelements[-1].next_element = codeelement
+            codeelement.previous_element = codeelements[-1]
+        codeelements.append(codeelement)
+
+    g = codeelements[2500]._to_graph()
+
+    assert len(g) == 5000 + 2 * 4999
+
+
+def test_to_ntriples_stream_should_write_graph() -> None:
+    """It writes N-Triples isomorphic to the graph."""
+    codeelement1 = CodeElement("http://example.com/codeelements/1")
+    codeelement2 = CodeElement()
+    codeelement1.next_element = codeelement2
+    codeelement2.previous_element = codeelement1
+
+    stream = BytesIO()
+    codeelement1.to_ntriples_stream(stream)
+
+    g1 = Graph().parse(data=stream.getvalue(), format="nt")
+    g2 = Graph().parse(data=codeelement1.to_rdf(), format="turtle")
+
+    assert_isomorphic(g1, g2)
+
+
+@mapping
+def _to_graph_incrementally(codeelement: CodeElement) -> Graph:
+    map_incrementally()
+    return codeelement._to_graph()
+
+
+def test_to_graph_should_reuse_triples_of_unchanged_code_elements(
+    mocker: MockFixture,
+) -> None:
+    """It adds the triples of unchanged code elements from the cache."""
+    codelist = CodeList("http://example.com/codelists/1")
+    codeelements: List[CodeElement] = []
+    for i in range(3):
+        codeelement = CodeElement(f"http://example.com/codeelements/{i}")
+        codeelement.preflabel = {"nb": f"Kode {i}"}
+        codeelement.in_scheme = [codelist]
+        if codeelements:
+            codeelements[-1].next_element = codeelement
+            codeelement.previous_element = codeelements[-1]
+        codeelements.append(codeelement)
+
+    g1 = _to_graph_incrementally(codeelements[0])
+
+    emit = mocker.spy(CodeElement, "_emit")
+    codelist_to_graph = mocker.spy(CodeList, "_to_graph")
+
+    g2 = _to_graph_incrementally(codeelements[0])
+
+    assert emit.call_count == 0
+    assert codelist_to_graph.call_count == 0
+    assert_isomorphic(g1, g2)
+
+    codeelements[1].notation = "1"
+
+    g3 = _to_graph_incrementally(codeelements[0])
+
+    assert emit.call_count == 1
+    assert len(g3) == len(g2) + 1
+
+
+def test_to_graph_should_map_blank_node_neighbours_to_same_labels() -> None:
+    """It maps code elements linked to blank nodes to the same triples every time."""
+    codeelement1 = CodeElement("http://example.com/codeelements/1")
+    codeelement2 = CodeElement()
+    codeelement1.next_element = codeelement2
+    codeelement2.previous_element = codeelement1
+
+    g1 = codeelement1._to_graph()
+    g2 = codeelement1._to_graph()
+
+    assert set(g1) == set(g2)
+    assert len(g2) == 4
+
+
+def test_to_graph_should_map_blank_node_neighbour_anew_from_other_element() -> None:
+    """It maps a blank node neighbour anew when linked from another element."""
+    codeelement1 = CodeElement("http://example.com/codeelements/1")
+    codeelement2 = CodeElement("http://example.com/codeelements/2")
+    codeelement3 = CodeElement()
+    codeelement1.next_element = codeelement3
+    codeelement2.next_element = codeelement3
+    codeelement3.preflabel = {"nb": "Kode 3"}
+
+    g1 = _to_graph_incrementally(codeelement1)
+    g2 = _to_graph_incrementally(codeelement2)
+
+    (_next1,) = g1.objects(predicate=XKOS.next)
+    (_next2,) = g2.objects(predicate=XKOS.next)
+    assert _next1 != _next2
+    assert (_next2, SKOS.prefLabel, Literal("Kode 3", lang="nb")) in g2
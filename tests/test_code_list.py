@@ -1,12 +1,15 @@
 """Test cases for the code list module."""
 
+from typing import List
+
 from concepttordf import Concept
 import pytest
 from pytest_mock import MockFixture
 from rdflib import Graph
 from skolemizer.testutils import skolemization
 
-from modelldcatnotordf.modelldcatno import CodeList
+from modelldcatnotordf.modelldcatno import CodeElement, CodeList
+from modelldcatnotordf.namespaces import XKOS
 from tests.testutils import assert_isomorphic
 
 """
@@ -171,3 +174,59 @@ def test_to_graph_should_return_has_reference() -> None:
     g2 = Graph().parse(data=src, format="turtle")
 
     assert_isomorphic(g1, g2)
+
+
+def test_to_graph_should_return_ordered_elements() -> None:
+    """It returns a graph linking the ordered elements by next and previous."""
+    codelist = CodeList("http://example.com/codelists/1")
+    codeelement = CodeElement("http://example.com/codeelements/1")
+    codeelement.notation = "1"
+    codelist.ordered_elements = [codeelement, "http://example.com/codeelements/2"]
+
+    src = """
+    @prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .
+    @prefix skos: <http://www.w3.org/2004/02/skos/core#> .
+    @prefix xkos: <http://rdf-vocabulary.ddialliance.org/xkos#> .
+    @prefix modelldcatno: <https://data.norge.no/vocabulary/modelldcatno#> .
+
+    <http://example.com/codelists/1> a modelldcatno:CodeList .
+
+    <http://example.com/codeelements/1> a modelldcatno:CodeElement ;
+        skos:notation "1" ;
+        skos:inScheme <http://example.com/codelists/1> ;
+        xkos:next <http://example.com/codeelements/2> .
+
+    <http://example.com/codeelements/2>
+        skos:inScheme <http://example.com/codelists/1> ;
+        xkos:previous <http://example.com/codeelements/1> .
+    """
+    g1 = Graph().parse(data=codelist.to_rdf(), format="turtle")
+    g2 = Graph().parse(data=src, format="turtle")
+
+    assert codelist.ordered_elements[0] is codeelement
+    assert_isomorphic(g1, g2)
+
+
+def test_to_graph_should_map_ordered_elements_like_linked_elements() -> None:
+    """It returns the graph of code elements linked by next and previous."""
+    codelist = CodeList("http://example.com/codelists/1")
+    linked = CodeList("http://example.com/codelists/1")
+    codeelements: List[CodeElement] = []
+    for i in range(3000):
+        codeelement = CodeElement(f"http://example.com/codeelements/{i}")
+        codeelement.in_scheme = [linked]
+        if codeelements:
+            codeelements[-1].next_element = codeelement
+            codeelement.previous_element = codeelements[-1]
+        codeelements.append(codeelement)
+
+    codelist.ordered_elements = [
+        CodeElement(f"http://example.com/codeelements/{i}") for i in range(3000)
+    ]
+
+    g1 = codelist._to_graph()
+    g2 = codeelements[0]._to_graph()
+
+    assert len(g1) == len(g2)
+    assert set(g1) == set(g2)
+    assert len(list(g1.objects(predicate=XKOS.next))) == 2999
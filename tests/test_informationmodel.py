@@ -1,19 +1,37 @@
 """Test cases for the informationmodel module."""
-from typing import List, Union
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+from io import BytesIO
+import pickle  # noqa: S403
+from typing import Iterable, List, Tuple, Union
 
 from concepttordf import Concept, Contact
 from datacatalogtordf import Agent, Location, PeriodOfTime, URI
 import pytest
 from pytest_mock import MockFixture
-from rdflib import Graph, Namespace
+from rdflib import DCTERMS, Graph, Literal, Namespace, URIRef
+from rdflib.term import Node
+from skolemizer import Skolemizer
 from skolemizer.testutils import skolemization
 
+from modelldcatnotordf.bulk import codelist_from_columns
 from modelldcatnotordf.document import FoafDocument
 from modelldcatnotordf.licensedocument import LicenseDocument
+from modelldcatnotordf.mapping import Limits, MappingLimitError
 from modelldcatnotordf.modelldcatno import (
+    _modelelements_to_triples,
+    Attribute,
+    CodeElement,
+    CodeList,
+    Composition,
+    DataType,
+    DCAT,
     InformationModel,
     ModelElement,
+    MODELLDCATNO,
+    Module,
     ObjectType,
+    Role,
     Standard,
 )
 from tests.testutils import assert_isomorphic
@@ -1620,3 +1638,748 @@ def test_to_graph_should_return_conforms_to() -> None:
     g2 = Graph().parse(data=src, format="turtle")
 
     assert_isomorphic(g1, g2)
+
+
+def test_to_graph_should_add_to_given_graph() -> None:
+    """It adds the triples to the given graph and returns it."""
+    informationmodel = InformationModel("http://example.com/informationmodels/1")
+    informationmodel.title = {"nb": "Modell 1"}
+    modelelement = ObjectType("http://example.com/modelelements/1")
+    modelelement.title = {"nb": "Tittel 1"}
+    informationmodel.modelelements.append(modelelement)
+
+    src = """
+    @prefix dct: <http://purl.org/dc/terms/> .
+    @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+    @prefix modelldcatno: <https://data.norge.no/vocabulary/modelldcatno#> .
+
+    <http://example.com/catalogs/1> rdfs:label "Katalog" .
+
+    <http://example.com/informationmodels/1> a modelldcatno:InformationModel ;
+        dct:title "Modell 1"@nb ;
+        modelldcatno:containsModelElement <http://example.com/modelelements/1> .
+
+    <http://example.com/modelelements/1> a modelldcatno:ObjectType ;
+        dct:title "Tittel 1"@nb .
+    """
+    g = Graph().parse(
+        data="""
+        <http://example.com/catalogs/1>
+            <http://www.w3.org/2000/01/rdf-schema#label> "Katalog" .
+        """,
+        format="turtle",
+    )
+
+    g1 = informationmodel._to_graph(g)
+    g2 = Graph().parse(data=src, format="turtle")
+
+    assert g1 is g
+    assert_isomorphic(g1, g2)
+
+
+def test_to_graph_should_not_create_graphs_for_nested_objects(
+    mocker: MockFixture,
+) -> None:
+    """It writes nested objects straight into the given graph."""
+    informationmodel = InformationModel("http://example.com/informationmodels/1")
+    modelelement = ObjectType("http://example.com/modelelements/1")
+    modelelement.has_property.append(Role("http://example.com/properties/1"))
+    informationmodel.modelelements.append(modelelement)
+    informationmodel.licensedocument = LicenseDocument("http://example.com/licenses/1")
+
+    graph = mocker.patch("modelldcatnotordf.modelldcatno.Graph")
+
+    g = informationmodel._to_graph(Graph())
+
+    graph.assert_not_called()
+    assert len(g) == 7
+
+
+def test_to_graph_should_map_shared_objects_once(mocker: MockFixture) -> None:
+    """It maps objects referenced from several places only once."""
+    informationmodel = InformationModel("http://example.com/informationmodels/1")
+    module = Module("http://example.com/modules/1")
+    datatype = DataType("http://example.com/datatypes/1")
+    subject = Concept()
+    subject.identifier = "http://example.com/subjects/1"
+
+    for i in range(3):
+        modelelement = ObjectType(f"http://example.com/modelelements/{i}")
+        modelelement.belongs_to_module = [module]
+        modelelement.subject = subject
+        attribute = Attribute(f"http://example.com/attributes/{i}")
+        attribute.has_type.append(datatype)
+        attribute.belongs_to_module = [module]
+        modelelement.has_property.append(attribute)
+        informationmodel.modelelements.append(modelelement)
+
+    module_to_graph = mocker.spy(Module, "_to_graph")
+    datatype_to_graph = mocker.spy(DataType, "_to_graph")
+    subject_to_graph = mocker.spy(Concept, "_to_graph")
+
+    g = informationmodel._to_graph()
+
+    assert module_to_graph.call_count == 1
+    assert datatype_to_graph.call_count == 1
+    assert subject_to_graph.call_count == 1
+    assert len(list(g.subjects(predicate=MODELLDCATNO.belongsToModule))) == 6
+    assert len(list(g.subjects(predicate=MODELLDCATNO.hasType))) == 3
+
+
+def test_to_ntriples_stream_should_write_graph() -> None:
+    """It writes N-Triples isomorphic to the graph."""
+    informationmodel = InformationModel("http://example.com/informationmodels/1")
+    informationmodel.title = {"nb": "Tittel 1", "en": "Title 1"}
+
+    objecttype = ObjectType("http://example.com/modelelements/1")
+    objecttype.has_property.append(Role("http://example.com/properties/1"))
+    informationmodel.modelelements.append(objecttype)
+
+    stream = BytesIO()
+    informationmodel.to_ntriples_stream(stream)
+
+    g1 = Graph().parse(data=stream.getvalue(), format="nt")
+    g2 = Graph().parse(data=informationmodel.to_rdf(), format="turtle")
+
+    assert_isomorphic(g1, g2)
+
+
+def _graph(triples: Iterable[Tuple[Node, Node, Node]]) -> Graph:
+    g = Graph()
+    for triple in triples:
+        g.add(triple)
+    return g
+
+
+def _informationmodel_with_attributes() -> InformationModel:
+    informationmodel = InformationModel("http://example.com/informationmodels/1")
+    datatype = DataType("http://example.com/datatypes/1")
+
+    for i in range(3):
+        modelelement = ObjectType(f"http://example.com/modelelements/{i}")
+        modelelement.title = {"nb": f"Element {i}"}
+        attribute = Attribute(f"http://example.com/attributes/{i}")
+        attribute.title = {"nb": f"Egenskap {i}"}
+        attribute.has_data_type = datatype
+        modelelement.has_property.append(attribute)
+        informationmodel.modelelements.append(modelelement)
+
+    return informationmodel
+
+
+def test_to_graph_should_reuse_triples_of_unchanged_objects(
+    mocker: MockFixture,
+) -> None:
+    """It adds the triples of unchanged objects from the cache."""
+    informationmodel = _informationmodel_with_attributes()
+    g1 = informationmodel._to_graph(incremental=True)
+
+    objecttype_to_graph = mocker.spy(ObjectType, "_to_graph")
+    attribute_to_graph = mocker.spy(Attribute, "_to_graph")
+    datatype_to_graph = mocker.spy(DataType, "_to_graph")
+
+    g2 = informationmodel._to_graph(incremental=True)
+
+    assert objecttype_to_graph.call_count == 0
+    assert attribute_to_graph.call_count == 0
+    assert datatype_to_graph.call_count == 0
+    assert_isomorphic(g1, g2)
+
+
+def test_to_graph_should_map_objects_changed_by_setter(mocker: MockFixture) -> None:
+    """It maps an object anew when an attribute has been set."""
+    informationmodel = _informationmodel_with_attributes()
+    attribute = informationmodel.modelelements[1].has_property[0]
+    informationmodel._to_graph(incremental=True)
+
+    attribute.title = {"nb": "Endret egenskap"}
+
+    objecttype_to_graph = mocker.spy(ObjectType, "_to_graph")
+    attribute_to_graph = mocker.spy(Attribute, "_to_graph")
+
+    g = informationmodel._to_graph(incremental=True)
+
+    assert objecttype_to_graph.call_count == 0
+    assert attribute_to_graph.call_count == 1
+    assert (
+        URIRef("http://example.com/attributes/1"),
+        DCTERMS.title,
+        Literal("Endret egenskap", lang="nb"),
+    ) in g
+    assert (
+        URIRef("http://example.com/attributes/1"),
+        DCTERMS.title,
+        Literal("Egenskap 1", lang="nb"),
+    ) not in g
+
+
+def test_to_graph_should_map_objects_changed_in_place() -> None:
+    """It maps an object anew when a list or dict attribute changed in place."""
+    informationmodel = _informationmodel_with_attributes()
+    modelelement = informationmodel.modelelements[0]
+    title = modelelement.title
+    has_property = modelelement.has_property
+    informationmodel._to_graph(incremental=True)
+
+    title["en"] = "Element 0"
+    has_property.append("http://example.com/attributes/3")
+
+    g = informationmodel._to_graph(incremental=True)
+
+    assert (
+        URIRef("http://example.com/modelelements/0"),
+        DCTERMS.title,
+        Literal("Element 0", lang="en"),
+    ) in g
+    assert (
+        URIRef("http://example.com/modelelements/0"),
+        MODELLDCATNO.hasProperty,
+        URIRef("http://example.com/attributes/3"),
+    ) in g
+
+
+def test_to_graph_should_map_objects_changed_with_keywords() -> None:
+    """It maps an object anew when changed in place by keyword arguments."""
+    informationmodel = _informationmodel_with_attributes()
+    modelelement = informationmodel.modelelements[0]
+    informationmodel._to_graph(incremental=True)
+
+    modelelement.title.update(en="Element 0")
+    informationmodel.modelelements.sort(key=lambda element: element.identifier)
+
+    g = informationmodel._to_graph(incremental=True)
+
+    assert (
+        URIRef("http://example.com/modelelements/0"),
+        DCTERMS.title,
+        Literal("Element 0", lang="en"),
+    ) in g
+
+
+def test_to_graph_should_map_objects_changed_through_other_names() -> None:
+    """It maps an object anew when a list set on it is changed by another name."""
+    informationmodel = _informationmodel_with_attributes()
+    modelelement = informationmodel.modelelements[0]
+    has_property = list(modelelement.has_property)
+    modelelement.has_property = has_property
+    informationmodel._to_graph(incremental=True)
+
+    has_property.append("http://example.com/attributes/3")
+
+    g = informationmodel._to_graph(incremental=True)
+
+    assert modelelement.has_property is has_property
+    assert (
+        URIRef("http://example.com/modelelements/0"),
+        MODELLDCATNO.hasProperty,
+        URIRef("http://example.com/attributes/3"),
+    ) in g
+
+
+def test_to_rdf_should_keep_no_triples_unless_incremental(
+    mocker: MockFixture,
+) -> None:
+    """It neither adds nor keeps the triples of objects when not incremental."""
+    informationmodel = _informationmodel_with_attributes()
+    modelelement = informationmodel.modelelements[0]
+    informationmodel.to_rdf(incremental=True)
+
+    assert hasattr(modelelement, "_cache")
+
+    objecttype_to_graph = mocker.spy(ObjectType, "_to_graph")
+    informationmodel.to_ntriples_stream(BytesIO())
+
+    assert objecttype_to_graph.call_count == 3
+    assert not hasattr(modelelement, "_cache")
+    assert not hasattr(modelelement.has_property[0], "_cache")
+
+
+def test_to_graph_should_map_objects_referring_to_changed_identifier(
+    mocker: MockFixture,
+) -> None:
+    """It maps an object anew when an object it refers to changed identifier."""
+    informationmodel = _informationmodel_with_attributes()
+    attribute = informationmodel.modelelements[0].has_property[0]
+    assert isinstance(attribute, Attribute)
+    datatype = attribute.has_data_type
+    informationmodel._to_graph(incremental=True)
+
+    datatype.identifier = "http://example.com/datatypes/2"
+    attribute_to_graph = mocker.spy(Attribute, "_to_graph")
+
+    g = informationmodel._to_graph(incremental=True)
+
+    assert attribute_to_graph.call_count == 3
+    assert set(g.objects(predicate=MODELLDCATNO.hasDataType)) == {
+        URIRef("http://example.com/datatypes/2")
+    }
+
+
+def test_to_graph_should_map_objects_referring_to_concept(
+    mocker: MockFixture,
+) -> None:
+    """It maps an object with a concept as subject anew every time."""
+    informationmodel = _informationmodel_with_attributes()
+    subject = Concept()
+    subject.identifier = "http://example.com/subjects/1"
+    informationmodel.modelelements[0].subject = subject
+    informationmodel._to_graph(incremental=True)
+
+    subject.term = {"name": {"nb": "begrep"}}
+    objecttype_to_graph = mocker.spy(ObjectType, "_to_graph")
+
+    g = informationmodel._to_graph(incremental=True)
+
+    assert objecttype_to_graph.call_count == 1
+    assert Literal("begrep", lang="nb") in set(
+        g.objects(URIRef("http://example.com/subjects/1"))
+    )
+
+
+def test_to_rdf_in_parallel_should_return_graph_isomorphic_to_serial() -> None:
+    """It returns the same graph when mapping model elements in parallel."""
+    informationmodel = _informationmodel_with_attributes()
+
+    g1 = Graph().parse(data=informationmodel.to_rdf(), format="turtle")
+    g2 = Graph().parse(data=informationmodel.to_rdf(workers=2), format="turtle")
+
+    assert_isomorphic(g1, g2)
+
+
+def test_to_rdf_in_parallel_should_keep_skolemized_identifiers() -> None:
+    """It skolemizes before mapping in parallel, and keeps the identifiers."""
+    informationmodel = InformationModel("http://example.com/informationmodels/1")
+    datatype = DataType()
+
+    for _ in range(4):
+        modelelement = ObjectType()
+        attribute = Attribute()
+        attribute.has_data_type = datatype
+        modelelement.has_property.append(attribute)
+        informationmodel.modelelements.append(modelelement)
+
+    g = Graph().parse(data=informationmodel.to_rdf(workers=3), format="turtle")
+
+    assert datatype.identifier
+    assert set(g.objects(predicate=MODELLDCATNO.hasDataType)) == {
+        URIRef(datatype.identifier)
+    }
+    assert set(g.objects(predicate=MODELLDCATNO.containsModelElement)) == {
+        URIRef(modelelement.identifier)
+        for modelelement in informationmodel.modelelements
+    }
+    assert_isomorphic(g, Graph().parse(data=informationmodel.to_rdf(), format="turtle"))
+
+
+def test_to_rdf_in_parallel_should_return_model_element_iris() -> None:
+    """It maps model elements given as IRIs without worker processes."""
+    informationmodel = InformationModel("http://example.com/informationmodels/1")
+    informationmodel.modelelements.append("http://example.com/modelelements/1")
+
+    g = Graph().parse(data=informationmodel.to_rdf(workers=2), format="turtle")
+
+    assert set(g.objects(predicate=MODELLDCATNO.containsModelElement)) == {
+        URIRef("http://example.com/modelelements/1")
+    }
+
+
+def test_modelelements_to_triples_should_return_partition() -> None:
+    """It returns the triples of a partition of model elements."""
+    informationmodel = _informationmodel_with_attributes()
+    modelelements = informationmodel.modelelements[:2]
+
+    g1 = _graph(_modelelements_to_triples(modelelements))
+    g2 = Graph()
+    for modelelement in modelelements:
+        modelelement._to_graph(g=g2)
+
+    assert_isomorphic(g1, g2)
+
+
+def test_to_rdf_in_parallel_should_return_the_blank_nodes_of_serial() -> None:
+    """It returns the same canonical N-Triples as mapping in one process."""
+    informationmodel = _informationmodel_with_attributes()
+    informationmodel.modelelements.append(
+        codelist_from_columns(
+            "http://example.com/codelists/1",
+            {"notation": ["1", "2", "3"], "parent": ["", "1", "1"]},
+        )
+    )
+    codelist = CodeList("http://example.com/codelists/2")
+    codelist.ordered_elements = [CodeElement(), CodeElement()]
+    informationmodel.modelelements.append(codelist)
+
+    rdf = informationmodel.to_rdf(format="nt-canonical")
+
+    assert b"_:" in rdf
+    assert informationmodel.to_rdf(format="nt-canonical", workers=2) == rdf
+    assert informationmodel.to_rdf(format="nt-canonical", workers=2) == rdf
+    assert informationmodel.content_hash() == hashlib.sha256(rdf).hexdigest()
+
+
+def test_pickle_should_leave_out_state_of_mappings() -> None:
+    """It pickles model objects without graphs and cached triples."""
+    informationmodel = _informationmodel_with_attributes()
+    codelist = CodeList("http://example.com/codelists/1")
+    codeelement = CodeElement("http://example.com/codeelements/1")
+    codeelement.in_scheme = [codelist]
+    informationmodel.modelelements.append(codelist)
+    informationmodel._to_graph()
+    codeelement._to_graph()
+
+    modelelement = pickle.loads(  # noqa: S301
+        pickle.dumps(informationmodel.modelelements[0])
+    )
+    unpickled = pickle.loads(pickle.dumps(codeelement))  # noqa: S301
+
+    assert modelelement.title == {"nb": "Element 0"}
+    assert modelelement.has_property[0].title == {"nb": "Egenskap 0"}
+    assert not hasattr(modelelement, "_g")
+    assert not hasattr(modelelement, "_triples")
+    assert unpickled.in_scheme[0].identifier == "http://example.com/codelists/1"
+    assert_isomorphic(unpickled._to_graph(), codeelement._to_graph())
+
+
+def test_to_rdf_with_release_should_remove_state_of_mapping() -> None:
+    """It removes the graphs and caches from all objects after mapping."""
+    informationmodel = _informationmodel_with_attributes()
+    subject = Concept()
+    subject.identifier = "http://example.com/subjects/1"
+    informationmodel.subject.append(subject)
+    licensedocument = LicenseDocument("http://example.com/licensedocuments/1")
+    informationmodel.licensedocument = licensedocument
+    composition = Composition("http://example.com/compositions/1")
+    composition.contains = ObjectType("http://example.com/objecttypes/1")
+    objecttype = informationmodel.modelelements[0]
+    objecttype.has_property.append(composition)
+
+    g1 = Graph().parse(data=informationmodel.to_rdf(), format="turtle")
+    g2 = Graph().parse(data=informationmodel.to_rdf(release=True), format="turtle")
+
+    assert_isomorphic(g1, g2)
+    for modelobject in [
+        informationmodel,
+        licensedocument,
+        objecttype,
+        objecttype.has_property[0],
+        composition,
+        composition.contains,
+    ]:
+        assert not hasattr(modelobject, "_g")
+        assert not hasattr(modelobject, "_visited")
+    assert not hasattr(composition.contains, "_cache")
+    assert not hasattr(objecttype, "_triples")
+
+
+def test_pickle_should_keep_single_slot_attribute() -> None:
+    """It pickles an attribute declared as the only slot of a class."""
+    composition = Composition("http://example.com/compositions/1")
+    composition.contains = ObjectType("http://example.com/objecttypes/1")
+
+    unpickled = pickle.loads(pickle.dumps(composition))  # noqa: S301
+
+    assert unpickled.contains.identifier == "http://example.com/objecttypes/1"
+
+
+def test_to_rdf_should_return_same_serialization_every_time() -> None:
+    """It labels blank nodes by their path, not by random labels."""
+    informationmodel = InformationModel("http://example.com/informationmodels/1")
+    publisher = Agent()
+    publisher.name = {"nb": "Utgiver"}
+    informationmodel.publisher = publisher
+    contact = Contact()
+    contact.email = "post@example.com"
+    informationmodel.contactpoints = [contact, contact]
+    location = Location()
+    location.centroid = "POINT(4.88412 52.37509)"
+    informationmodel.locations = ["http://example.com/locations/1", location]
+    period_of_time = PeriodOfTime()
+    period_of_time.start_date = "2019-12-31"
+    informationmodel.temporal = [period_of_time]
+    subject = Concept()
+    subject.identifier = "http://example.com/subjects/1"
+    subject.term = {"name": {"nb": "begrep"}}
+    informationmodel.subject = [subject]
+    licensedocument = LicenseDocument("http://example.com/licensedocuments/1")
+    licensedocument.type.append(subject)
+    informationmodel.licensedocument = licensedocument
+
+    g = Graph().parse(data=informationmodel.to_rdf(), format="turtle")
+    rdf = informationmodel.to_rdf()
+
+    assert informationmodel.to_rdf() == rdf
+    assert len(set(g.objects(predicate=DCTERMS.publisher))) == 1
+    assert len(set(g.objects(predicate=DCAT.contactPoint))) == 2
+
+
+def _unidentified_informationmodel(title: str) -> InformationModel:
+    informationmodel = InformationModel("http://example.com/informationmodels/1")
+    informationmodel.publisher = Agent()
+    informationmodel.licensedocument = LicenseDocument()
+    module = Module()
+    for _i in range(2):
+        objecttype = ObjectType()
+        objecttype.title = {"nb": title}
+        objecttype.belongs_to_module = [module]
+        objecttype.has_property.append(Attribute())
+        informationmodel.modelelements.append(objecttype)
+
+    return informationmodel
+
+
+def test_to_rdf_deterministic_should_derive_identifiers() -> None:
+    """It gives objects built the same way the same identifiers for the mapping."""
+    informationmodel1 = _unidentified_informationmodel("Objekttype")
+    informationmodel2 = _unidentified_informationmodel("Objekttype")
+    informationmodel3 = _unidentified_informationmodel("Objekttype 2")
+
+    rdf = informationmodel1.to_rdf(deterministic=True)
+    g = Graph().parse(data=rdf, format="turtle")
+
+    assert informationmodel2.to_rdf(deterministic=True) == rdf
+    assert informationmodel3.to_rdf(deterministic=True) != rdf
+    assert len(set(g.objects(predicate=MODELLDCATNO.containsModelElement))) == 2
+    assert len(set(g.objects(predicate=MODELLDCATNO.hasProperty))) == 2
+    assert len(set(g.objects(predicate=MODELLDCATNO.belongsToModule))) == 1
+    assert all(
+        Skolemizer.has_skolemization_morfologi(str(o))
+        for o in g.objects(predicate=MODELLDCATNO.containsModelElement)
+    )
+    objecttype = informationmodel1.modelelements[0]
+    for modelobject in [
+        informationmodel1.publisher,
+        informationmodel1.licensedocument,
+        objecttype,
+        objecttype.has_property[0],
+        objecttype.belongs_to_module[0],
+    ]:
+        assert not getattr(modelobject, "identifier", None)
+
+
+def test_to_rdf_deterministic_should_map_the_same_model_in_threads() -> None:
+    """It maps the same model the same way in threads mapping it at once."""
+    informationmodel = _unidentified_informationmodel("Objekttype")
+    rdf = _unidentified_informationmodel("Objekttype").to_rdf(deterministic=True)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(
+            executor.map(
+                lambda _i: informationmodel.to_rdf(deterministic=True), range(50)
+            )
+        )
+
+    assert results == [rdf] * 50
+    assert not getattr(informationmodel.modelelements[0], "identifier", None)
+
+
+def test_to_rdf_deterministic_should_label_the_information_model() -> None:
+    """It labels an information model without identifier too."""
+    informationmodel = InformationModel()
+
+    rdf = informationmodel.to_rdf(format="nt-canonical", deterministic=True)
+
+    assert InformationModel().to_rdf(format="nt-canonical", deterministic=True) == rdf
+    assert not getattr(informationmodel, "identifier", None)
+
+
+def test_to_rdf_deterministic_in_parallel_should_return_the_same_triples() -> None:
+    """It passes the labels of the objects of a partition to its worker."""
+    informationmodel = _unidentified_informationmodel("Objekttype")
+    objecttype = ObjectType()
+
+    rdf = informationmodel.to_rdf(format="nt-canonical", deterministic=True)
+    g = _graph(
+        _modelelements_to_triples(
+            [objecttype], labels=[(objecttype, "http://example.com/objecttypes/1")]
+        )
+    )
+
+    assert (
+        informationmodel.to_rdf(format="nt-canonical", deterministic=True, workers=2)
+        == rdf
+    )
+    assert (URIRef("http://example.com/objecttypes/1"), None, None) in g
+
+
+def _nested_informationmodel(size: int) -> InformationModel:
+    informationmodel = InformationModel("http://example.com/informationmodels/1")
+    objecttypes = [
+        ObjectType(f"http://example.com/objecttypes/{i}") for i in range(size)
+    ]
+    for i in range(1, size):
+        composition = Composition()
+        composition.contains = objecttypes[i]
+        objecttypes[i - 1].has_property.append(composition)
+    informationmodel.modelelements.extend(objecttypes)
+
+    return informationmodel
+
+
+def test_to_rdf_shallow_should_return_graph_isomorphic_to_full() -> None:
+    """It returns the same graph when only linking to model elements."""
+    informationmodel = _nested_informationmodel(5)
+
+    g1 = Graph().parse(data=informationmodel.to_rdf(), format="turtle")
+    g2 = Graph().parse(data=informationmodel.to_rdf(shallow=True), format="turtle")
+    g3 = Graph().parse(
+        data=informationmodel.to_rdf(shallow=True, workers=2), format="turtle"
+    )
+
+    assert_isomorphic(g1, g2)
+    assert_isomorphic(g1, g3)
+
+
+def test_to_rdf_should_map_references_nested_deeper_than_the_stack() -> None:
+    """It maps references nested deeper than the stack allows, one after another."""
+    informationmodel = _nested_informationmodel(2000)
+    informationmodel.modelelements = informationmodel.modelelements[:1]
+
+    g = Graph().parse(data=informationmodel.to_rdf(), format="turtle")
+
+    assert len(set(g.subjects(predicate=MODELLDCATNO.contains))) == 1999
+
+
+def test_to_rdf_shallow_should_map_model_elements_on_their_own() -> None:
+    """It maps model elements nested deeper than the stack allows."""
+    informationmodel = _nested_informationmodel(2000)
+
+    g = Graph().parse(data=informationmodel.to_rdf(shallow=True), format="turtle")
+
+    assert len(set(g.subjects(predicate=MODELLDCATNO.contains))) == 1999
+
+
+def test_modelelements_to_triples_shallow_should_only_link_to_model_elements() -> (
+    None
+):
+    """It maps references to model elements of other partitions to links only."""
+    informationmodel = _informationmodel_with_attributes()
+    objecttype = informationmodel.modelelements[0]
+    attribute = objecttype.has_property[0]
+    assert isinstance(attribute, Attribute)
+    datatype = attribute.has_data_type
+
+    g = _graph(_modelelements_to_triples([objecttype], shallow=(datatype.identifier,)))
+
+    assert (None, MODELLDCATNO.hasDataType, URIRef(datatype.identifier)) in g
+    assert (URIRef(datatype.identifier), None, None) not in g
+
+
+def test_to_rdf_should_raise_on_exceeding_depth() -> None:
+    """It raises an error naming the path to the object too deep."""
+    informationmodel = _nested_informationmodel(100)
+    informationmodel.modelelements = informationmodel.modelelements[:1]
+    objecttype = informationmodel.modelelements[0]
+    composition = objecttype.has_property[0]
+
+    with pytest.raises(MappingLimitError) as excinfo:
+        informationmodel.to_rdf(max_depth=3)
+
+    assert (excinfo.value.limit, excinfo.value.value) == ("depth", 3)
+    assert excinfo.value.path[:4] == (
+        "http://example.com/informationmodels/1",
+        "http://example.com/objecttypes/0",
+        composition.identifier,
+        "http://example.com/objecttypes/1",
+    )
+    assert len(excinfo.value.path) == 5
+
+
+def test_to_rdf_should_raise_on_exceeding_triples() -> None:
+    """It raises an error when mapping more triples than allowed."""
+    informationmodel = _nested_informationmodel(100)
+
+    with pytest.raises(MappingLimitError, match="triples limit of 50"):
+        informationmodel.to_rdf(max_triples=50, shallow=True)
+    with pytest.raises(MappingLimitError, match="triples limit of 50"):
+        informationmodel.to_rdf(max_triples=50, shallow=True)
+
+
+def test_to_rdf_should_raise_on_exceeding_timeout() -> None:
+    """It raises an error when the mapping takes longer than allowed."""
+    informationmodel = _nested_informationmodel(5)
+
+    with pytest.raises(MappingLimitError) as excinfo:
+        informationmodel.to_rdf(timeout=-1)
+
+    assert excinfo.value.limit == "deadline"
+    assert excinfo.value.path == ("http://example.com/informationmodels/1",)
+
+
+def test_to_rdf_within_limits_should_return_graph() -> None:
+    """It returns the same graph when the limits are not exceeded."""
+    informationmodel = _nested_informationmodel(5)
+    codelist = codelist_from_columns(
+        "http://example.com/codelists/1", {"notation": ["1", "2"]}
+    )
+    informationmodel.modelelements.append(codelist)
+
+    g1 = Graph().parse(data=informationmodel.to_rdf(), format="turtle")
+    g2 = Graph().parse(
+        data=informationmodel.to_rdf(max_depth=10, max_triples=1000, timeout=60),
+        format="turtle",
+    )
+
+    assert_isomorphic(g1, g2)
+
+    informationmodel.modelelements = [codelist]
+    with pytest.raises(MappingLimitError, match="codelists/1 > CodeElementColumns"):
+        informationmodel.to_rdf(max_triples=4)
+
+
+def test_to_rdf_in_parallel_should_raise_on_exceeding_limits() -> None:
+    """It raises the error of a worker process, and counts the triples of all."""
+    informationmodel = _nested_informationmodel(10)
+
+    with pytest.raises(MappingLimitError) as excinfo:
+        informationmodel.to_rdf(workers=2, shallow=True, max_depth=1)
+    with pytest.raises(MappingLimitError, match="triples limit of 30"):
+        informationmodel.to_rdf(workers=2, shallow=True, max_triples=30)
+
+    assert excinfo.value.path[0] == "http://example.com/informationmodels/1"
+
+
+def test_to_rdf_should_count_the_triples_of_every_object() -> None:
+    """It counts the triples of the information model and documents too."""
+    informationmodel = InformationModel("http://example.com/informationmodels/1")
+    informationmodel.title = {"nb": "Tittel", "en": "Title"}
+    informationmodel.licensedocument = LicenseDocument("http://example.com/licenses/1")
+
+    with pytest.raises(MappingLimitError) as excinfo:
+        informationmodel.to_rdf(max_triples=2)
+
+    assert excinfo.value.path == ("http://example.com/informationmodels/1",)
+
+
+def test_to_rdf_in_parallel_should_raise_on_exceeding_depth_before_pickling() -> (None):
+    """It raises a MappingLimitError, unless no depth is given, on a deep model."""
+    informationmodel = _nested_informationmodel(2000)
+    informationmodel.modelelements = informationmodel.modelelements[:2]
+
+    with pytest.raises(MappingLimitError) as excinfo:
+        informationmodel.to_rdf(workers=2, max_depth=5)
+    with pytest.raises(MappingLimitError, match="depth limit") as recursion:
+        informationmodel.to_rdf(workers=2, max_depth=100_000)
+    with pytest.raises(RecursionError):
+        informationmodel.to_rdf(workers=2)
+
+    assert (excinfo.value.limit, excinfo.value.value) == ("depth", 5)
+    assert len(excinfo.value.path) == 7
+    assert recursion.value.path == ("http://example.com/informationmodels/1",)
+    assert recursion.value.value == 100_000
+
+
+def test_modelelements_to_triples_should_raise_on_exceeding_limits() -> None:
+    """It bounds the partition by the limits, within the path of the model."""
+    informationmodel = _nested_informationmodel(3)
+
+    with pytest.raises(MappingLimitError) as excinfo:
+        _modelelements_to_triples(
+            informationmodel.modelelements[:1],
+            limits=Limits(depth=1),
+            path=("http://example.com/informationmodels/1",),
+        )
+
+    assert excinfo.value.path[:2] == (
+        "http://example.com/informationmodels/1",
+        "http://example.com/objecttypes/0",
+    )
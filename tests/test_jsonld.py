@@ -0,0 +1,109 @@
+"""Test cases for the jsonld module."""
+from io import BytesIO
+import json
+
+from concepttordf import Contact
+import pytest
+from rdflib import BNode, Graph, Literal, RDF, URIRef, XSD
+
+from modelldcatnotordf.jsonld import CONTEXT, JsonLdWriter
+from modelldcatnotordf.modelldcatno import (
+    Attribute,
+    InformationModel,
+    MODELLDCATNO,
+    ObjectType,
+)
+from tests.testutils import assert_isomorphic
+
+
+def _informationmodel() -> InformationModel:
+    informationmodel = InformationModel("http://example.com/informationmodels/1")
+    informationmodel.title = {"nb": 'Modell "1"', "en": "Model\n1"}
+    informationmodel.version_info = "1.0"
+
+    contact = Contact()
+    contact.email = "post@example.com"
+    informationmodel.contactpoints.append(contact)
+
+    objecttype = ObjectType("http://example.com/objecttypes/1.0")
+    attribute = Attribute("http://example.com/attributes/1")
+    objecttype.has_property.append(attribute)
+    informationmodel.modelelements.append(objecttype)
+    informationmodel.modelelements.append(ObjectType(f"{MODELLDCATNO}a.b"))
+
+    return informationmodel
+
+
+def test_to_rdf_should_be_isomorphic_to_rdflib_serialization() -> None:
+    """It writes a graph isomorphic to the graph serialized by rdflib."""
+    informationmodel = _informationmodel()
+
+    expected = informationmodel._to_graph().serialize(format="json-ld")
+    rdf = informationmodel.to_rdf(format="json-ld")
+
+    assert_isomorphic(
+        Graph().parse(data=rdf, format="json-ld"),
+        Graph().parse(data=expected, format="json-ld"),
+    )
+
+
+def test_getvalue_should_write_compact_node_objects() -> None:
+    """It writes a node object per subject with the fixed context."""
+    s = URIRef("http://example.com/objecttypes/1")
+    b = BNode()
+    writer = JsonLdWriter()
+    writer.add((s, RDF.type, MODELLDCATNO.ObjectType))
+    writer.add((s, MODELLDCATNO.hasProperty, URIRef("http://example.com/p/1")))
+    writer.add((s, MODELLDCATNO.hasProperty, b))
+    writer.add((s, MODELLDCATNO.hasProperty, b))
+    writer.add((b, URIRef("http://example.com/value"), Literal("1")))
+    writer.add((b, URIRef(f"{XSD}minOccurs"), Literal(1)))
+
+    document = json.loads(writer.getvalue(encoding=None))
+
+    assert document == {
+        "@context": CONTEXT,
+        "@graph": [
+            {
+                "@id": "http://example.com/objecttypes/1",
+                "@type": "modelldcatno:ObjectType",
+                "modelldcatno:hasProperty": [
+                    {"@id": "http://example.com/p/1"},
+                    {"@id": f"_:{b}"},
+                ],
+            },
+            {
+                "@id": f"_:{b}",
+                "http://example.com/value": "1",
+                "xsd:minOccurs": {"@value": "1", "@type": "xsd:integer"},
+            },
+        ],
+    }
+
+
+def test_write_should_write_jsonld_to_fileobj() -> None:
+    """It writes the same json-ld to a file object as it returns."""
+    writer = JsonLdWriter()
+    _informationmodel()._to_graph(g=writer)
+    stream = BytesIO()
+
+    writer.write(stream)
+
+    assert stream.getvalue() == writer.getvalue()
+
+
+def test_getvalue_should_write_empty_graph_without_triples() -> None:
+    """It writes a document with an empty graph when no triples are added."""
+    assert json.loads(JsonLdWriter().getvalue()) == {
+        "@context": CONTEXT,
+        "@graph": [],
+    }
+
+
+def test_writer_should_not_be_a_graph() -> None:
+    """It cannot be read back from, as a graph of the triples added could."""
+    writer = JsonLdWriter()
+
+    assert not isinstance(writer, Graph)
+    with pytest.raises(TypeError):
+        _ = len(writer)  # type: ignore
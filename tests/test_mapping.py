@@ -0,0 +1,199 @@
+"""Test cases for the mapping module."""
+from concurrent.futures import ThreadPoolExecutor
+import pickle  # noqa: S403
+import sys
+from typing import List
+
+from concepttordf import Concept
+from datacatalogtordf import Agent
+import pytest
+from rdflib import BNode, DCTERMS, Graph, Literal, URIRef, XSD
+
+from modelldcatnotordf.mapping import (
+    _terms,
+    blank_node,
+    count_triples,
+    iri,
+    limit,
+    Limits,
+    literal,
+    mapping,
+    MappingLimitError,
+    MappingState,
+    relabel_blank_nodes,
+)
+from modelldcatnotordf.modelldcatno import (
+    Attribute,
+    DataType,
+    DCAT,
+    InformationModel,
+    MODELLDCATNO,
+    Module,
+    ObjectType,
+)
+from tests.testutils import assert_isomorphic
+
+
+def _map_concurrently(informationmodels: List[InformationModel]) -> List[bytes]:
+    # Switch between the threads as often as possible:
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            return list(
+                executor.map(
+                    lambda informationmodel: informationmodel.to_rdf(),
+                    informationmodels,
+                )
+            )
+    finally:
+        sys.setswitchinterval(interval)
+
+
+def _informationmodels(module: Module, datatype: DataType) -> List[InformationModel]:
+    publisher = Agent()
+    publisher.identifier = "http://example.com/publishers/1"
+    publisher.name = {"nb": "Utgiver 1"}
+    subject = Concept()
+    subject.identifier = "http://example.com/subjects/1"
+
+    informationmodels = []
+    for i in range(8):
+        informationmodel = InformationModel(f"http://example.com/informationmodels/{i}")
+        informationmodel.publisher = publisher
+        informationmodel.subject.append(subject)
+        informationmodel.modelelements.append(datatype)
+        for j in range(20):
+            element = ObjectType(f"http://example.com/objecttypes/{i}/{j}")
+            element.belongs_to_module = [module]
+            attribute = Attribute()
+            attribute.has_data_type = datatype
+            element.has_property.append(attribute)
+            informationmodel.modelelements.append(element)
+        informationmodels.append(informationmodel)
+
+    return informationmodels
+
+
+def test_to_rdf_should_map_shared_objects_concurrently() -> None:
+    """It returns the same graphs when mapping shared objects in many threads."""
+    module = Module("http://example.com/modules/1")
+    datatype = DataType("http://example.com/datatypes/1")
+    datatype.belongs_to_module = [module]
+    informationmodels = _informationmodels(module, datatype)
+    expected = [
+        Graph().parse(data=informationmodel.to_rdf(), format="turtle")
+        for informationmodel in informationmodels
+    ]
+
+    results = _map_concurrently(informationmodels * 10)
+
+    for i, rdf in enumerate(results):
+        assert_isomorphic(
+            Graph().parse(data=rdf, format="turtle"),
+            expected[i % len(informationmodels)],
+        )
+
+
+def test_to_rdf_should_skolemize_shared_object_once() -> None:
+    """It gives a shared object one identifier when mapped in many threads."""
+    module = Module("http://example.com/modules/1")
+    datatype = DataType()
+    informationmodels = _informationmodels(module, datatype)
+
+    results = _map_concurrently(informationmodels)
+
+    for rdf in results:
+        g = Graph().parse(data=rdf, format="turtle")
+        assert set(g.objects(predicate=MODELLDCATNO.hasDataType)) == {
+            URIRef(datatype.identifier)
+        }
+
+
+def test_to_graph_should_not_keep_state_of_mapping() -> None:
+    """It keeps no graph on the objects once the mapping has returned."""
+    objecttype = ObjectType("http://example.com/objecttypes/1")
+    attribute = Attribute("http://example.com/attributes/1")
+    objecttype.has_property.append(attribute)
+
+    g = objecttype._to_graph()
+
+    assert len(g) == 3
+    assert not hasattr(objecttype, "_g")
+    assert not hasattr(attribute, "_visited")
+    assert isinstance(ObjectType._g, MappingState)
+
+
+def test_relabel_blank_nodes_should_label_blank_nodes_by_path() -> None:
+    """It gives the blank nodes of the same triples the same labels, in any order."""
+    s = URIRef("http://example.com/informationmodels/1")
+    triples = [(s, DCAT.contactPoint, BNode()), (BNode(), DCAT.endpointURL, s)]
+
+    relabelled = relabel_blank_nodes(triples, s)
+
+    assert relabelled == [
+        (blank_node(s, "0"), DCAT.endpointURL, s),
+        (s, DCAT.contactPoint, blank_node(s, "1")),
+    ]
+    assert relabel_blank_nodes(reversed(triples), s) == relabelled
+    assert blank_node(s, "0") != blank_node(s, "1")
+
+
+def test_iri_and_literal_should_be_interned_in_mapping() -> None:
+    """It creates each IRI and literal once in a mapping, and keeps none after."""
+    objecttype = ObjectType("http://example.com/objecttypes/1")
+    attribute = Attribute("http://example.com/attributes/1")
+    objecttype.has_property.append(attribute)
+    objecttype.title = {"nb": "Tittel"}
+    attribute.title = {"nb": "Tittel"}
+
+    g = objecttype._to_graph()
+
+    (title1, title2) = g.objects(predicate=DCTERMS.title)
+    assert title1 is title2
+    assert iri("http://example.com/1") is not iri("http://example.com/1")
+    assert literal("Tittel") is not literal("Tittel")
+    assert _terms() == {}
+
+
+def test_literal_should_keep_values_of_different_types_apart() -> None:
+    """It creates different literals for equal values of different types."""
+
+    @mapping
+    def literals() -> List[Literal]:
+        return [literal(1), literal(True), literal(1), literal("1", lang="nb")]
+
+    one, true, again, text = literals()
+
+    assert one is again
+    assert true.datatype == XSD.boolean
+    assert text.language == "nb"
+
+
+def test_mapping_limit_error_should_pickle_with_path() -> None:
+    """It keeps the limit and path when passed from a worker process."""
+    error = MappingLimitError("depth", 1, ["http://example.com/1", "Composition"])
+
+    unpickled = pickle.loads(pickle.dumps(error))  # noqa: S301
+
+    assert (unpickled.limit, unpickled.value, unpickled.path) == (
+        "depth",
+        1,
+        ("http://example.com/1", "Composition"),
+    )
+    assert str(unpickled) == (
+        "The depth limit of 1 was exceeded at http://example.com/1 > Composition"
+    )
+
+
+def test_count_triples_should_raise_on_passed_deadline() -> None:
+    """It checks the deadline when counting triples, and keeps no limits after."""
+
+    @mapping
+    def count() -> None:
+        limit(Limits(deadline=0), "http://example.com/1")
+        count_triples(1)
+
+    with pytest.raises(MappingLimitError, match="deadline limit of 0"):
+        count()
+    count_triples(1)
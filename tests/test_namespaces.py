@@ -0,0 +1,86 @@
+"""Test cases for the namespaces module."""
+import subprocess  # noqa: S404
+import sys
+
+import pytest
+from pytest_mock import MockFixture
+import rdflib
+from rdflib import Graph, URIRef
+
+from modelldcatnotordf.modelldcatno import Attribute, ObjectType
+from modelldcatnotordf.namespaces import (
+    bind_prefixes,
+    MODELLDCATNO,
+    prefixed_name,
+    PREFIXES,
+    Vocabulary,
+)
+
+
+def test_bind_prefixes_should_bind_prefix_table() -> None:
+    """It binds every prefix in the table to its namespace."""
+    g = bind_prefixes(Graph())
+
+    namespaces = dict(g.namespaces())
+
+    for prefix, namespace in PREFIXES.items():
+        assert namespaces[prefix] == URIRef(namespace)
+
+
+def test_to_graph_should_bind_prefixes_in_new_graph() -> None:
+    """It binds the prefixes in the graph it creates."""
+    objecttype = ObjectType("http://example.com/objecttypes/1")
+
+    namespaces = dict(objecttype._to_graph().namespaces())
+
+    assert namespaces["modelldcatno"] == URIRef(PREFIXES["modelldcatno"])
+
+
+def test_to_graph_should_not_bind_prefixes_in_given_graph(
+    mocker: MockFixture,
+) -> None:
+    """It binds no prefixes when mapping into a given graph."""
+    objecttype = ObjectType("http://example.com/objecttypes/1")
+    objecttype.has_property.append(Attribute("http://example.com/attributes/1"))
+    g = Graph()
+    bind = mocker.spy(Graph, "bind")
+
+    objecttype._to_graph(g=g)
+
+    assert bind.call_count == 0
+
+
+def test_prefixed_name_should_split_iri_with_prefix() -> None:
+    """It returns the prefix and local name, or None for other iris."""
+    assert prefixed_name(str(MODELLDCATNO.ObjectType)) == ("modelldcatno", "ObjectType")
+    assert prefixed_name(f"{MODELLDCATNO}a.b") is None
+    assert prefixed_name("http://example.com/objecttypes/1") is None
+
+
+def test_vocabulary_should_create_each_term_once() -> None:
+    """It returns the same term every time, checked by the defined namespace."""
+    vocabulary = Vocabulary(rdflib.DCTERMS)
+
+    assert vocabulary.title is vocabulary.title
+    assert vocabulary.title == rdflib.DCTERMS.title
+    assert MODELLDCATNO.ObjectType is MODELLDCATNO.ObjectType
+    with pytest.raises(AttributeError):
+        vocabulary.__wrapped__
+    with pytest.raises(AttributeError):
+        vocabulary.undefinedTerm
+
+
+def test_modules_should_import_without_warnings() -> None:
+    """It gets no term undefined in a namespace when the modules are imported."""
+    # In a new interpreter, as rdflib warns once of each undefined term:
+    code = (
+        "import pkgutil, warnings\n"
+        "warnings.simplefilter('error')\n"
+        "import modelldcatnotordf\n"
+        "for module in pkgutil.walk_packages(\n"
+        "    modelldcatnotordf.__path__, 'modelldcatnotordf.'\n"
+        "):\n"
+        "    __import__(module.name)\n"
+    )
+
+    subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
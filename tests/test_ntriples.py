@@ -0,0 +1,320 @@
+"""Test cases for the ntriples module."""
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from typing import Any, Callable
+
+from concepttordf import Concept, Contact
+import pytest
+from rdflib import Graph, Literal, RDF, URIRef
+
+from modelldcatnotordf.bulk import codelist_from_columns
+from modelldcatnotordf.document import FoafDocument
+from modelldcatnotordf.licensedocument import LicenseDocument
+from modelldcatnotordf.modelldcatno import (
+    Attribute,
+    CodeList,
+    DataType,
+    InformationModel,
+    MODELLDCATNO,
+    Note,
+    ObjectType,
+    Role,
+    Standard,
+)
+from modelldcatnotordf.ntriples import CANONICAL, NTriplesWriter, SortedNTriplesWriter
+from tests.testutils import assert_isomorphic
+
+
+def test_add_should_write_triple() -> None:
+    """It writes the triple as an N-Triples line."""
+    stream = BytesIO()
+    writer = NTriplesWriter(stream)
+
+    writer.add((URIRef("http://example.com/1"), RDF.type, MODELLDCATNO.ObjectType))
+    writer.add(
+        (
+            URIRef("http://example.com/1"),
+            URIRef("http://purl.org/dc/terms/title"),
+            Literal('Tittel "1"\nlinje 2', lang="nb"),
+        )
+    )
+
+    assert stream.getvalue().decode() == (
+        "<http://example.com/1> "
+        "<http://www.w3.org/1999/02/22-rdf-syntax-ns#type> "
+        "<https://data.norge.no/vocabulary/modelldcatno#ObjectType> .\n"
+        "<http://example.com/1> "
+        "<http://purl.org/dc/terms/title> "
+        '"Tittel \\"1\\"\\nlinje 2"@nb .\n'
+    )
+
+
+def test_add_should_not_keep_triple() -> None:
+    """It does not keep the triples, nor pretend to be a graph of them."""
+    writer = NTriplesWriter(BytesIO())
+
+    writer.add((URIRef("http://example.com/1"), RDF.type, MODELLDCATNO.ObjectType))
+
+    assert not isinstance(writer, Graph)
+    with pytest.raises(TypeError):
+        _ = len(writer)  # type: ignore
+
+
+def test_sorted_writer_should_write_triples_once_sorted() -> None:
+    """It writes each triple once, as sorted N-Triples lines."""
+    writer = SortedNTriplesWriter()
+    for i in [2, 1, 2]:
+        writer.add(
+            (URIRef(f"http://example.com/{i}"), RDF.type, MODELLDCATNO.ObjectType)
+        )
+
+    stream = BytesIO()
+    writer.write(stream)
+
+    assert writer.getvalue(encoding=None) == (
+        "<http://example.com/1> "
+        "<http://www.w3.org/1999/02/22-rdf-syntax-ns#type> "
+        "<https://data.norge.no/vocabulary/modelldcatno#ObjectType> .\n"
+        "<http://example.com/2> "
+        "<http://www.w3.org/1999/02/22-rdf-syntax-ns#type> "
+        "<https://data.norge.no/vocabulary/modelldcatno#ObjectType> .\n"
+    )
+    assert stream.getvalue() == writer.getvalue()
+
+
+PREFIXES = """
+    @prefix dct: <http://purl.org/dc/terms/> .
+    @prefix foaf: <http://xmlns.com/foaf/0.1/> .
+    @prefix modelldcatno: <https://data.norge.no/vocabulary/modelldcatno#> .
+    @prefix skos: <http://www.w3.org/2004/02/skos/core#> .
+    @prefix xkos: <http://rdf-vocabulary.ddialliance.org/xkos#> .
+    """
+
+
+def _objecttype() -> ObjectType:
+    objecttype = ObjectType("http://example.com/modelelements/1")
+    objecttype.title = {"nb": "Tittel 1", "en": "Title 1"}
+    return objecttype
+
+
+def _objecttype_with_shared_datatype() -> ObjectType:
+    objecttype = ObjectType("http://example.com/modelelements/1")
+    datatype = DataType("http://example.com/datatypes/1")
+    datatype.title = {"nb": "Tittel 1"}
+    for i in range(2):
+        attribute = Attribute(f"http://example.com/attributes/{i}")
+        attribute.has_data_type = datatype
+        objecttype.has_property.append(attribute)
+    return objecttype
+
+
+def _note() -> Note:
+    note = Note("http://example.com/notes/1")
+    note.property_note = {"nb": "Egenskapsmerknad", "en": "Property note"}
+    return note
+
+
+def _role() -> Role:
+    role = Role("http://example.com/properties/1")
+    role.title = {"nb": "Tittel 1", "en": "Title 1"}
+    return role
+
+
+def _standard() -> Standard:
+    standard = Standard("http://example.com/standards/1")
+    standard.title = {"nb": "Tittel 1", "en": "Title 1"}
+    return standard
+
+
+def _document() -> FoafDocument:
+    document = FoafDocument("http://example.com/documents/1")
+    document.title = {"nb": "Tittel 1", "en": "Title 1"}
+    return document
+
+
+def _licensedocument() -> LicenseDocument:
+    licensedocument = LicenseDocument("http://example.com/licensedocuments/1")
+    licensedocument.type.append("http://example.com/licensetypes/1")
+    return licensedocument
+
+
+def _codelist() -> CodeList:
+    return codelist_from_columns(
+        "http://example.com/codelists/1", {"notation": ["NO", "SE"]}
+    )
+
+
+@pytest.mark.parametrize(
+    "modelobject, src",
+    [
+        (
+            _objecttype,
+            """
+            <http://example.com/modelelements/1> a modelldcatno:ObjectType ;
+                dct:title "Tittel 1"@nb, "Title 1"@en .
+            """,
+        ),
+        (
+            _objecttype_with_shared_datatype,
+            """
+            <http://example.com/modelelements/1> a modelldcatno:ObjectType ;
+                modelldcatno:hasProperty <http://example.com/attributes/0>,
+                    <http://example.com/attributes/1> .
+            <http://example.com/attributes/0> a modelldcatno:Attribute ;
+                modelldcatno:hasDataType <http://example.com/datatypes/1> .
+            <http://example.com/attributes/1> a modelldcatno:Attribute ;
+                modelldcatno:hasDataType <http://example.com/datatypes/1> .
+            <http://example.com/datatypes/1> a modelldcatno:DataType ;
+                dct:title "Tittel 1"@nb .
+            """,
+        ),
+        (
+            _note,
+            """
+            <http://example.com/notes/1> a modelldcatno:Note ;
+                modelldcatno:propertyNote "Egenskapsmerknad"@nb,
+                    "Property note"@en .
+            """,
+        ),
+        (
+            _role,
+            """
+            <http://example.com/properties/1> a modelldcatno:Role ;
+                dct:title "Tittel 1"@nb, "Title 1"@en .
+            """,
+        ),
+        (
+            _standard,
+            """
+            <http://example.com/standards/1> a dct:Standard ;
+                dct:title "Tittel 1"@nb, "Title 1"@en .
+            """,
+        ),
+        (
+            _document,
+            """
+            <http://example.com/documents/1> a foaf:Document ;
+                dct:title "Tittel 1"@nb, "Title 1"@en .
+            """,
+        ),
+        (
+            _licensedocument,
+            """
+            <http://example.com/licensedocuments/1> a dct:LicenseDocument ;
+                dct:type <http://example.com/licensetypes/1> .
+            """,
+        ),
+        (
+            _codelist,
+            """
+            <http://example.com/codelists/1> a modelldcatno:CodeList .
+            _:NO a modelldcatno:CodeElement ;
+                skos:notation "NO" ;
+                skos:inScheme <http://example.com/codelists/1> ;
+                xkos:next _:SE .
+            _:SE a modelldcatno:CodeElement ;
+                skos:notation "SE" ;
+                skos:inScheme <http://example.com/codelists/1> ;
+                xkos:previous _:NO .
+            """,
+        ),
+    ],
+)
+def test_to_ntriples_stream_should_write_each_triple_once(
+    modelobject: Callable[[], Any], src: str
+) -> None:
+    """It writes the triples of the object, each on one line."""
+    stream = BytesIO()
+    modelobject().to_ntriples_stream(stream)
+    lines = stream.getvalue().decode().splitlines()
+
+    g1 = Graph().parse(data=stream.getvalue(), format="nt")
+    g2 = Graph().parse(data=PREFIXES + src, format="turtle")
+
+    assert len(lines) == len(set(lines)) == len(g2)
+    assert_isomorphic(g1, g2)
+
+
+def test_to_rdf_canonical_should_return_same_ntriples_for_same_model() -> None:
+    """It returns the same N-Triples for models built the same way."""
+
+    def informationmodel() -> InformationModel:
+        informationmodel = InformationModel("http://example.com/informationmodels/1")
+        contact = Contact()
+        contact.email = "post@example.com"
+        informationmodel.contactpoints.append(contact)
+        objecttype = ObjectType()
+        objecttype.has_property.append(Attribute())
+        informationmodel.modelelements.append(objecttype)
+        return informationmodel
+
+    informationmodel1 = informationmodel()
+    informationmodel2 = informationmodel()
+    rdf = informationmodel1.to_rdf(format=CANONICAL, deterministic=True)
+
+    assert informationmodel2.to_rdf(format=CANONICAL, deterministic=True) == rdf
+    assert rdf.decode().splitlines() == sorted(rdf.decode().splitlines())
+    assert_isomorphic(
+        Graph().parse(data=rdf, format="nt"),
+        Graph().parse(
+            data=informationmodel1.to_rdf(deterministic=True), format="turtle"
+        ),
+    )
+
+
+def test_content_hash_should_change_with_content() -> None:
+    """It returns the same hash for the same content only."""
+    informationmodel1 = InformationModel("http://example.com/informationmodels/1")
+    informationmodel1.modelelements.append(ObjectType())
+    informationmodel2 = InformationModel("http://example.com/informationmodels/1")
+    informationmodel2.modelelements.append(ObjectType())
+    objecttype = ObjectType("http://example.com/objecttypes/1")
+    standard = Standard("http://example.com/standards/1")
+
+    content_hash = informationmodel1.content_hash()
+
+    assert informationmodel2.content_hash() == content_hash
+    assert len(content_hash) == 64
+    informationmodel2.title = {"nb": "Modell"}
+    assert informationmodel2.content_hash() != content_hash
+    assert objecttype.content_hash() == objecttype.content_hash()
+    assert standard.content_hash() != objecttype.content_hash()
+
+
+def test_content_hash_should_be_stable_with_concept_term() -> None:
+    """It returns the same hash for models with a concept with a term."""
+
+    def informationmodel() -> InformationModel:
+        informationmodel = InformationModel("http://example.com/informationmodels/1")
+        subject = Concept()
+        subject.identifier = "http://example.com/subjects/1"
+        subject.term = {"name": {"nb": "begrep", "en": "concept"}}
+        informationmodel.subject.append(subject)
+        objecttype = ObjectType()
+        objecttype.subject = subject
+        informationmodel.modelelements.append(objecttype)
+        return informationmodel
+
+    content_hash = informationmodel().content_hash()
+
+    assert informationmodel().content_hash() == content_hash
+
+
+def test_content_hash_should_be_the_same_in_threads() -> None:
+    """It returns the same hash in threads hashing the same model at once."""
+
+    def informationmodel() -> InformationModel:
+        informationmodel = InformationModel("http://example.com/informationmodels/1")
+        objecttype = ObjectType()
+        objecttype.has_property.append(Attribute())
+        informationmodel.modelelements.append(objecttype)
+        return informationmodel
+
+    shared = informationmodel()
+    content_hash = informationmodel().content_hash()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        hashes = list(executor.map(lambda _i: shared.content_hash(), range(200)))
+
+    assert hashes == [content_hash] * 200
+    assert shared.content_hash() == content_hash
@@ -450,6 +450,40 @@ def test_to_graph_should_return_forms_symmetry_with() -> None:
     assert_isomorphic(g1, g2)
 
 
+def test_to_graph_should_return_mutual_forms_symmetry_with() -> None:
+    """It returns an identifier graph isomorphic to spec."""
+    modelproperty1 = Role()
+    modelproperty1.identifier = "http://example.com/properties/1"
+
+    modelproperty2 = Role()
+    modelproperty2.identifier = "http://example.com/properties/2"
+
+    modelproperty1.forms_symmetry_with = modelproperty2
+    modelproperty2.forms_symmetry_with = modelproperty1
+
+    src = """
+        @prefix dct: <http://purl.org/dc/terms/> .
+        @prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .
+        @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+        @prefix dcat: <http://www.w3.org/ns/dcat#> .
+        @prefix modelldcatno: <https://data.norge.no/vocabulary/modelldcatno#> .
+
+
+        <http://example.com/properties/1>
+                a modelldcatno:Role;
+                    modelldcatno:formsSymmetryWith <http://example.com/properties/2> .
+
+        <http://example.com/properties/2>
+                a modelldcatno:Role;
+                    modelldcatno:formsSymmetryWith <http://example.com/properties/1> .
+
+        """
+    g1 = Graph().parse(data=modelproperty1.to_rdf(), format="turtle")
+    g2 = Graph().parse(data=src, format="turtle")
+
+    assert_isomorphic(g1, g2)
+
+
 def test_to_graph_should_return_forms_symmetry_with_skolemization(
     mocker: MockFixture,
 ) -> None:
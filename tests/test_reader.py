@@ -0,0 +1,241 @@
+"""Test cases for the reader module."""
+from concepttordf import Contact
+from datacatalogtordf import Location, PeriodOfTime
+import pytest
+from rdflib import Graph
+
+from modelldcatnotordf.document import FoafDocument
+from modelldcatnotordf.licensedocument import LicenseDocument
+from modelldcatnotordf.modelldcatno import (
+    Attribute,
+    CodeElement,
+    CodeList,
+    DataType,
+    InformationModel,
+    Module,
+    ObjectType,
+    Or,
+    Role,
+    SimpleType,
+    Standard,
+)
+from modelldcatnotordf.reader import from_graph, from_rdf
+from tests.testutils import assert_isomorphic
+
+
+def _informationmodel() -> InformationModel:
+    informationmodel = InformationModel("http://example.com/informationmodels/1")
+    informationmodel.title = {"nb": "Modell 1", "en": "Model 1"}
+    informationmodel.informationmodelidentifier = "modell-1"
+    informationmodel.modified = "2020-10-10"
+    informationmodel.subject.append("http://example.com/concepts/1")
+
+    standard = Standard("http://example.com/standards/1")
+    standard.title = {"nb": "Standard 1"}
+    informationmodel.conforms_to = standard
+    informationmodel.locations.append("http://example.com/locations/1")
+
+    licensedocument = LicenseDocument("http://example.com/licenses/1")
+    licensedocument.type.append("http://example.com/licensetypes/1")
+    informationmodel.licensedocument = licensedocument
+
+    document = FoafDocument("http://example.com/documents/1")
+    document.title = {"nb": "Dokument 1"}
+    document.language = "http://example.com/languages/nb"
+    document.format = "http://example.com/formats/pdf"
+    document.rdfs_see_also = "http://example.com/documents/2"
+    informationmodel.has_format.append(document)
+
+    module = Module("http://example.com/modules/1")
+    informationmodel.modelelements.append(module)
+
+    datatype = DataType("http://example.com/datatypes/1")
+    datatype.belongs_to_module = [module]
+
+    simpletype = SimpleType("http://example.com/simpletypes/1")
+    simpletype.max_length = 10
+    simpletype.pattern = "[a-z]*"
+
+    codelist = CodeList("http://example.com/codelists/1")
+    codelist.title = {"nb": "Kodeliste 1"}
+
+    objecttype = ObjectType("http://example.com/objecttypes/1")
+    objecttype.title = {"nb": "Objekttype 1"}
+    objecttype.dct_identifier = "objekttype-1"
+    informationmodel.modelelements.append(objecttype)
+
+    attribute1 = Attribute("http://example.com/attributes/1")
+    attribute1.min_occurs = 0
+    attribute1.max_occurs = "*"
+    attribute1.has_data_type = datatype
+    attribute1.has_value_from = codelist
+    objecttype.has_property.append(attribute1)
+
+    attribute2 = Attribute("http://example.com/attributes/2")
+    attribute2.min_occurs = 1
+    attribute2.navigable = True
+    attribute2.has_data_type = datatype
+    attribute2.has_simple_type = simpletype
+    objecttype.has_property.append(attribute2)
+
+    role = Role("http://example.com/roles/1")
+    role.has_object_type = objecttype
+    role.forms_symmetry_with = role
+    objecttype.has_property.append(role)
+
+    rule = Or("http://example.com/rules/1")
+    rule.constraint_expression = {"nb": "Enten eller"}
+    rule.constrains = [attribute1, attribute2]
+    rule.annotates = [objecttype]
+    informationmodel.modelelements.append(rule)
+
+    return informationmodel
+
+
+def _codeelements() -> Graph:
+    codelist = CodeList("http://example.com/codelists/1")
+
+    codeelement1 = CodeElement("http://example.com/codeelements/1")
+    codeelement1.preflabel = {"nb": "Kode 1"}
+    codeelement1.example = ["eksempel"]
+    codeelement1.in_scheme = [codelist]
+
+    codeelement2 = CodeElement("http://example.com/codeelements/2")
+    codeelement2.notation = "2"
+    codeelement2.in_scheme = [codelist]
+
+    codeelement1.next_element = codeelement2
+    codeelement2.previous_element = codeelement1
+
+    return codeelement1._to_graph()
+
+
+def test_from_graph_should_return_objects_isomorphic_to_graph() -> None:
+    """It returns objects that map to a graph isomorphic to the graph."""
+    g1 = _informationmodel()._to_graph()
+
+    objects = from_graph(g1)
+    g2 = objects["http://example.com/informationmodels/1"]._to_graph()
+
+    assert_isomorphic(g1, g2)
+
+
+def test_from_graph_should_return_code_elements_isomorphic_to_graph() -> None:
+    """It returns code elements that map to a graph isomorphic to the graph."""
+    g1 = _codeelements()
+
+    objects = from_graph(g1)
+    g2 = objects["http://example.com/codeelements/1"]._to_graph()
+
+    assert_isomorphic(g1, g2)
+
+
+def test_from_graph_should_resolve_references_into_shared_objects() -> None:
+    """It returns one object per resource, however often it is referred to."""
+    objects = from_graph(_informationmodel()._to_graph())
+
+    attribute1 = objects["http://example.com/attributes/1"]
+    attribute2 = objects["http://example.com/attributes/2"]
+    datatype = objects["http://example.com/datatypes/1"]
+    role = objects["http://example.com/roles/1"]
+
+    assert isinstance(datatype, DataType)
+    assert isinstance(attribute1, Attribute)
+    assert isinstance(attribute2, Attribute)
+    assert isinstance(role, Role)
+    assert attribute1.has_data_type is datatype
+    assert attribute2.has_data_type is datatype
+    assert role.forms_symmetry_with is role
+    assert role.has_object_type is objects["http://example.com/objecttypes/1"]
+
+
+def test_from_graph_should_keep_references_not_read_as_iris() -> None:
+    """It returns references to resources of types not read as IRIs."""
+    objects = from_graph(_informationmodel()._to_graph())
+
+    informationmodel = objects["http://example.com/informationmodels/1"]
+
+    assert isinstance(informationmodel, InformationModel)
+    assert informationmodel.subject == ["http://example.com/concepts/1"]
+    assert "http://example.com/concepts/1" not in objects
+
+
+def test_from_graph_should_read_documents() -> None:
+    """It returns license documents and documents as objects."""
+    objects = from_graph(_informationmodel()._to_graph())
+
+    informationmodel = objects["http://example.com/informationmodels/1"]
+    document = objects["http://example.com/documents/1"]
+
+    assert isinstance(informationmodel, InformationModel)
+    assert isinstance(document, FoafDocument)
+    assert informationmodel.has_format == [document]
+    assert informationmodel.licensedocument is objects["http://example.com/licenses/1"]
+    assert document.format == "http://example.com/formats/pdf"
+
+
+def test_from_graph_should_warn_on_blank_nodes_not_read() -> None:
+    """It leaves out blank nodes of types it does not read, with a warning."""
+    informationmodel = InformationModel("http://example.com/informationmodels/1")
+    contact = Contact()
+    contact.email = "post@example.com"
+    informationmodel.contactpoints.append(contact)
+    location = Location()
+    location.centroid = "POINT(4.88412 52.37509)"
+    informationmodel.locations.append(location)
+    temporal = PeriodOfTime()
+    temporal.start_date = "2020-03-01"
+    informationmodel.temporal.append(temporal)
+
+    with pytest.warns(UserWarning) as record:
+        objects = from_graph(informationmodel._to_graph())
+
+    read = objects["http://example.com/informationmodels/1"]
+
+    assert sorted(str(warning.message).split()[1] for warning in record) == [
+        "contactpoints",
+        "locations",
+        "temporal",
+    ]
+    assert isinstance(read, InformationModel)
+    assert read.contactpoints == []
+    assert read.locations == []
+    assert read.temporal == []
+
+
+def test_from_graph_should_map_blank_nodes_without_identifier() -> None:
+    """It returns typed blank nodes as objects without identifier."""
+    src = """
+        @prefix dct: <http://purl.org/dc/terms/> .
+        @prefix dcat: <http://www.w3.org/ns/dcat#> .
+        @prefix modelldcatno: <https://data.norge.no/vocabulary/modelldcatno#> .
+        @prefix xkos: <http://rdf-vocabulary.ddialliance.org/xkos#> .
+
+        <http://example.com/codeelements/1> a modelldcatno:CodeElement ;
+            xkos:next [ a modelldcatno:CodeElement ] ;
+            xkos:previous [ dct:title "Ikke en kode"@nb ] ;
+            dct:subject "Ikke et begrep"@nb .
+        """
+
+    with pytest.warns(UserWarning, match="previous_element"):
+        objects = from_rdf(src)
+
+    codeelement = objects["http://example.com/codeelements/1"]
+
+    assert isinstance(codeelement, CodeElement)
+    assert len(objects) == 1
+    assert isinstance(codeelement.next_element, CodeElement)
+    assert getattr(codeelement.next_element, "identifier", None) is None
+    assert getattr(codeelement, "previous_element", None) is None
+    assert getattr(codeelement, "subject", None) is None
+
+
+def test_from_rdf_should_parse_format() -> None:
+    """It parses the data according to format."""
+    data = _informationmodel().to_rdf(format="xml")
+
+    objects = from_rdf(data, format="xml")
+
+    assert isinstance(
+        objects["http://example.com/informationmodels/1"], InformationModel
+    )
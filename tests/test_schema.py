@@ -0,0 +1,99 @@
+"""Test cases for the schema module."""
+from typing import Any, List, Type
+
+import pytest
+from rdflib import XSD
+
+from modelldcatnotordf.modelldcatno import (
+    Abstraction,
+    Association,
+    Attribute,
+    Choice,
+    CodeElement,
+    CodeList,
+    Collection,
+    Composition,
+    ConstraintRule,
+    DataType,
+    InformationModel,
+    Module,
+    Note,
+    ObjectType,
+    Or,
+    Realization,
+    Role,
+    RootObjectType,
+    SimpleType,
+    Specialization,
+    Xor,
+)
+from modelldcatnotordf.schema import CARDINALITY, Field, fields, LANGUAGE, LITERAL
+
+CLASSES: List[Type[Any]] = [
+    Abstraction,
+    Association,
+    Attribute,
+    Choice,
+    CodeElement,
+    CodeList,
+    Collection,
+    Composition,
+    ConstraintRule,
+    DataType,
+    InformationModel,
+    Module,
+    Note,
+    ObjectType,
+    Or,
+    Realization,
+    Role,
+    RootObjectType,
+    SimpleType,
+    Specialization,
+    Xor,
+]
+
+
+def _value(field: Field) -> Any:  # noqa: ANN401
+    if field.kind == LANGUAGE:
+        return {"nb": "Tekst"}
+    if field.kind == CARDINALITY:
+        return "*"
+    if field.datatype == XSD.date:
+        return "2020-01-01"
+    value = "http://example.com/1" if field.kind != LITERAL else "1"
+    return [value] if field.many else value
+
+
+@pytest.mark.parametrize("cls", CLASSES)
+def test_fields_should_map_attributes_of_class(cls: Type[Any]) -> None:
+    """It maps each attribute of the schema, set by its property, to its predicate."""
+    modelobject = cls("http://example.com/modelobjects/1")
+    for field in fields(cls):
+        setattr(modelobject, field.attribute.lstrip("_"), _value(field))
+
+    g = modelobject._to_graph()
+
+    assert fields(cls)
+    for field in fields(cls):
+        value = getattr(modelobject, field.attribute.lstrip("_"))
+        assert value == _value(field)
+        assert (None, field.predicate, None) in g
+
+
+def test_fields_should_put_inherited_fields_first() -> None:
+    """It returns the fields of the classes inherited from before the own fields."""
+    names = [field.attribute for field in fields(SimpleType)]
+
+    assert names.index("_title") < names.index("_min_length")
+    assert fields(Or) == fields(ConstraintRule)
+
+
+@pytest.mark.parametrize("cls", [cls for cls in CLASSES if cls is not InformationModel])
+def test_schema_mapping_should_keep_objects_without_dict(cls: Type[Any]) -> None:
+    """It keeps the attributes of the objects in slots only."""
+    modelobject = cls("http://example.com/modelobjects/1")
+
+    modelobject._to_graph()
+
+    assert not hasattr(modelobject, "__dict__")
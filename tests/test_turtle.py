@@ -0,0 +1,113 @@
+"""Test cases for the turtle module."""
+from io import BytesIO
+
+from concepttordf import Contact
+from datacatalogtordf import PeriodOfTime
+import pytest
+from rdflib import Graph, Literal, OWL, RDF, URIRef
+
+from modelldcatnotordf.modelldcatno import (
+    Attribute,
+    InformationModel,
+    MODELLDCATNO,
+    ObjectType,
+)
+from modelldcatnotordf.turtle import TurtleWriter
+from tests.testutils import assert_isomorphic
+
+
+def _informationmodel() -> InformationModel:
+    informationmodel = InformationModel("http://example.com/informationmodels/1")
+    informationmodel.title = {"nb": 'Modell "1"', "en": "Model\n1 \\ 2"}
+    informationmodel.version_info = "1.0"
+
+    contact = Contact()
+    contact.email = "post@example.com"
+    informationmodel.contactpoints.append(contact)
+
+    temporal = PeriodOfTime()
+    temporal.start_date = "2020-01-01"
+    informationmodel.temporal.append(temporal)
+
+    objecttype = ObjectType("http://example.com/objecttypes/1.0")
+    attribute = Attribute("http://example.com/attributes/1")
+    attribute.min_occurs = 1
+    objecttype.has_property.append(attribute)
+    informationmodel.modelelements.append(objecttype)
+    informationmodel.modelelements.append(ObjectType(f"{MODELLDCATNO}a.b"))
+
+    return informationmodel
+
+
+def test_to_rdf_should_be_isomorphic_to_rdflib_serialization() -> None:
+    """It writes a graph isomorphic to the graph serialized by rdflib."""
+    informationmodel = _informationmodel()
+
+    expected = informationmodel._to_graph().serialize(format="turtle")
+    rdf = informationmodel.to_rdf()
+
+    assert_isomorphic(
+        Graph().parse(data=rdf, format="turtle"),
+        Graph().parse(data=expected, format="turtle"),
+    )
+
+
+def test_to_rdf_should_be_isomorphic_with_workers() -> None:
+    """It writes the triples of model elements mapped in other processes."""
+    informationmodel = _informationmodel()
+
+    expected = informationmodel._to_graph().serialize(format="turtle")
+    rdf = informationmodel.to_rdf(workers=2)
+
+    assert_isomorphic(
+        Graph().parse(data=rdf, format="turtle"),
+        Graph().parse(data=expected, format="turtle"),
+    )
+
+
+def test_getvalue_should_group_triples_by_subject() -> None:
+    """It writes each subject once, with its type first and no duplicates."""
+    s = URIRef("http://example.com/objecttypes/1")
+    writer = TurtleWriter()
+    writer.add((s, MODELLDCATNO.hasProperty, URIRef("http://example.com/p/1")))
+    writer.add((s, RDF.type, MODELLDCATNO.ObjectType))
+    writer.add((s, MODELLDCATNO.hasProperty, URIRef("http://example.com/p/2")))
+    writer.add((s, MODELLDCATNO.hasProperty, URIRef("http://example.com/p/1")))
+    writer.add((s, OWL.versionInfo, Literal(1)))
+
+    assert writer.getvalue(encoding=None) == (
+        "@prefix modelldcatno: <https://data.norge.no/vocabulary/modelldcatno#> .\n"
+        "@prefix owl: <http://www.w3.org/2002/07/owl#> .\n"
+        "@prefix xsd: <http://www.w3.org/2001/XMLSchema#> .\n"
+        "\n"
+        "<http://example.com/objecttypes/1> a modelldcatno:ObjectType ;\n"
+        "    modelldcatno:hasProperty <http://example.com/p/1>,\n"
+        "        <http://example.com/p/2> ;\n"
+        '    owl:versionInfo "1"^^xsd:integer .\n'
+        "\n"
+    )
+
+
+def test_write_should_write_turtle_to_fileobj() -> None:
+    """It writes the same turtle to a file object as it returns."""
+    writer = TurtleWriter()
+    _informationmodel()._to_graph(g=writer)
+    stream = BytesIO()
+
+    writer.write(stream)
+
+    assert stream.getvalue() == writer.getvalue()
+
+
+def test_getvalue_should_write_nothing_without_triples() -> None:
+    """It writes an empty document when no triples are added."""
+    assert TurtleWriter().getvalue() == b""
+
+
+def test_writer_should_not_be_a_graph() -> None:
+    """It cannot be read back from, as a graph of the triples added could."""
+    writer = TurtleWriter()
+
+    assert not isinstance(writer, Graph)
+    with pytest.raises(TypeError):
+        _ = len(writer)  # type: ignore
@@ -0,0 +1,47 @@
+"""Test cases for the uri module."""
+from concurrent.futures import ThreadPoolExecutor
+
+from datacatalogtordf import URI
+from datacatalogtordf.exceptions import InvalidURIError
+import pytest
+
+from modelldcatnotordf.modelldcatno import ObjectType
+from modelldcatnotordf.uri import trusted_input, uri
+
+
+def test_uri_should_validate_value_once() -> None:
+    """It returns the same URI when the value is set again."""
+    value = "http://example.com/objecttypes/1"
+
+    assert isinstance(uri(value), URI)
+    assert uri(value) is uri(value)
+
+
+def test_uri_should_raise_for_invalid_value() -> None:
+    """It raises an InvalidURIError for an invalid value, every time."""
+    for _ in range(2):
+        with pytest.raises(InvalidURIError):
+            ObjectType("http://example.com/object types/1")
+
+
+def test_trusted_input_should_not_validate() -> None:
+    """It sets the values in the block without validating them."""
+    with trusted_input():
+        with trusted_input():
+            objecttype = ObjectType("http://example.com/object types/1")
+        value = uri("http://example.com/object types/2")
+
+    assert isinstance(objecttype.identifier, URI)
+    assert value == "http://example.com/object types/2"
+    with pytest.raises(InvalidURIError):
+        uri("http://example.com/object types/3")
+
+
+def test_trusted_input_should_not_apply_to_other_threads() -> None:
+    """It validates the values set in other threads."""
+    with trusted_input():
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(uri, "http://example.com/object types/1")
+
+    with pytest.raises(InvalidURIError):
+        future.result()
@@ -33,4 +33,4 @@ def _dump_diff(g1: Graph, g2: Graph) -> None:
 def _dump_turtle(g: Graph) -> None:
     for _l in g.serialize(format="turtle").splitlines():
         if _l:
-            print(_l.decode())
+            print(_l)